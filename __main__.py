@@ -0,0 +1,17 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- HEADLESS ENTRY POINT: python -m astrotracker ... (or python <project folder> ...) ---
+
+import os
+import sys
+
+# Project modules are imported as top-level modules (as in main.py)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import myastrocli
+
+sys.exit(myastrocli.main())
@@ -5,16 +5,11 @@
 # See the LICENSE.txt file in the project root for full license information.
 
 from PyQt6.QtWidgets import (
-    QVBoxLayout, QLabel, QLineEdit, QPushButton, QDialog, QGridLayout
+    QVBoxLayout, QLabel, QLineEdit, QPushButton, QDialog, QGridLayout, QCompleter
 )
-import importlib
-import myastrolib as myal
-import myastroplot as myap
+from PyQt6.QtCore import Qt, QStringListModel
 from callbacks import add_locations_callbacks as alcb
 
-importlib.reload(myal)
-importlib.reload(myap)
-importlib.reload(alcb)
 
 # --- ADD LOCATIONS TO DB ---
 class AddLocationDialog(QDialog):
@@ -56,6 +51,15 @@ class AddLocationDialog(QDialog):
         self.location_name_field = QLineEdit()
         grid.addWidget(self.location_name_field, 1, 1, 1, 4)
 
+        # Suggestions while typing (offline gazetteer, already ranked: shown unfiltered)
+        self.suggestions = QStringListModel()
+        self.completer = QCompleter(self.suggestions, self)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.completer.activated.connect(lambda text: alcb.select_suggestion(self, text))
+        self.location_name_field.setCompleter(self.completer)
+        self.location_name_field.textEdited.connect(lambda text: alcb.suggest_locations(self, text))
+
         self.check_btn = QPushButton('Check')
         self.check_btn.clicked.connect(lambda: alcb.check_location(self))
         grid.addWidget(self.check_btn, 1, 5, 1, 1)
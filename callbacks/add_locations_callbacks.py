@@ -8,10 +8,25 @@
 
 import sqlite3
 from PyQt6.QtWidgets import QMessageBox
-import importlib
 import myastrolib as myal
+import myastrodb as myadb
+import myastrogeo as myageo
 
-importlib.reload(myal)
+SUGGEST_MIN_CHARS = 2
+
+
+# --- SUGGEST LOCATIONS WHILE TYPING (OFFLINE GAZETTEER)
+def suggest_locations(self, text):
+    suggestions = myageo.suggest_locations(text) if len(text.strip()) >= SUGGEST_MIN_CHARS else []
+    self.suggestions.setStringList(suggestions)
+    if suggestions:
+        self.completer.complete()
+
+
+# --- SELECTED SUGGESTION: CHECK IT AT ONCE
+def select_suggestion(self, text):
+    self.location_name_field.setText(text)
+    check_location(self)
 
 
 # --- CHECK IF A LOCATION EXISTS
@@ -19,7 +34,7 @@ def check_location(self):
 
     # Look for Location
     self.lat, self.lon, self.time_zone, self.civil_utc, self.local_utc, res_loc = (
-        myal.get_location_coord(self.location_name_field.text()))
+        myal.get_location_coord(self.location_name_field.text(), online=self.main.isonline is not False))
     self.locationname = self.location_name_field.text()
     self.check_result_field.setText(res_loc)
     if self.local_utc != []:
@@ -42,13 +57,12 @@ def check_location(self):
 def update_db(self):
 
     # Check if Location already exists
-    if self.locationname.lower() in [x.lower() for x in self.main.df_loc.location.tolist()]:
+    if self.main.cat_loc.find(self.locationname) is not None:
         QMessageBox.warning(self, 'Not updated', 'Location already present. DB not updated')
         return
 
-    # Update LOCATION Table
-    self.main.df_loc.loc[len(self.main.df_loc)] = {
-        'id': max(self.main.df_loc.id) + 1,
+    # Update DB (new row only)
+    location = {
         'location': self.locationname,
         'latitude': self.lat,
         'longitude': self.lon,
@@ -56,18 +70,16 @@ def update_db(self):
         'civil_utc': self.civil_utc,
         'local_utc': self.local_utc
     }
-    self.main.df_loc.sort_values(by='location', inplace=True)
-
-    # Update GUI
-    self.main.select_location.clear()
-    self.main.select_location.addItems(self.main.df_loc.location.tolist())
-    if self.main.select_location.count() > 0:
-        self.main.select_location.setCurrentIndex(0)
-
-    # Update DB
-    with sqlite3.connect(self.main.db_path) as conn:
-        self.main.df_loc.to_sql('LOCATIONS', conn, if_exists='replace', index=False)
-        QMessageBox.information(self, 'Success', 'DB updated')
+    try:
+        location_id, = myadb.insert_rows(self.main.db_path, 'LOCATIONS', [location])
+    except sqlite3.IntegrityError:
+        QMessageBox.warning(self, 'Not updated', 'Location already present. DB not updated')
+        return
+
+    # Update LOCATION registry (combos updated by the registry)
+    self.main.cat_loc.add([{'id': location_id, **location}])
+
+    QMessageBox.information(self, 'Success', 'DB updated')
 
 
 
@@ -7,15 +7,8 @@
 from PyQt6.QtWidgets import (
     QVBoxLayout, QLabel, QLineEdit, QPushButton, QDialog, QGridLayout
 )
-import importlib
-import myastrolib as myal
-import myastroplot as myap
 from callbacks import add_stars_callbacks as ascb
 
-importlib.reload(myal)
-importlib.reload(myap)
-importlib.reload(ascb)
-
 
 # --- ADD STARS TO DB ---
 class AddStarDialog(QDialog):
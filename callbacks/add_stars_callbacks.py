@@ -8,10 +8,8 @@
 
 import sqlite3
 from PyQt6.QtWidgets import QMessageBox
-import importlib
 import myastrolib as myal
-
-importlib.reload(myal)
+import myastrodb as myadb
 
 
 # --- CHECK IF A STAR EXISTS
@@ -19,7 +17,7 @@ def check_star(self):
 
     # Look for Star
     self.vizier_name, self.ra0, self.dec0, self.pm_ra, self.pm_dec = (
-        myal.get_star_info(self.star_name_field.text()))
+        myal.get_star_info(self.star_name_field.text(), online=self.main.isonline is not False))
     self.starname = self.star_name_field.text().title() # Make all letters uppercase
     if not self.vizier_name:
         self.check_result_field.setText('NOT FOUND')
@@ -44,13 +42,12 @@ def check_star(self):
 def update_db(self):
 
     # Check if Star already exists
-    if self.starname in self.main.df_stars.star.tolist():
+    if self.starname in self.main.cat_stars:
         QMessageBox.warning(self, 'Not updated', 'Star already present. DB not updated')
         return
 
-    # Update STAR Table
-    self.main.df_stars.loc[len(self.main.df_stars)] = {
-        'id': max(self.main.df_stars.id) + 1,
+    # Update DB (new row only)
+    star = {
         'star': self.starname,
         'vizier_name': self.vizier_name,
         'ra0': self.ra0,
@@ -58,15 +55,13 @@ def update_db(self):
         'pm_ra': self.pm_ra,
         'pm_dec': self.pm_dec
     }
-    self.main.df_stars.sort_values(by='star', inplace=True)
+    try:
+        star_id, = myadb.insert_rows(self.main.db_path, 'STARS', [star])
+    except sqlite3.IntegrityError:
+        QMessageBox.warning(self, 'Not updated', 'Star already present (same Vizier name). DB not updated')
+        return
 
-    # Update GUI
-    self.main.select_object.clear()
-    self.main.select_object.addItems(self.main.ssobj + self.main.df_stars.star.tolist())
-    if self.main.select_object.count() > 0:
-        self.main.select_object.setCurrentIndex(0)
+    # Update STAR registry (combos updated by the registry)
+    self.main.cat_stars.add([{'id': star_id, **star}])
 
-    # Update DB
-    with sqlite3.connect(self.main.db_path) as conn:
-        self.main.df_stars.to_sql('STARS', conn, if_exists='replace', index=False)
-        QMessageBox.information(self, 'Success', 'DB updated')
+    QMessageBox.information(self, 'Success', 'DB updated')
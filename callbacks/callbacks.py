@@ -10,91 +10,120 @@ import os
 import sys
 import re
 from datetime import datetime
-import shutil
 import pandas as pd
-import sqlite3
-from pathlib import Path
 from PyQt6.QtWidgets import (
     QFileDialog, QMessageBox, QComboBox, QDateEdit
 )
-from PyQt6.QtCore import QDate, QSize
+from PyQt6.QtCore import QDate, QSize, QTimer, QStringListModel
 from PyQt6.QtGui import QStandardItemModel, QStandardItem, QPixmap, QPainter, QColor, QIcon
-import importlib
-import myastrolib as myal
+from functools import partial
 import myastroplot as myap
-from callbacks import add_stars
-from callbacks import add_locations
-from callbacks import remove_stars
-from callbacks import remove_locations
+import myastrocache as myac
+import myastroexport as myax
+import myastrodb as myadb
+import myastroreg as myarg
+import myastrocat as myacat
+import myastrogeo as myageo
+from callbacks import compute_worker
+from callbacks import online_probe
 
-importlib.reload(myal)
-importlib.reload(myap)
-importlib.reload(add_stars)
-importlib.reload(add_locations)
-importlib.reload(remove_stars)
-importlib.reload(remove_locations)
-
-
-# --- DB Path ---
-def resource_path(relative_path):
-        try: # Compiled Version
-            base_path = sys._MEIPASS
-        except AttributeError: # Developer mode
-            base_path = os.path.abspath('.')
-        return os.path.join(base_path, relative_path)
+# Dialog modules (add / remove stars and locations, long range) are imported when first opened;
+# myastrolib (astropy) is imported by the background computation, not at startup
 
 
 # --- Read DB Routine ---
 def read_db(self):
-    conn = None
-    try:
-        conn = sqlite3.connect(self.db_path)
-        self.df_loc = pd.read_sql_query('SELECT * FROM LOCATIONS ORDER BY location', conn)
-        self.df_stars = pd.read_sql_query('SELECT * FROM STARS ORDER BY star', conn)
-    finally:
-        if conn is not None:
-            conn.close()
+    set_catalogues(self, *myadb.read_db(self.db_path))
+
+
+# --- CATALOGUE REGISTRIES (STARS / LOCATIONS) AND THE LISTS SHOWN BY COMBOS ---
+# Combos share one model per list; registry changes insert / remove single rows (no full rebuild)
+def set_catalogues(self, df_loc, df_stars):
+    self.cat_stars, self.cat_loc = myarg.get_catalogues(df_loc, df_stars)
+    if getattr(self, 'object_model', None) is None:
+        self.object_model = QStringListModel()
+        self.location_model = QStringListModel()
+    self.object_model.setStringList(self.ssobj + self.cat_stars.names)
+    self.location_model.setStringList(self.cat_loc.names)
+    self.cat_stars.subscribe(partial(update_model, self.object_model, len(self.ssobj)))
+    self.cat_loc.subscribe(partial(update_model, self.location_model, 0))
+
+
+def update_model(model, offset, event, name, position):
+    row = offset + position
+    if event == 'add':
+        model.insertRows(row, 1)
+        model.setData(model.index(row), name)
+    else:
+        model.removeRows(row, 1)
 
 
 # --- Restore DB Routine ---
 def restore_db(self):
-    sql_file = resource_path('db_backup.sql')
-    with sqlite3.connect(self.db_path) as conn:
-        cursor = conn.cursor()
-        with open(sql_file, 'r', encoding='utf-8') as f:
-            sql_script = f.read()
-        cursor.executescript(sql_script)
-        conn.commit()
+    myadb.restore_db(self.db_path)
 
 
 # --- INIT ---
 def init_data(self):
 
-    # Recreate App path if it does not exist
-    if os.name == 'nt':
-        app_dir = Path(os.getenv('LOCALAPPDATA')) / 'Astrotracker'
-    else:
-        app_dir = Path.home() / '.Astrotracker'
-    app_dir.mkdir(parents=True, exist_ok=True)
-
-    # Recreate DB if it does not exist or if it is faulty
+    # App path, DB (recreated if it does not exist or if it is faulty)
+    app_dir = myadb.get_app_dir()
+    self.app_dir = app_dir
     self.db_path = app_dir / 'astrodb.db'
-    if not(os.path.exists(self.db_path)):
-        restore_db(self)
-        read_db(self)
-    else:
-        try:
-            read_db(self)
-        except:
-            if os.path.exists(self.db_path):
-                os.remove(self.db_path)
-            restore_db(self)
-            read_db(self)
+
+    # Catalogue (registries of stars and locations)
+    self.ssobj = myadb.SS_OBJECTS
+    set_catalogues(self, *myadb.load_db(self.db_path))
 
     # Other parameters
-    self.ssobj = ['SUN', 'MOON', 'MERCURY', 'VENUS', 'MARS', 'JUPITER', 'SATURN']
     self.df_out = []
+    self.df_events = None
+    self.coords_args = None
     self.sel_time = 'Civil'
+    self.sel_ephem = 'Astropy'
+    self.ephem_types = {'Astropy': 'builtin', 'Chebyshev': 'chebyshev', 'Fast': 'fast'}
+    self.n_workers = 0 # Worker processes for position computation (0: single process)
+
+    # Background computation
+    self.compute_gen = 0
+    self.worker = None
+    self.workers = [] # Running workers (stale ones included, kept alive until finished)
+
+    # Persistent cache of computed trajectories (shared with other running instances)
+    self.result_cache = myac.ResultCache(app_dir / 'cache.db')
+
+
+# --- ONLINE CHECK (ASYNCHRONOUS, WITH TIMEOUT) ---
+PROBE_TIMEOUT_MS = 5000
+
+
+def start_online_probe(self):
+    self.isonline = None # Unknown until the probe answers
+    self.star_menu.setEnabled(myacat.has_catalogue()) # Offline star catalogue: stars can be added anyway
+    self.loc_menu.setEnabled(myageo.has_gazetteer()) # Offline gazetteer: locations can be added anyway
+    probe = online_probe.OnlineProbe(self)
+    probe.result.connect(lambda online: online_done(self, online))
+    probe.finished.connect(lambda: self.workers.remove(probe))
+    self.workers.append(probe)
+    probe.start()
+    QTimer.singleShot(PROBE_TIMEOUT_MS, lambda: online_done(self, False) if self.isonline is None else None)
+
+
+# Offline is reported once (probe failed or timed out); a late successful answer still enables the menus
+def online_done(self, online):
+    if online:
+        self.isonline = True
+        self.star_menu.setEnabled(True)
+        self.loc_menu.setEnabled(True)
+    elif self.isonline is None:
+        self.isonline = False
+        offline = {'Stars': myacat.has_catalogue(), 'Locations': myageo.has_gazetteer()}
+        msg = 'You are offline. '
+        if any(offline.values()):
+            msg += f'{" / ".join(k for k, v in offline.items() if v)} are looked up offline only. '
+        if not all(offline.values()):
+            msg += f'Adding {" / ".join(k for k, v in offline.items() if not v)} feature disabled'
+        QMessageBox.warning(self, 'Offline', msg.strip())
 
 
 # --- TIME TYPE (CIVIL, LOCAL, GREENWICH) ---
@@ -106,6 +135,23 @@ def set_time_type(self, curr_label):
     self.recalc = True
 
 
+# --- EPHEMERIS (ASTROPY, CHEBYSHEV TABLES, FAST ANALYTIC) ---
+def set_ephemeris(self, curr_label):
+    # Make selected one checked, others unchecked
+    for label, act in self.ephem_actions.items():
+        act.setChecked(label == curr_label)
+    self.sel_ephem = curr_label
+    self.recalc = True
+
+
+# --- PARALLEL PROCESSES (WORKER PROCESSES USED BY THE COMPUTATION) ---
+def set_workers(self, curr_label):
+    # Make selected one checked, others unchecked
+    for label, act in self.worker_actions.items():
+        act.setChecked(label == curr_label)
+    self.n_workers = 0 if curr_label == 'Off' else int(curr_label.split()[0])
+
+
 # --- Get Multi Values Routine ---
 def get_multi_values(multi_mode, removeduplicates, self):
     multi_values = []
@@ -123,6 +169,17 @@ def get_multi_values(multi_mode, removeduplicates, self):
 
 # --- UPDATE PLOT ---
 def update_plot(self):
+    coords_args, plot_args = get_coords_args(self)
+
+    # Get Data in background (only missing object / location / day series are computed), then plot
+    if self.recalc:
+        start_compute(self, coords_args, plot_args)
+    else:
+        show_plot(self, *plot_args)
+
+
+# --- CURRENT SELECTION: COMPUTATION AND PLOT PARAMETERS ---
+def get_coords_args(self):
 
     # Mode Type
     multi_mode = self.selmultidata.currentText()
@@ -135,45 +192,15 @@ def update_plot(self):
     # Get parameters (multiple mode)
     multi_values = get_multi_values(multi_mode=multi_mode, removeduplicates=True, self=self)
 
-    # Objects to be checked
+    # Objects / locations / days
     if multi_mode == 'Multi Objects':
-        sel_ssbodies = [m for m in multi_values if m in self.ssobj]
-        if not 'SUN' in sel_ssbodies:
-            sel_ssbodies = ['SUN'] + sel_ssbodies
-        sel_stars = [m for m in multi_values if m not in self.ssobj]
+        sel_objects = multi_values
     else:
-        if curr_obj in self.ssobj:
-            if curr_obj == 'SUN':
-                sel_ssbodies = ['SUN']
-            else:
-                sel_ssbodies = ['SUN', curr_obj]
-            sel_stars = []
-        else:
-            sel_ssbodies = ['SUN']
-            sel_stars = [curr_obj]
-
-    sel_stars_ra0 = [] ; sel_stars_dec0 = []
-    sel_stars_pm_ra = [] ; sel_stars_pm_dec = []
-    for sel_star in sel_stars:
-        curr_rec = self.df_stars.loc[self.df_stars['star'] == sel_star].iloc[0]
-        sel_stars_ra0.append(curr_rec['ra0'])
-        sel_stars_dec0.append(curr_rec['dec0'])
-        sel_stars_pm_ra.append(curr_rec['pm_ra'])
-        sel_stars_pm_dec.append(curr_rec['pm_dec'])
-
-    # Current position info
+        sel_objects = [curr_obj]
     if multi_mode == 'Multi Locations':
         sel_locations = multi_values
     else:
         sel_locations = [curr_location]
-    lats = [] ; lons = [] ; tz_names = []
-    for sel_location in sel_locations:
-        row = self.df_loc.loc[self.df_loc['location'] == sel_location].iloc[0]
-        lats.append(row['latitude'])
-        lons.append(row['longitude'])
-        tz_names.append(row['time_zone'])
-
-    # Time info
     if multi_mode == 'Multi Days':
         multi_values = [m.toString('yyyy-MM-dd') for m in multi_values]
         multi_values = list(dict.fromkeys(multi_values))
@@ -181,33 +208,113 @@ def update_plot(self):
     else:
         sel_days = [curr_day]
 
-    # Get Data
-    if self.recalc:
-        self.df_out = myal.get_coords(
-            sel_ssbodies = sel_ssbodies,
-            sel_stars = sel_stars,
-            stars_ra0 = sel_stars_ra0,
-            stars_dec0 = sel_stars_dec0,
-            stars_pm_ra = sel_stars_pm_ra,
-            stars_pm_dec = sel_stars_pm_dec,
-            loc_names= sel_locations,
-            lats = lats,
-            lons = lons,
-            tz_names = tz_names,
-            sel_time = self.sel_time,
-            sel_days = sel_days,
-            t_min = self.tmin.time().toString('HH:mm') if self.tminmaxsel.isChecked() else '00:00',
-            t_max = self.tmax.time().toString('HH:mm') if self.tminmaxsel.isChecked() else '00:00',
-            t_delta = self.tdelta.value()
+    # Plot parameters (applied when data are available)
+    plot_args = (curr_obj, curr_location, curr_day, multi_mode, multi_values)
+
+    # Computation parameters
+    coords_args = myadb.get_selection_args(
+        self.cat_stars, self.cat_loc, sel_objects, sel_locations, sel_days,
+        sel_time = self.sel_time,
+        t_min = self.tmin.time().toString('HH:mm') if self.tminmaxsel.isChecked() else '00:00',
+        t_max = self.tmax.time().toString('HH:mm') if self.tminmaxsel.isChecked() else '00:00',
+        t_delta = self.tdelta.value(),
+        ephemeris = self.ephem_types[self.sel_ephem],
+        n_workers = self.n_workers
     )
+    return coords_args, plot_args
+
+
+# --- START BACKGROUND COMPUTATION (A NEWER REQUEST CANCELS THE STALE ONE) ---
+def start_compute(self, coords_args, plot_args):
+    cancel_compute(self)
+    self.compute_gen += 1
+    self.recalc = False # Input parameters changed from now on trigger a new computation
+
+    self.coords_args = coords_args
+    worker = compute_worker.ComputeWorker(
+        self.compute_gen,
+        partial(compute_coords_events, self.result_cache, self.showevents.isChecked(),
+                dict(twil_levels=(0, self.twilsel.value())) if self.adaptive.isChecked() else None),
+        coords_args,
+        self
+    )
+    worker.progress.connect(lambda gen, n_done, n_total: compute_progress(self, gen, n_done, n_total))
+    worker.result.connect(lambda gen, result: compute_done(self, gen, result, plot_args))
+    worker.error.connect(lambda gen, tb_text: compute_error(self, gen, tb_text))
+    worker.finished.connect(lambda: self.workers.remove(worker))
+    self.workers.append(worker)
+    self.worker = worker
+
+    self.progress_bar.setRange(0, 0) # Busy until the first progress report
+    self.progress_bar.setVisible(True)
+    self.cancel_button.setVisible(True)
+    worker.start()
+
+
+# --- COMPUTATION RUN BY THE WORKER: POSITIONS (AND EVENTS, IF SHOWN) ---
+def compute_coords_events(result_cache, with_events, adaptive_args, progress=None, **coords_args):
+    import myastrolib as myal
+    if adaptive_args is not None: # Adaptive time grid (t_delta is the finest step)
+        adaptive_keys = [
+            'sel_ssbodies', 'sel_stars', 'stars_ra0', 'stars_dec0', 'stars_pm_ra', 'stars_pm_dec', 'loc_names',
+            'lats', 'lons', 'tz_names', 'sel_time', 'sel_days', 't_min', 't_max', 't_delta', 'ephemeris'
+        ]
+        df_out = myal.get_coords_adaptive(
+            **{k: coords_args[k] for k in adaptive_keys}, **adaptive_args, progress=progress)
+    else:
+        df_out = myal.get_coords_incremental(myac.series_cache, result_cache, progress=progress, **coords_args)
+    df_events = get_events(coords_args) if with_events else None
+    return df_out, df_events
+
+
+def get_events(coords_args):
+    import myastrolib as myal
+    return myal.get_events(**{k: coords_args[k] for k in myal.EVENT_ARGS})
+
+
+# --- CANCEL BACKGROUND COMPUTATION ---
+def cancel_compute(self):
+    if self.worker is not None:
+        self.worker.cancel()
+        self.worker = None
+        self.recalc = True
+    self.progress_bar.setVisible(False)
+    self.cancel_button.setVisible(False)
+
+
+# --- BACKGROUND COMPUTATION PROGRESS / RESULTS ---
+def compute_progress(self, gen, n_done, n_total):
+    if gen != self.compute_gen: return
+    self.progress_bar.setRange(0, n_total)
+    self.progress_bar.setValue(n_done)
+
+
+def compute_done(self, gen, result, plot_args):
+    if gen != self.compute_gen: return # Stale result
+    self.worker = None
+    self.progress_bar.setVisible(False)
+    self.cancel_button.setVisible(False)
+    self.df_out, self.df_events = result
+    show_plot(self, *plot_args)
+
 
-    # Create Graph
+def compute_error(self, gen, tb_text):
+    if gen != self.compute_gen: return
+    self.worker = None
+    self.recalc = True
+    self.progress_bar.setVisible(False)
+    self.cancel_button.setVisible(False)
+    print(tb_text, file=sys.stderr)
+    QMessageBox.critical(self, 'Error', f'Computation failed:\n\n{tb_text.strip().splitlines()[-1]}')
+
+
+# --- CREATE GRAPH ---
+def show_plot(self, curr_obj, curr_location, curr_day, multi_mode, multi_values):
     plot_type = self.select_graph.currentText()
     if multi_mode == 'Single Data':
         myap.makeplot_single(self.df_out, curr_obj, curr_location, curr_day, plot_type, self)
     else:
         myap.makeplot_multi(self.df_out, curr_obj, curr_location, curr_day, plot_type, multi_mode, multi_values, self)
-    self.recalc = False # If no input parameter changes, do not recalculate objects' positions
 
     def sanitise_obj_loc(str0):
         str1 = re.sub(r'[^A-Za-z0-9]+', '_', str0)
@@ -243,6 +350,12 @@ def change_objparam(self):
     self.recalc = True
 
 
+# --- TWILIGHT THRESHOLD CHANGED (ADAPTIVE GRID IS REFINED AROUND IT) ---
+def change_twilsel(self):
+    if self.adaptive.isChecked():
+        self.recalc = True
+
+
 # --- MULTI DATA SELECTION ---
 def selmultidata(self):
 
@@ -253,16 +366,16 @@ def selmultidata(self):
     enabs = [True, True, True, True]
     if multi_mode == 'Single Data':
         enabs[0] = False
-        multi_options = []
+        multi_model = None
     if multi_mode == 'Multi Objects':
         enabs[1] = False
-        multi_options = self.ssobj + self.df_stars.star.tolist()
+        multi_model = self.object_model
     if multi_mode == 'Multi Locations':
         enabs[2] = False
-        multi_options = self.df_loc.location.tolist()
+        multi_model = self.location_model
     if multi_mode == 'Multi Days':
         enabs[3] = False
-        multi_options = []
+        multi_model = None
     self.multitable.setEnabled(enabs[0])
     self.select_object.setEnabled(enabs[1])
     self.select_location.setEnabled(enabs[2])
@@ -284,14 +397,15 @@ def selmultidata(self):
 
     # Manage Table
     if multi_mode in ['Multi Objects', 'Multi Locations']:
+        n_options = multi_model.rowCount()
         if n_rows_target < n_rows:
             multi_values = multi_values[:n_rows_target]
         elif n_rows_target > n_rows:
-            nsel = [min(n, len(multi_options)-1) for n in range(n_rows, n_rows_target)] # Cap nsel to prevent overflows
-            multi_values = multi_values + [multi_options[i] for i in nsel]
+            nsel = [min(n, n_options-1) for n in range(n_rows, n_rows_target)] # Cap nsel to prevent overflows
+            multi_values = multi_values + [multi_model.index(i).data() for i in nsel]
         else:
-            nsel = [min(n, len(multi_options)-1) for n in range(0, n_rows_target)] # Cap nsel to prevent overflows
-            multi_values = [multi_options[i] for i in nsel]
+            nsel = [min(n, n_options-1) for n in range(0, n_rows_target)] # Cap nsel to prevent overflows
+            multi_values = [multi_model.index(i).data() for i in nsel]
     elif multi_mode == 'Multi Days':
         if n_rows_target < n_rows:
             multi_values = multi_values[:n_rows_target]
@@ -314,12 +428,9 @@ def selmultidata(self):
         ni = 0
         for row in range(self.nrows.value()):
             combo = QComboBox()
-            combo.addItems(multi_options)
-            try:
-                nj = multi_options.index(multi_values[ni])
-            except:
-                nj = ni
-            combo.setCurrentIndex(nj)
+            combo.setModel(multi_model) # Shared list (no copy of the catalogue per row)
+            nj = combo.findText(multi_values[ni]) if ni < len(multi_values) else -1
+            combo.setCurrentIndex(nj if nj >= 0 else ni)
             combo.currentIndexChanged.connect(lambda index, r=row: change_objparam(self))
             combo.setMinimumHeight(24)  # makes it look better
             self.multitable.setCellWidget(row, 0, combo)
@@ -347,12 +458,16 @@ def selmultidata(self):
 def export(self, format):
 
     # Default file name
-    if format == 'csv':
-        file_name = f'{self.curr_obj}-{self.curr_location}-{self.curr_day}'
-    else:
+    if format == 'png':
         file_name = f'{self.curr_obj}-{self.curr_location}-{self.curr_day}-{self.curr_graph}'
+    else:
+        file_name = f'{self.curr_obj}-{self.curr_location}-{self.curr_day}'
 
-    format_up = format.upper()
+    if format in ['parquet', 'feather'] and not myax.has_arrow():
+        QMessageBox.warning(self, 'Export Data', f'{myax.EXPORT_FORMATS[format]} export requires pyarrow')
+        return
+
+    format_up = myax.EXPORT_FORMATS.get(format, format.upper())
     file_path, _ = QFileDialog.getSaveFileName(
         self, f'Save {format_up} File', f'{file_name}.{format}', f'{format_up} Files (*.{format})'
     )
@@ -360,14 +475,14 @@ def export(self, format):
         return
 
     try:
-        # Ensure it ends with .csv / png
+        # Ensure it ends with .csv / .parquet / .feather / .png
         if not file_path.lower().endswith(f'.{format}'):
             file_path += f'.{format}'
 
-        if format == 'csv': # Save the DataFrame
-            self.df_out.to_csv(file_path, sep=';', index=False)
-        elif format == 'png': # Export Figure
+        if format == 'png': # Export Figure
             self.fig.write_image(file_path)
+        else: # Save the DataFrame (chunk by chunk)
+            myax.write_frame(self.df_out, file_path, format)
 
         QMessageBox.information(self, 'Success', f'File saved as:\n{file_path}')
 
@@ -375,6 +490,29 @@ def export(self, format):
         QMessageBox.critical(self, 'Error', f'Could not save file:\n{str(e)}')
 
 
+# --- EXPORT EVENTS (RISE, SET, CULMINATIONS, TWILIGHTS) ---
+def export_events(self):
+    if self.coords_args is None:
+        QMessageBox.warning(self, 'Export Events', 'No data: press PLOT first')
+        return
+
+    file_name = f'{self.curr_obj}-{self.curr_location}-{self.curr_day}-Events'
+    file_path, _ = QFileDialog.getSaveFileName(self, 'Save CSV File', f'{file_name}.csv', 'CSV Files (*.csv)')
+    if not file_path:
+        return
+
+    try:
+        if not file_path.lower().endswith('.csv'):
+            file_path += '.csv'
+        if self.df_events is None: # Events not computed with the last plot
+            self.df_events = get_events(self.coords_args)
+        self.df_events.drop(columns=['n_eval']).to_csv(file_path, sep=';', index=False)
+        QMessageBox.information(self, 'Success', f'File saved as:\n{file_path}')
+
+    except Exception as e:
+        QMessageBox.critical(self, 'Error', f'Could not save file:\n{str(e)}')
+
+
 # --- SELECT / UNSELECT MIN/MAX TIME
 def tminmaxsel(self):
     is_chk = self.tminmaxsel.isChecked()
@@ -383,25 +521,51 @@ def tminmaxsel(self):
     self.recalc = True
 
 
+# --- LONG RANGE (DAILY SUMMARY / ALL POSITIONS OVER MONTHS TO YEARS) ---
+def call_long_range(self):
+    from callbacks import long_range
+    coords_args, _ = get_coords_args(self)
+    dlg = long_range.LongRangeDialog(coords_args, self)
+    dlg.exec()
+
+
 # --- ADD STARS ---
 def call_add_stars(self):
+    from callbacks import add_stars
     dlg = add_stars.AddStarDialog(self)
     dlg.exec()
 
 
+# --- IMPORT STARS (MANY AT ONCE) ---
+def call_import_stars(self):
+    from callbacks import import_stars
+    dlg = import_stars.ImportStarsDialog(self)
+    dlg.exec()
+
+
 # --- REMOVE STARS ---
 def call_remove_stars(self):
+    from callbacks import remove_stars
     remove_stars.remove_stars(self)
 
 
 # --- ADD LOCATIONS ---
 def call_add_locations(self):
+    from callbacks import add_locations
     dlg = add_locations.AddLocationDialog(self)
     dlg.exec()
 
 
+# --- IMPORT LOCATIONS (MANY AT ONCE) ---
+def call_import_locations(self):
+    from callbacks import import_locations
+    dlg = import_locations.ImportLocationsDialog(self)
+    dlg.exec()
+
+
 # --- REMOVE LOCATIONS ---
 def call_remove_locations(self):
+    from callbacks import remove_locations
     remove_locations.remove_locations(self)
 
 
@@ -426,6 +590,29 @@ def show_errorlog(self, get_base_path):
         )
 
 
+# --- CACHE STATISTICS ---
+def show_cache_stats(self):
+    st = myac.ephemeris_cache.stats()
+    text = (
+            '<b>Ephemeris Cache</b><br>'
+            f'Grids stored: {st["entries"]}<br>'
+            f'Memory: {st["bytes"] / 1024**2:.1f} MB of {st["max_bytes"] / 1024**2:.0f} MB<br>'
+            f'Hits: {st["hits"]}<br>'
+            f'Misses: {st["misses"]}<br>'
+            f'Evictions: {st["evictions"]}<br>'
+            f'Hit rate: {st["hit_rate"]:.0%}<br><br>'
+        )
+    st = self.result_cache.stats()
+    text += (
+            '<b>Result Cache (on disk)</b><br>'
+            f'Results stored: {st["entries"]}<br>'
+            f'Size: {st["bytes"] / 1024**2:.1f} MB of {st["max_bytes"] / 1024**2:.0f} MB<br>'
+            f'Hits: {st["hits"]}<br>'
+            f'Misses: {st["misses"]}'
+        )
+    QMessageBox.information(self, 'Cache Statistics', text)
+
+
 # --- ABOUT DIALOG ---
 def show_about_dialog(self, get_base_path):
     base_path = get_base_path()
@@ -509,7 +696,7 @@ def call_db_export(self):
         return
 
     try:
-        shutil.copyfile(self.db_path, export_path)
+        myadb.export_db(self.db_path, export_path)
         QMessageBox.information(self, 'Success', 'Database exported successfully.')
     except Exception as e:
         QMessageBox.critical(self, 'Error', f'Unable to export database:\n{e}')
@@ -529,7 +716,7 @@ def call_db_import(self):
         return
 
     try:
-        shutil.copyfile(import_path, self.db_path)
+        myadb.import_db(self.db_path, import_path)
         init_data(self)
         QMessageBox.information(self,
             'Success',
@@ -555,8 +742,7 @@ def call_db_default(self):
 
     # Delete DB File
     try:
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
+        myadb.delete_db(self.db_path)
     except Exception as e:
         QMessageBox.critical(self, 'Error', 'Unable to delete database')
         return
@@ -0,0 +1,47 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- BACKGROUND COMPUTATION OF OBJECTS' POSITIONS ---
+
+import traceback
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+# Runs a coordinates computation outside the Qt main thread.
+# Every signal carries the request generation, so results of stale requests can be ignored.
+class ComputeWorker(QThread):
+    progress = pyqtSignal(int, int, int) # generation, chunks done, chunks total
+    result = pyqtSignal(int, object) # generation, output DataFrame
+    error = pyqtSignal(int, str) # generation, traceback
+
+    def __init__(self, generation, compute_func, kwargs, parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.compute_func = compute_func
+        self.kwargs = kwargs
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    # Progress callback (called by the computation between chunks)
+    def report(self, n_done, n_total):
+        import myastrolib as myal
+        if self.cancelled:
+            raise myal.ComputeCancelled()
+        self.progress.emit(self.generation, n_done, n_total)
+
+    def run(self):
+        import myastrolib as myal # Imported here (not at startup): astropy is loaded in the background
+        try:
+            df_out = self.compute_func(progress=self.report, **self.kwargs)
+        except myal.ComputeCancelled:
+            return
+        except Exception:
+            self.error.emit(self.generation, traceback.format_exc())
+            return
+        if not self.cancelled:
+            self.result.emit(self.generation, df_out)
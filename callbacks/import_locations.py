@@ -0,0 +1,75 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+from PyQt6.QtWidgets import (
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QDialog, QPlainTextEdit, QProgressBar, QTableWidget,
+    QSizePolicy
+)
+from callbacks import import_locations_callbacks as ilcb
+
+
+# --- IMPORT MANY LOCATIONS TO DB (NAMES GEOCODED CONCURRENTLY, TIME ZONES IN ONE BATCH) ---
+class ImportLocationsDialog(QDialog):
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.main = parent
+
+        self.setWindowTitle('Import Locations')
+        self.resize(760, 600)
+
+        layout = QVBoxLayout(self)
+
+        # Init values
+        self.results = {} # Location name -> (location info or None, status)
+        self.worker = None
+
+        # --- Locations (pasted or loaded from file) ---
+        descr_label = ('One location per line: name (e.g. <b>Vancouver, Canada</b>), '
+                       'lat/lon (e.g. <b>29.9792, 31.1343</b>)<br>'
+                       'or name; lat; lon (e.g. <b>La Silla; -29.2563; -70.7380</b>). Text / CSV files can be loaded')
+        layout.addWidget(QLabel(descr_label))
+        self.names_field = QPlainTextEdit()
+        self.names_field.setPlaceholderText('Vancouver, Canada\n29.9792, 31.1343\nLa Silla; -29.2563; -70.7380')
+        layout.addWidget(self.names_field)
+
+        names_layout = QHBoxLayout()
+        self.load_btn = QPushButton('Load File')
+        self.load_btn.clicked.connect(lambda: ilcb.load_file(self))
+        names_layout.addWidget(self.load_btn)
+        self.resolve_btn = QPushButton('Check All')
+        self.resolve_btn.clicked.connect(lambda: ilcb.resolve(self))
+        names_layout.addWidget(self.resolve_btn)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        names_layout.addWidget(self.progress_bar)
+        layout.addLayout(names_layout)
+
+        # --- Results ---
+        self.table = QTableWidget()
+        self.table.setColumnCount(7)
+        self.table.setHorizontalHeaderLabels(
+            ['Location', 'Result', 'Latitude', 'Longitude', 'Time Zone', 'Civil UTC', 'Local UTC'])
+        for n, w in enumerate([160, 90, 80, 80, 130, 70, 80]):
+            self.table.setColumnWidth(n, w)
+        layout.addWidget(self.table)
+
+        # --- Buttons ---
+        button_layout = QHBoxLayout()
+        self.update_btn = QPushButton('Update DB')
+        self.update_btn.clicked.connect(lambda: ilcb.update_db(self))
+        self.update_btn.setEnabled(False)
+        button_layout.addWidget(self.update_btn)
+        self.close_btn = QPushButton('Close')
+        self.close_btn.clicked.connect(self.close)
+        button_layout.addWidget(self.close_btn)
+        layout.addLayout(button_layout)
+
+    # Stop pending queries when the dialog is closed
+    def done(self, result):
+        if self.worker is not None:
+            self.worker.cancel()
+        super().done(result)
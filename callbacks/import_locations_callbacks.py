@@ -0,0 +1,106 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- CALLBACKS USED BY IMPORT_LOCATIONS ---
+
+import sqlite3
+from PyQt6.QtWidgets import QMessageBox, QFileDialog, QTableWidgetItem
+from PyQt6.QtCore import Qt
+import myastrobulk as myabk
+import myastrodb as myadb
+from callbacks import compute_worker
+
+
+# --- LOAD LOCATIONS FROM FILE
+def load_file(self):
+    file_path, _ = QFileDialog.getOpenFileName(
+        self, 'Load Locations', '', 'Text / CSV Files (*.txt *.csv);;All Files (*)')
+    if not file_path:
+        return
+    try:
+        with open(file_path, 'r', encoding='utf-8-sig') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        QMessageBox.critical(self, 'Error', f'Unable to read file:\n{e}')
+        return
+    self.names_field.setPlainText(text)
+
+
+# --- RESOLVE ALL LOCATIONS (BACKGROUND: GEOCODING OF NAMES, TIME ZONES)
+def resolve(self):
+    rows = myabk.parse_location_rows(self.names_field.toPlainText())
+    if not rows:
+        return
+    self.results = {}
+    self.table.setRowCount(0)
+    self.resolve_btn.setEnabled(False)
+    self.update_btn.setEnabled(False)
+    self.progress_bar.setRange(0, len(rows))
+    self.progress_bar.setValue(0)
+
+    online = self.main.isonline is not False # Unknown (online probe still running): online lookups tried
+    worker = compute_worker.ComputeWorker(0, myabk.resolve_locations, dict(rows=rows, online=online))
+    worker.progress.connect(lambda _, n_done, n_total: self.progress_bar.setValue(n_done))
+    worker.result.connect(lambda _, results: resolve_done(self, results))
+    worker.error.connect(lambda _, tb_text: resolve_error(self, tb_text))
+    worker.finished.connect(lambda: self.main.workers.remove(worker))
+    self.main.workers.append(worker) # Kept alive until finished, even if the dialog is closed
+    self.worker = worker
+    worker.start()
+
+
+def resolve_done(self, results):
+    self.worker = None
+    self.results = results
+    self.resolve_btn.setEnabled(True)
+
+    # One row per location
+    self.table.setRowCount(len(results))
+    for row, (name, (loc_info, status)) in enumerate(results.items()):
+        values = [name, status] + ([str(v) for v in loc_info] if loc_info else [''] * 5)
+        for col, value in enumerate(values):
+            item = QTableWidgetItem(value)
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled) # Not editable
+            self.table.setItem(row, col, item)
+    self.update_btn.setEnabled(any(loc_info for loc_info, _ in results.values()))
+
+
+def resolve_error(self, tb_text):
+    self.worker = None
+    self.resolve_btn.setEnabled(True)
+    QMessageBox.critical(self, 'Error', tb_text.strip().splitlines()[-1])
+
+
+# --- UPDATE DB (ALL FOUND LOCATIONS, ONE TRANSACTION)
+def update_db(self):
+
+    # Found locations not already present
+    known_locations = set()
+    new_rows = []
+    for name, (loc_info, _) in self.results.items():
+        if loc_info is None or self.main.cat_loc.find(name) is not None or name.lower() in known_locations:
+            continue
+        known_locations.add(name.lower())
+        new_rows.append(dict(zip(['location', 'latitude', 'longitude', 'time_zone', 'civil_utc', 'local_utc'],
+                                 [name, *loc_info])))
+    if not new_rows:
+        QMessageBox.warning(self, 'Not updated', 'Locations already present. DB not updated')
+        return
+
+    # Update DB (new rows only, one transaction)
+    try:
+        location_ids = myadb.insert_rows(self.main.db_path, 'LOCATIONS', new_rows)
+    except sqlite3.IntegrityError:
+        QMessageBox.warning(self, 'Not updated', 'Some locations are already present. DB not updated')
+        return
+
+    # Update LOCATION registry (combos updated by the registry, one row per new location)
+    self.main.cat_loc.add([{'id': location_id, **row} for location_id, row in zip(location_ids, new_rows)])
+
+    n_skipped = sum(loc_info is not None for loc_info, _ in self.results.values()) - len(new_rows)
+    QMessageBox.information(self, 'Success', f'DB updated: {len(new_rows)} locations added' +
+                            (f', {n_skipped} already present' if n_skipped else ''))
+    self.update_btn.setEnabled(False)
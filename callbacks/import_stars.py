@@ -0,0 +1,72 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+from PyQt6.QtWidgets import (
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QDialog, QPlainTextEdit, QProgressBar, QTableWidget,
+    QSizePolicy
+)
+from callbacks import import_stars_callbacks as iscb
+
+
+# --- IMPORT MANY STARS TO DB (NAMES RESOLVED CONCURRENTLY) ---
+class ImportStarsDialog(QDialog):
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.main = parent
+
+        self.setWindowTitle('Import Stars')
+        self.resize(760, 600)
+
+        layout = QVBoxLayout(self)
+
+        # Init values
+        self.results = {} # Star name -> (star info or None, status)
+        self.worker = None
+
+        # --- Names (pasted or loaded from file) ---
+        descr_label = 'Paste star names, one per line (e.g. <b>Arcturus</b>), or load them from a text / CSV file'
+        layout.addWidget(QLabel(descr_label))
+        self.names_field = QPlainTextEdit()
+        self.names_field.setPlaceholderText('Arcturus\nAlpha Centauri\nHIP 32349')
+        layout.addWidget(self.names_field)
+
+        names_layout = QHBoxLayout()
+        self.load_btn = QPushButton('Load File')
+        self.load_btn.clicked.connect(lambda: iscb.load_file(self))
+        names_layout.addWidget(self.load_btn)
+        self.resolve_btn = QPushButton('Check All')
+        self.resolve_btn.clicked.connect(lambda: iscb.resolve(self))
+        names_layout.addWidget(self.resolve_btn)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        names_layout.addWidget(self.progress_bar)
+        layout.addLayout(names_layout)
+
+        # --- Results ---
+        self.table = QTableWidget()
+        self.table.setColumnCount(7)
+        self.table.setHorizontalHeaderLabels(['Star', 'Result', 'Vizier Name', 'RA', 'Dec', 'PM_RA', 'PM_DEC'])
+        for n, w in enumerate([140, 110, 120, 80, 80, 80, 80]):
+            self.table.setColumnWidth(n, w)
+        layout.addWidget(self.table)
+
+        # --- Buttons ---
+        button_layout = QHBoxLayout()
+        self.update_btn = QPushButton('Update DB')
+        self.update_btn.clicked.connect(lambda: iscb.update_db(self))
+        self.update_btn.setEnabled(False)
+        button_layout.addWidget(self.update_btn)
+        self.close_btn = QPushButton('Close')
+        self.close_btn.clicked.connect(self.close)
+        button_layout.addWidget(self.close_btn)
+        layout.addLayout(button_layout)
+
+    # Stop pending queries when the dialog is closed
+    def done(self, result):
+        if self.worker is not None:
+            self.worker.cancel()
+        super().done(result)
@@ -0,0 +1,108 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- CALLBACKS USED BY IMPORT_STARS ---
+
+import sqlite3
+from PyQt6.QtWidgets import QMessageBox, QFileDialog, QTableWidgetItem
+from PyQt6.QtCore import Qt
+import myastrobulk as myabk
+import myastrodb as myadb
+from callbacks import compute_worker
+
+
+# --- LOAD NAMES FROM FILE
+def load_file(self):
+    file_path, _ = QFileDialog.getOpenFileName(
+        self, 'Load Star Names', '', 'Text / CSV Files (*.txt *.csv);;All Files (*)')
+    if not file_path:
+        return
+    try:
+        names = myabk.read_names(file_path)
+    except (OSError, UnicodeDecodeError) as e:
+        QMessageBox.critical(self, 'Error', f'Unable to read file:\n{e}')
+        return
+    self.names_field.setPlainText('\n'.join(names))
+
+
+# --- RESOLVE ALL NAMES (BACKGROUND, CONCURRENT QUERIES)
+def resolve(self):
+    names = [name.strip() for name in self.names_field.toPlainText().splitlines() if name.strip()]
+    if not names:
+        return
+    self.results = {}
+    self.table.setRowCount(0)
+    self.resolve_btn.setEnabled(False)
+    self.update_btn.setEnabled(False)
+    self.progress_bar.setRange(0, len(names))
+    self.progress_bar.setValue(0)
+
+    online = self.main.isonline is not False # Unknown (online probe still running): online lookups tried
+    worker = compute_worker.ComputeWorker(0, myabk.resolve_stars, dict(names=names, online=online))
+    worker.progress.connect(lambda _, n_done, n_total: self.progress_bar.setValue(n_done))
+    worker.result.connect(lambda _, results: resolve_done(self, results))
+    worker.error.connect(lambda _, tb_text: resolve_error(self, tb_text))
+    worker.finished.connect(lambda: self.main.workers.remove(worker))
+    self.main.workers.append(worker) # Kept alive until finished, even if the dialog is closed
+    self.worker = worker
+    worker.start()
+
+
+def resolve_done(self, results):
+    self.worker = None
+    self.results = results
+    self.resolve_btn.setEnabled(True)
+
+    # One row per name: found stars get the names shown in the STARS table (as Add Stars)
+    self.table.setRowCount(len(results))
+    for row, (name, (star_info, status)) in enumerate(results.items()):
+        values = [name.title(), status] + ([str(v) for v in star_info] if star_info else [''] * 5)
+        for col, value in enumerate(values):
+            item = QTableWidgetItem(value)
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled) # Not editable
+            self.table.setItem(row, col, item)
+    self.update_btn.setEnabled(any(star_info for star_info, _ in results.values()))
+
+
+def resolve_error(self, tb_text):
+    self.worker = None
+    self.resolve_btn.setEnabled(True)
+    QMessageBox.critical(self, 'Error', tb_text.strip().splitlines()[-1])
+
+
+# --- UPDATE DB (ALL FOUND STARS, ONE TRANSACTION)
+def update_db(self):
+
+    # Found stars not already present (by name or Vizier name)
+    known_vizier = set(self.main.cat_stars.column('vizier_name'))
+    known_stars = set()
+    new_rows = []
+    for name, (star_info, _) in self.results.items():
+        if star_info is None or name.title() in self.main.cat_stars or name.title() in known_stars \
+                or star_info[0] in known_vizier:
+            continue
+        known_stars.add(name.title())
+        known_vizier.add(star_info[0])
+        new_rows.append(dict(zip(['star', 'vizier_name', 'ra0', 'dec0', 'pm_ra', 'pm_dec'],
+                                 [name.title(), *star_info])))
+    if not new_rows:
+        QMessageBox.warning(self, 'Not updated', 'Stars already present. DB not updated')
+        return
+
+    # Update DB (new rows only, one transaction)
+    try:
+        star_ids = myadb.insert_rows(self.main.db_path, 'STARS', new_rows)
+    except sqlite3.IntegrityError:
+        QMessageBox.warning(self, 'Not updated', 'Some stars are already present. DB not updated')
+        return
+
+    # Update STAR registry (combos updated by the registry, one row per new star)
+    self.main.cat_stars.add([{'id': star_id, **row} for star_id, row in zip(star_ids, new_rows)])
+
+    n_skipped = sum(star_info is not None for star_info, _ in self.results.values()) - len(new_rows)
+    QMessageBox.information(self, 'Success', f'DB updated: {len(new_rows)} stars added' +
+                            (f', {n_skipped} already present' if n_skipped else ''))
+    self.update_btn.setEnabled(False)
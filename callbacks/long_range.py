@@ -0,0 +1,179 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+from PyQt6.QtWidgets import (
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QDialog, QGridLayout, QDateEdit, QSpinBox, QComboBox,
+    QProgressBar, QFileDialog, QMessageBox
+)
+import sys
+import myastrolib as myal
+import myastroplot as myap
+import myastroexport as myax
+from callbacks import compute_worker
+
+
+# Output type -> file format (None: plot)
+LONGRANGE_OUTPUTS = {
+    'Daily Summary (Plot)': None,
+    'Daily Summary (.CSV)': 'csv',
+    'All Positions (.CSV)': 'csv',
+    'All Positions (.Parquet)': 'parquet',
+    'All Positions (.Feather)': 'feather'
+}
+
+
+# --- COMPUTATION RUN BY THE WORKER (CHUNKS ARE STREAMED, MEMORY DOES NOT GROW WITH THE RANGE) ---
+def compute_longrange(output, file_path, progress=None, **coords_args):
+    chunks = myal.iter_coords(progress=progress, **coords_args)
+    if output.startswith('All Positions'):
+        return myax.write_chunks(chunks, file_path, LONGRANGE_OUTPUTS[output])
+    df_summary = myal.get_daily_summary(chunks, coords_args['t_delta'])
+    if output == 'Daily Summary (.CSV)':
+        df_summary.to_csv(file_path, sep=';', index=False)
+    return df_summary
+
+
+# --- LONG RANGE (MONTHS TO YEARS) OF THE SELECTED OBJECTS / LOCATIONS ---
+class LongRangeDialog(QDialog):
+
+    def __init__(self, coords_args, parent=None):
+        super().__init__(parent)
+        self.main = parent
+        self.coords_args = coords_args # Current selection
+        self.worker = None
+
+        self.setWindowTitle('Long Range')
+        self.setFixedWidth(420)
+
+        layout = QVBoxLayout(self)
+
+        # --- Create Grid ---
+        grid = QGridLayout()
+        layout.addLayout(grid)
+
+        # --- Row 0: Label
+        descr_label = 'Objects and locations of the current selection, over a range of days'
+        grid.addWidget(QLabel(descr_label), 0, 0, 1, 4)
+
+        # --- Row 1: From / To
+        curr_day = self.main.select_day.date()
+        grid.addWidget(QLabel('From'), 1, 0, 1, 1)
+        self.start_day = QDateEdit()
+        self.start_day.setCalendarPopup(True)
+        self.start_day.setDisplayFormat('yyyy-MM-dd')
+        self.start_day.setDate(curr_day)
+        grid.addWidget(self.start_day, 1, 1, 1, 1)
+
+        grid.addWidget(QLabel('To'), 1, 2, 1, 1)
+        self.end_day = QDateEdit()
+        self.end_day.setCalendarPopup(True)
+        self.end_day.setDisplayFormat('yyyy-MM-dd')
+        self.end_day.setDate(curr_day.addYears(1).addDays(-1))
+        grid.addWidget(self.end_day, 1, 3, 1, 1)
+
+        # --- Row 2: Time step / Output
+        grid.addWidget(QLabel('Step (min)'), 2, 0, 1, 1)
+        self.tdelta = QSpinBox()
+        self.tdelta.setRange(1, 60)
+        self.tdelta.setValue(max(self.main.tdelta.value(), 10))
+        grid.addWidget(self.tdelta, 2, 1, 1, 1)
+
+        grid.addWidget(QLabel('Output'), 2, 2, 1, 1)
+        self.output = QComboBox()
+        self.output.addItems(list(LONGRANGE_OUTPUTS))
+        grid.addWidget(self.output, 2, 3, 1, 1)
+
+        # --- Progress ---
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
+        # --- Buttons ---
+        buttons = QHBoxLayout()
+        self.run_btn = QPushButton('Run')
+        self.run_btn.clicked.connect(self.run)
+        buttons.addWidget(self.run_btn)
+        self.close_btn = QPushButton('Close')
+        self.close_btn.clicked.connect(self.reject)
+        buttons.addWidget(self.close_btn)
+        layout.addLayout(buttons)
+
+    def run(self):
+        start_day = self.start_day.date().toString('yyyy-MM-dd')
+        end_day = self.end_day.date().toString('yyyy-MM-dd')
+        if self.end_day.date() < self.start_day.date():
+            QMessageBox.warning(self, 'Long Range', 'End day is before start day')
+            return
+
+        # Output file (file outputs)
+        output = self.output.currentText()
+        format = LONGRANGE_OUTPUTS[output]
+        file_path = None
+        if format is not None:
+            if format != 'csv' and not myax.has_arrow():
+                QMessageBox.warning(self, 'Long Range', f'{myax.EXPORT_FORMATS[format]} export requires pyarrow')
+                return
+            file_name = f'LongRange-{start_day}-{end_day}'.replace('-', '_')
+            format_up = myax.EXPORT_FORMATS[format]
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, f'Save {format_up} File', f'{file_name}.{format}', f'{format_up} Files (*.{format})')
+            if not file_path:
+                return
+            if not file_path.lower().endswith(f'.{format}'):
+                file_path += f'.{format}'
+
+        # Current selection (objects, locations), over the requested days
+        coords_args = dict(self.coords_args)
+        coords_args['sel_days'] = myal.get_day_range(start_day, end_day)
+        coords_args['t_delta'] = self.tdelta.value()
+        self.title = f'{start_day} to {end_day} ({self.main.sel_time} Time)'
+
+        # Background computation
+        worker = compute_worker.ComputeWorker(0, compute_longrange, dict(output=output, file_path=file_path) | coords_args, self.main)
+        worker.progress.connect(self.compute_progress)
+        worker.result.connect(lambda gen, result: self.compute_done(output, file_path, result))
+        worker.error.connect(self.compute_error)
+        worker.finished.connect(lambda: self.main.workers.remove(worker))
+        self.main.workers.append(worker) # Kept alive if the dialog is closed
+        self.worker = worker
+
+        self.run_btn.setEnabled(False)
+        self.close_btn.setText('Cancel')
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        worker.start()
+
+    def compute_progress(self, gen, n_done, n_total):
+        self.progress_bar.setRange(0, n_total)
+        self.progress_bar.setValue(n_done)
+
+    def compute_done(self, output, file_path, result):
+        self.worker = None
+        if output == 'Daily Summary (Plot)':
+            myap.makeplot_longrange(result, self.title, self.main)
+        else:
+            QMessageBox.information(self, 'Success', f'File saved as:\n{file_path}')
+        self.accept()
+
+    def compute_error(self, gen, tb_text):
+        self.worker = None
+        print(tb_text, file=sys.stderr)
+        QMessageBox.critical(self, 'Error', f'Computation failed:\n\n{tb_text.strip().splitlines()[-1]}')
+        self.reset_buttons()
+
+    def reset_buttons(self):
+        self.run_btn.setEnabled(True)
+        self.close_btn.setText('Close')
+        self.progress_bar.setVisible(False)
+
+    # Close / Cancel: a running computation is stopped at the next chunk
+    def reject(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+            self.reset_buttons()
+            return
+        super().reject()
@@ -0,0 +1,24 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- ONLINE HEALTH PROBE (SIMBAD), RUN OUTSIDE THE QT MAIN THREAD ---
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+# Checks that the online services used by Add Stars / Add Locations answer, without blocking the GUI.
+# The timeout is applied by the caller (a late answer is still reported).
+class OnlineProbe(QThread):
+    result = pyqtSignal(bool) # True if online
+
+    def run(self):
+        import myastrolib as myal
+        try:
+            myal.check_online()
+            online = True
+        except Exception:
+            online = False
+        self.result.emit(online)
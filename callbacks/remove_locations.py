@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QMessageBox
 )
 from PyQt6.QtCore import Qt
+import myastrodb as myadb
 
 
 # --- REMOVE LOCATIONS FROM DB ---
@@ -25,13 +26,14 @@ def remove_locations(self):
     layout = QVBoxLayout(dialog)
 
     # Table with checkboxes
+    df_loc = self.cat_loc.to_frame()
     table = QTableWidget()
-    table.setRowCount(len(self.df_loc))
+    table.setRowCount(len(df_loc))
     table.setColumnCount(7)
     table.setHorizontalHeaderLabels(
         ['Remove', 'Location', 'Latitude', 'Longitude', 'Time Zone', 'Civil UTC', 'Local UTC']
     )
-    for i, location in self.df_loc.iterrows():
+    for i, location in df_loc.iterrows():
         # Checkbox
         checkbox = QCheckBox()
         table.setCellWidget(i, 0, checkbox)
@@ -82,18 +84,15 @@ def remove_locations(self):
                 location_name = table.item(row, 1).text()
                 rows_to_remove.append(location_name)
 
-        # Remove from DataFrame
-        self.df_loc = self.df_loc[~self.df_loc['location'].isin(rows_to_remove)].reset_index(drop=True)
-
-        # Update GUI
-        self.select_location.clear()
-        self.select_location.addItems(self.df_loc.location)
-        if self.select_location.count() > 0:
-            self.select_location.setCurrentIndex(0)
+        # Update DB (removed rows only)
+        try:
+            myadb.delete_rows(self.db_path, 'LOCATIONS', rows_to_remove)
+        except sqlite3.Error as e:
+            QMessageBox.warning(None, 'Not updated', f'DB not updated: {e}')
+            return
 
-        # Update DB
-        with sqlite3.connect(self.db_path) as conn:
-            self.df_loc.to_sql('LOCATIONS', conn, if_exists='replace', index=False)
+        # Remove from LOCATION registry (combos updated by the registry)
+        self.cat_loc.remove(rows_to_remove)
 
         dialog.accept()  # Close dialog
 
@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QMessageBox
 )
 from PyQt6.QtCore import Qt
+import myastrodb as myadb
 
 
 # --- REMOVE STARS FROM DB ---
@@ -25,13 +26,14 @@ def remove_stars(self):
     layout = QVBoxLayout(dialog)
 
     # Table with checkboxes
+    df_stars = self.cat_stars.to_frame()
     table = QTableWidget()
-    table.setRowCount(len(self.df_stars))
+    table.setRowCount(len(df_stars))
     table.setColumnCount(8)
     table.setHorizontalHeaderLabels(
         ['Remove', 'Star', 'Vizier Name', 'RA', 'Dec', 'PM_RA', 'PM_DEC']
     )
-    for i, star in self.df_stars.iterrows():
+    for i, star in df_stars.iterrows():
         # Checkbox
         checkbox = QCheckBox()
         table.setCellWidget(i, 0, checkbox)
@@ -83,18 +85,15 @@ def remove_stars(self):
                 star_name = table.item(row, 1).text()
                 rows_to_remove.append(star_name)
 
-        # Remove from DataFrame
-        self.df_stars = self.df_stars[~self.df_stars['star'].isin(rows_to_remove)].reset_index(drop=True)
-
-        # Update GUI
-        self.select_object.clear()
-        self.select_object.addItems(self.ssobj + self.df_stars.star.tolist())
-        if self.select_object.count() > 0:
-            self.select_object.setCurrentIndex(0)
+        # Update DB (removed rows only)
+        try:
+            myadb.delete_rows(self.db_path, 'STARS', rows_to_remove)
+        except sqlite3.Error as e:
+            QMessageBox.warning(None, 'Not updated', f'DB not updated: {e}')
+            return
 
-        # Update DB
-        with sqlite3.connect(self.db_path) as conn:
-            self.df_stars.to_sql('STARS', conn, if_exists='replace', index=False)
+        # Remove from STAR registry (combos updated by the registry)
+        self.cat_stars.remove(rows_to_remove)
 
         dialog.accept()  # Close dialog
 
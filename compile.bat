@@ -20,6 +20,8 @@ REM Build EXE with PyInstaller
 	--add-data "%CITATION_SRC%;%CITATION_DEST%" ^
 	--add-data "%SIMBAD_JSON_SRC%;%SIMBAD_JSON_DEST%" ^
 	--add-data "%CD%\db_backup.sql;." ^
+	--add-data "%CD%\catalogue;catalogue" ^
+	--add-data "%CD%\gazetteer;gazetteer" ^
 	--add-data "%CD%\LICENSE.txt;." ^
 	--add-data "%CD%\assets;assets"
 
@@ -8,28 +8,22 @@ import os
 import sys
 from functools import partial
 import traceback
+import multiprocessing
 from datetime import datetime
 
 import pandas as pd
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QComboBox, QTableWidget, QMessageBox,
-    QPushButton, QSpacerItem, QSizePolicy, QHBoxLayout, QDateEdit, QCheckBox, QTimeEdit, QSpinBox, QSplashScreen
+    QPushButton, QSpacerItem, QSizePolicy, QHBoxLayout, QDateEdit, QCheckBox, QTimeEdit, QSpinBox, QSplashScreen,
+    QProgressBar
 )
 from PyQt6.QtGui import QAction, QFont, QIcon, QPixmap
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtCore import Qt, QDate, QTimer, QTime
-import plotly.express as px
-from astroquery.simbad import Simbad
-Simbad.TIMEOUT = 2
-import importlib
-import myastrolib as myal
 import myastroplot as myap
+import myastroreg as myarg
 from callbacks import callbacks as cb
 
-importlib.reload(myal)
-importlib.reload(myap)
-importlib.reload(cb)
-
 # Environment (True for compiled version, False for development)
 IS_FROZEN = getattr(sys, 'frozen', False)
 
@@ -106,8 +100,8 @@ class MainWindow(QMainWindow):
 
     def __init__(self):
         ssobj: list[str]
-        df_stars: pd.DataFrame
-        df_loc: pd.DataFrame
+        cat_stars: myarg.Catalogue
+        cat_loc: myarg.Catalogue
         df_out: pd.DataFrame
         sel_time: str
         recalc: bool
@@ -127,20 +121,8 @@ class MainWindow(QMainWindow):
             QTimer.singleShot(0, self.showMaximized)
 
             # Colour schemes
-            self.discrete_colour_map = {
-                'Plotly': px.colors.qualitative.Plotly,
-                'Set1': px.colors.qualitative.Set1,
-                'Set2': px.colors.qualitative.Set2,
-                'Bold': px.colors.qualitative.Bold,
-                'Dark24': px.colors.qualitative.Dark24
-            }
-            self.continuous_colour_map = {
-                'Viridis': px.colors.sequential.Viridis,
-                'Plasma': px.colors.sequential.Plasma,
-                'Turbo': px.colors.sequential.Turbo,
-                'Oranges': px.colors.sequential.Oranges,
-                'Greens': px.colors.sequential.Greens
-            }
+            self.discrete_colour_map = myap.DISCRETE_COLOUR_MAP
+            self.continuous_colour_map = myap.CONTINUOUS_COLOUR_MAP
 
             # Central Widget / Layout
             central_widget = QWidget()
@@ -157,7 +139,7 @@ class MainWindow(QMainWindow):
             top_row.addWidget(label_object)
 
             self.select_object = QComboBox()
-            self.select_object.addItems(self.ssobj + self.df_stars.star.tolist())
+            self.select_object.setModel(self.object_model)
             self.select_object.setFixedWidth(150)
             self.select_object.currentIndexChanged.connect(lambda: cb.change_objparam(self))
             top_row.addWidget(self.select_object)
@@ -169,7 +151,7 @@ class MainWindow(QMainWindow):
             top_row.addWidget(label_location)
 
             self.select_location = QComboBox()
-            self.select_location.addItems(self.df_loc.location)
+            self.select_location.setModel(self.location_model)
             self.select_location.setFixedWidth(200)
             self.select_location.currentIndexChanged.connect(lambda: cb.change_objparam(self))
             top_row.addWidget(self.select_location)
@@ -216,13 +198,7 @@ class MainWindow(QMainWindow):
             sidemenu.addWidget(label_graph)
 
             self.select_graph = QComboBox()
-            self.select_graph.addItems([
-                'Azimuth/Altidude',
-                'Azimuth/Altidude (Polar)',
-                'Equatorial',
-                'Equatorial (Polar, North)',
-                'Equatorial (Polar, South)'
-            ])
+            self.select_graph.addItems(myap.PLOT_TYPES)
             self.select_graph.setFixedWidth(170)
             sidemenu.addWidget(self.select_graph)
             sidemenu.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Minimum))
@@ -244,6 +220,12 @@ class MainWindow(QMainWindow):
             self.horizonview.setFixedWidth(170)
             sidemenu.addWidget(self.horizonview)
 
+            # Events (Rise, Set, Culminations, Twilights)
+            self.showevents = QCheckBox('Show Events')
+            self.showevents.setFixedWidth(150)
+            self.showevents.clicked.connect(lambda: cb.change_objparam(self))
+            sidemenu.addWidget(self.showevents)
+
             # Twilight Menu
             twilsel = QHBoxLayout()
             twilsel.setContentsMargins(0, 0, 0, 0)
@@ -253,6 +235,7 @@ class MainWindow(QMainWindow):
             self.twilsel.setRange(-18, -3)
             self.twilsel.setSingleStep(1)
             self.twilsel.setValue(-6)
+            self.twilsel.valueChanged.connect(lambda: cb.change_twilsel(self))
             twilsel.addWidget(self.twilsel)
             twilsel.addSpacerItem(QSpacerItem(5, 5, QSizePolicy.Policy.Expanding))
             twilsel_widget = QWidget()
@@ -316,6 +299,12 @@ class MainWindow(QMainWindow):
             tdelta_widget = QWidget()
             tdelta_widget.setLayout(tdelta)
             sidemenu.addWidget(tdelta_widget)
+
+            # Adaptive Sampling (time step becomes the finest step)
+            self.adaptive = QCheckBox('Adaptive Sampling')
+            self.adaptive.setFixedWidth(150)
+            self.adaptive.clicked.connect(lambda: cb.change_objparam(self))
+            sidemenu.addWidget(self.adaptive)
             sidemenu.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Minimum))
 
             # Button Styles
@@ -334,6 +323,17 @@ class MainWindow(QMainWindow):
             self.plot_button.setStyleSheet(style_button)
             sidemenu.addWidget(self.plot_button)
 
+            # Computation Progress / Cancel Button (visible while computing)
+            self.progress_bar = QProgressBar()
+            self.progress_bar.setFixedWidth(170)
+            self.progress_bar.setVisible(False)
+            sidemenu.addWidget(self.progress_bar)
+            self.cancel_button = QPushButton('Cancel')
+            self.cancel_button.clicked.connect(lambda: cb.cancel_compute(self))
+            self.cancel_button.setFixedWidth(120)
+            self.cancel_button.setVisible(False)
+            sidemenu.addWidget(self.cancel_button)
+
             # Side Menu Container
             sidemenu_widget = QWidget()
             sidemenu_widget.setFixedWidth(200)
@@ -441,6 +441,28 @@ class MainWindow(QMainWindow):
                 self.actions[label] = action
             self.actions['Civil'].setChecked(True)
 
+            # Ephemeris Menu
+            ephem_menu = menubar.addMenu('Ephemeris')
+            self.ephem_actions = {}
+            for label in ['Astropy', 'Chebyshev', 'Fast']:
+                action = QAction(label, self, checkable=True)
+                action.triggered.connect(partial(cb.set_ephemeris, self, label))
+                ephem_menu.addAction(action)
+                self.ephem_actions[label] = action
+            self.ephem_actions['Astropy'].setChecked(True)
+
+            # Parallel Processes Menu
+            workers_menu = menubar.addMenu('Parallel')
+            self.worker_actions = {}
+            n_cpu = os.cpu_count() or 1
+            n_workers = sorted({n for n in [2, 4, 8, 16, 32] if n < n_cpu} | {n_cpu} - {1})
+            for label in ['Off'] + [f'{n} Processes' for n in n_workers]:
+                action = QAction(label, self, checkable=True)
+                action.triggered.connect(partial(cb.set_workers, self, label))
+                workers_menu.addAction(action)
+                self.worker_actions[label] = action
+            self.worker_actions['Off'].setChecked(True)
+
             # DB Menu
             self.db_menu = menubar.addMenu('Database')
             db_export = QAction('Export Database', self)
@@ -459,6 +481,9 @@ class MainWindow(QMainWindow):
             star_add = QAction('Add Stars', self)
             star_add.triggered.connect(lambda: cb.call_add_stars(self))
             self.star_menu.addAction(star_add)
+            star_import = QAction('Import Stars', self)
+            star_import.triggered.connect(lambda: cb.call_import_stars(self))
+            self.star_menu.addAction(star_import)
             star_remove = QAction('Remove Stars', self)
             star_remove.triggered.connect(lambda: cb.call_remove_stars(self))
             self.star_menu.addAction(star_remove)
@@ -468,6 +493,9 @@ class MainWindow(QMainWindow):
             loc_add = QAction('Add Locations', self)
             loc_add.triggered.connect(lambda: cb.call_add_locations(self))
             self.loc_menu.addAction(loc_add)
+            loc_import = QAction('Import Locations', self)
+            loc_import.triggered.connect(lambda: cb.call_import_locations(self))
+            self.loc_menu.addAction(loc_import)
             loc_remove = QAction('Remove Locations', self)
             loc_remove.triggered.connect(lambda: cb.call_remove_locations(self))
             self.loc_menu.addAction(loc_remove)
@@ -477,6 +505,18 @@ class MainWindow(QMainWindow):
             export_data = QAction('Export Data (.CSV)', self)
             export_data.triggered.connect(partial(cb.export, self, 'csv'))
             self.export_menu.addAction(export_data)
+            export_parquet = QAction('Export Data (.Parquet)', self)
+            export_parquet.triggered.connect(partial(cb.export, self, 'parquet'))
+            self.export_menu.addAction(export_parquet)
+            export_feather = QAction('Export Data (.Feather)', self)
+            export_feather.triggered.connect(partial(cb.export, self, 'feather'))
+            self.export_menu.addAction(export_feather)
+            export_events = QAction('Export Events (.CSV)', self)
+            export_events.triggered.connect(lambda: cb.export_events(self))
+            self.export_menu.addAction(export_events)
+            export_longrange = QAction('Long Range (Daily Summary / All Positions)', self)
+            export_longrange.triggered.connect(lambda: cb.call_long_range(self))
+            self.export_menu.addAction(export_longrange)
             export_figure = QAction('Export Figure (.PNG)', self)
             export_figure.triggered.connect(partial(cb.export, self, 'png'))
             self.export_menu.addAction(export_figure)
@@ -486,23 +526,19 @@ class MainWindow(QMainWindow):
             info_log = QAction('View Log File', self)
             info_log.triggered.connect(lambda: cb.show_errorlog(self, get_base_path))
             self.info_menu.addAction(info_log)
+            info_cache = QAction('Cache Statistics', self)
+            info_cache.triggered.connect(lambda: cb.show_cache_stats(self))
+            self.info_menu.addAction(info_cache)
             self.info_menu.addSeparator()
             info_about = QAction('About', self)
             info_about.triggered.connect(lambda: cb.show_about_dialog(self, get_base_path))
             self.info_menu.addAction(info_about)
 
-            # Initial Plot
-            cb.update_plot(self)
+            # Initial Plot (after the window is shown: computed in background, or read from cache)
+            QTimer.singleShot(0, lambda: cb.update_plot(self))
 
-            # Check if online
-            try:
-                Simbad.add_votable_fields('main_id')
-                self.isonline = True
-            except:
-                self.isonline = False
-                QMessageBox.warning(self, 'Offline', 'You are offline. Adding Stars / Locations features disabled')
-                self.star_menu.setEnabled(False)
-                self.loc_menu.setEnabled(False)
+            # Check if online (in background: Stars / Locations menus are enabled when the check succeeds)
+            cb.start_online_probe(self)
 
         except: # Fatal Error, DB restored
             cb.restore_db(self)
@@ -511,6 +547,9 @@ class MainWindow(QMainWindow):
 
 # --- MAIN APP EXECUTION ---
 if __name__ == '__main__':
+    # Worker processes of the compiled version must not start the GUI
+    multiprocessing.freeze_support()
+
     # Install global exception hook so uncaught exceptions are handled consistently
     sys.excepthook = qt_exception_hook
     app = SafeApplication(sys.argv)
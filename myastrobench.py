@@ -0,0 +1,591 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- PERFORMANCE BENCHMARKS (run as: python myastrobench.py <benchmark>) ---
+
+import sys
+import time
+import numpy as np
+import myastrolib as myal
+
+
+# Reference inputs (one day, default time step)
+BENCH_DAY = '2025-06-21'
+BENCH_STARS = {
+    'star': ['Sirius', 'Vega', 'Arcturus', 'Capella', 'Rigel', 'Betelgeuse'],
+    'ra0': [101.2872, 279.2347, 213.9153, 79.1723, 78.6345, 88.7929],
+    'dec0': [-16.7161, 38.7837, 19.1824, 45.9980, -8.2016, 7.4071],
+    'pm_ra': [-546.01, 200.94, -1093.39, 75.52, 1.31, 27.54],
+    'pm_dec': [-1223.07, 286.23, -2000.06, -427.11, 0.50, 11.30]
+}
+
+
+# --- Timer Routine (best of n runs) ---
+def timeit(func, n_runs=3):
+    t_best = np.inf
+    for _ in range(n_runs):
+        t0 = time.perf_counter()
+        func()
+        t_best = min(t_best, time.perf_counter() - t0)
+    return t_best
+
+
+# --- Build n locations on a regular lat/lon grid ---
+def bench_locations_input(n_loc):
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(-60, 60, n_loc).round(4).tolist()
+    lons = rng.uniform(-180, 180, n_loc).round(4).tolist()
+    return {
+        'loc_names': [f'{lat}, {lon}' for lat, lon in zip(lats, lons)],
+        'lats': lats,
+        'lons': lons,
+        'tz_names': ['UTC'] * n_loc
+    }
+
+
+# --- MULTI LOCATIONS: LOOP vs BATCHED ---
+def bench_locations(n_locs=(1, 2, 5, 10, 20, 50, 100)):
+    print(f'{"n_loc":>6} {"loop [s]":>10} {"batched [s]":>12} {"speedup":>8}')
+    for n_loc in n_locs:
+        kwargs = dict(
+            sel_ssbodies=['SUN', 'MOON'],
+            sel_stars=[], stars_ra0=[], stars_dec0=[], stars_pm_ra=[], stars_pm_dec=[],
+            sel_time='Greenwich', sel_days=[BENCH_DAY], t_min='00:00', t_max='00:00', t_delta=5,
+            **bench_locations_input(n_loc)
+        )
+        t_loop = timeit(lambda: myal.get_coords(**kwargs, batched=False), n_runs=1)
+        t_batch = timeit(lambda: myal.get_coords(**kwargs, batched=True), n_runs=1)
+        print(f'{n_loc:>6} {t_loop:>10.3f} {t_batch:>12.3f} {t_loop / t_batch:>7.1f}x')
+
+
+# --- FIXED STARS: ONE SKYCOORD PER STAR vs STACKED SKYCOORD ---
+def bench_stars(n_stars=(1, 6, 24, 96)):
+    import myastrotime as myat
+    loc = bench_locations_input(1)
+    t_ns, _, _ = myat.get_time_grid_ns([BENCH_DAY], '00:00', '00:00', 5, 'UTC')
+    t_utc = myat.get_time_utc(t_ns)
+    location = myal.EarthLocation(lat=loc['lats'][0] * myal.u.deg, lon=loc['lons'][0] * myal.u.deg)
+    altaz_frame = myal.AltAz(obstime=t_utc, location=location)
+
+    print(f'{"n_star":>6} {"per-star [s]":>13} {"stacked [s]":>12} {"stacked / per-star":>18}')
+    for n_star in n_stars:
+        rep = int(np.ceil(n_star / len(BENCH_STARS['star'])))
+        stars = {k: (v * rep)[:n_star] for k, v in BENCH_STARS.items() if k != 'star'}
+
+        def single():
+            for i in range(n_star):
+                radec = myal.get_stars_radec(*[[stars[k][i]] for k in ['ra0', 'dec0', 'pm_ra', 'pm_dec']])
+                radec[0].transform_to(altaz_frame)
+
+        def stacked():
+            radec = myal.get_stars_radec(stars['ra0'], stars['dec0'], stars['pm_ra'], stars['pm_dec'])
+            radec[:, np.newaxis].transform_to(altaz_frame)
+
+        t_single = timeit(single, n_runs=1)
+        t_stacked = timeit(stacked, n_runs=1)
+        print(f'{n_star:>6} {t_single:>13.3f} {t_stacked:>12.3f} {t_stacked / t_single:>17.1%}')
+
+
+# --- CHEBYSHEV EPHEMERIS: ACCURACY vs ASTROPY AND THROUGHPUT ---
+def bench_chebyshev(n_samples=2000, n_throughput=1_000_000):
+    import myastroephem as myae
+    ephem = myae.get_ephemeris()
+    rng = np.random.default_rng(0)
+    jd_min, jd_max = 2415020.5, 2488433.5 # 1900-01-01 ... 2100-12-31
+    t_tt = myal.Time(rng.uniform(jd_min, jd_max, n_samples), format='jd', scale='tt')
+
+    print(f'{"body":>8} {"max err [as]":>13} {"rms err [as]":>13} {"max dist err":>13} {"positions/s":>12}')
+    jd_thr = rng.uniform(jd_min, jd_max, n_throughput)
+    for body in ephem.bodies:
+
+        # Accuracy against astropy 'builtin' ephemeris
+        p_ref = myal.get_body(body.lower(), t_tt).cartesian.xyz.to_value(myal.u.km).T
+        p_cheb = ephem.position(body, t_tt.jd1, t_tt.jd2)
+        cross = np.linalg.norm(np.cross(p_ref, p_cheb), axis=1)
+        err = np.degrees(np.arctan2(cross, np.sum(p_ref * p_cheb, axis=1))) * 3600
+        d_err = np.abs(np.linalg.norm(p_cheb, axis=1) / np.linalg.norm(p_ref, axis=1) - 1)
+
+        # Throughput
+        t_eval = timeit(lambda: ephem.position(body, jd_thr))
+        print(f'{body:>8} {err.max():>13.3f} {np.sqrt(np.mean(err**2)):>13.3f} {d_err.max():>13.1e} '
+              f'{n_throughput / t_eval:>12.3g}')
+
+    # Astropy reference throughput
+    t_astropy = timeit(lambda: myal.get_body('moon', t_tt), n_runs=1)
+    print(f'Astropy get_body (MOON): {n_samples / t_astropy:.3g} positions/s')
+
+
+# --- FAST ANALYTIC MODE: ACCURACY vs ASTROPY AND MULTI-DAY TIMING ---
+def bench_fast(n_samples=3000, n_days=18):
+    import myastroephem as myae
+    rng = np.random.default_rng(0)
+    jd_utc = rng.uniform(2415020.5, 2488433.5, n_samples) # 1900-01-01 ... 2100-12-31
+    jd_tt = jd_utc + myae.delta_t(jd_utc) / 86400
+    t_tt = myal.Time(jd_tt, format='jd', scale='tt')
+    prec, nut, eps0, gast = myae.earth_orientation(jd_utc, jd_tt)
+
+    # Geocentric direction error (GCRS / J2000 equator)
+    print(f'{"body":>8} {"max err [deg]":>14} {"rms err [deg]":>14}')
+    for body in ['SUN', 'MOON', 'MERCURY', 'VENUS', 'MARS', 'JUPITER', 'SATURN']:
+        p_ref = myal.get_body(body.lower(), t_tt).cartesian.xyz.to_value(myal.u.km).T
+        p_fast = np.einsum('nji,nj->ni', nut @ prec, myae.analytic_position(body, jd_tt, eps0, nut))
+        cross = np.linalg.norm(np.cross(p_ref, p_fast), axis=1)
+        err = np.degrees(np.arctan2(cross, np.sum(p_ref * p_fast, axis=1)))
+        print(f'{body:>8} {err.max():>14.4f} {np.sqrt(np.mean(err**2)):>14.4f}')
+
+    # Multi Days plot, 1 minute step
+    sel_days = [f'{d:%Y-%m-%d}' for d in myal.pd.date_range(BENCH_DAY, periods=n_days)]
+    kwargs = dict(
+        sel_ssbodies=['SUN', 'MOON'], sel_stars=BENCH_STARS['star'][:1],
+        stars_ra0=BENCH_STARS['ra0'][:1], stars_dec0=BENCH_STARS['dec0'][:1],
+        stars_pm_ra=BENCH_STARS['pm_ra'][:1], stars_pm_dec=BENCH_STARS['pm_dec'][:1],
+        sel_time='Civil', sel_days=sel_days, t_min='00:00', t_max='00:00', t_delta=1,
+        loc_names=['Bologna, Italy'], lats=[44.4938], lons=[11.3426], tz_names=['Europe/Rome']
+    )
+    t_astropy = timeit(lambda: myal.get_coords(**kwargs, batched=True), n_runs=1)
+    t_fast = timeit(lambda: myal.get_coords(**kwargs, ephemeris='fast'))
+    print(f'{n_days} days at 1 min: astropy {t_astropy:.2f} s, fast {t_fast:.3f} s ({t_astropy / t_fast:.0f}x)')
+
+
+# --- PROCESS POOL: SPEEDUP vs NUMBER OF WORKER PROCESSES ---
+def bench_parallel(n_loc=6, n_days=6):
+    import os
+    n_cpu = os.cpu_count() or 1
+    sel_days = [f'{d:%Y-%m-%d}' for d in myal.pd.date_range(BENCH_DAY, periods=n_days)]
+    kwargs = dict(
+        sel_ssbodies=['SUN', 'MOON', 'MARS'],
+        sel_stars=BENCH_STARS['star'], stars_ra0=BENCH_STARS['ra0'], stars_dec0=BENCH_STARS['dec0'],
+        stars_pm_ra=BENCH_STARS['pm_ra'], stars_pm_dec=BENCH_STARS['pm_dec'],
+        sel_time='Civil', sel_days=sel_days, t_min='00:00', t_max='00:00', t_delta=1,
+        **bench_locations_input(n_loc)
+    )
+    print(f'{n_loc} locations x {n_days} days, 1 min step, {n_cpu} cores')
+    print(f'{"workers":>8} {"time [s]":>10} {"speedup":>8}')
+    t_serial = timeit(lambda: myal.get_coords(**kwargs, batched=False), n_runs=1)
+    print(f'{"serial":>8} {t_serial:>10.2f} {1:>7.1f}x')
+    for n_workers in sorted({n for n in [2, 4, 8, 16, 32] if n <= n_cpu} | {n_cpu} - {1}):
+        myal.get_process_pool(n_workers).submit(int).result() # Pool started outside the timing
+        t_par = timeit(lambda: myal.get_coords(**kwargs, batched=False, n_workers=n_workers), n_runs=1)
+        print(f'{n_workers:>8} {t_par:>10.2f} {t_serial / t_par:>7.1f}x')
+
+
+# --- EVENT FINDER: EVALUATIONS PER EVENT AND PRECISION ---
+def bench_events(n_days=7):
+    sel_days = [f'{d:%Y-%m-%d}' for d in myal.pd.date_range(BENCH_DAY, periods=n_days)]
+    lat, lon = 44.4938, 11.3426
+    kwargs = dict(
+        sel_ssbodies=['SUN', 'MOON', 'MARS'], sel_stars=[], stars_ra0=[], stars_dec0=[], stars_pm_ra=[], stars_pm_dec=[],
+        loc_names=['Bologna, Italy'], lats=[lat], lons=[lon], tz_names=['Europe/Rome'],
+        sel_time='Civil', sel_days=sel_days
+    )
+    t_events = timeit(lambda: myal.get_events(**kwargs), n_runs=1)
+    df_events = myal.get_events(**kwargs)
+
+    # Precision: event function must change sign within +/- 1 s of each event
+    n_ok = 0
+    for _, ev in df_events.iterrows():
+        t = ev['t_event'].tz_convert('UTC').tz_localize(None).to_datetime64().astype('datetime64[ns]')
+        pos = myal.get_positions(ev['object'], (), lat, lon, np.array([t - np.timedelta64(1, 's'), t + np.timedelta64(1, 's')]))
+        quantity, level = [(q, l) for q, l, up, down in myal.get_event_specs(ev['object']) if ev['event'] in [up, down]][0]
+        f = myal.get_event_function(pos, quantity, level)
+        n_ok += np.sign(f[0]) != np.sign(f[1])
+    print(f'{len(df_events)} events in {n_days} days: {t_events:.2f} s, '
+          f'evaluations per event {df_events["n_eval"].mean():.1f} (max {df_events["n_eval"].max()}), '
+          f'within 1 s: {n_ok}/{len(df_events)}')
+
+
+# --- ADAPTIVE SAMPLING: POINT COUNT AND FIDELITY vs UNIFORM 1 MIN GRID ---
+def bench_adaptive(n_days=3):
+    sel_days = [f'{d:%Y-%m-%d}' for d in myal.pd.date_range(BENCH_DAY, periods=n_days)]
+    kwargs = dict(
+        sel_ssbodies=['SUN', 'MOON', 'MARS'],
+        sel_stars=BENCH_STARS['star'][:2], stars_ra0=BENCH_STARS['ra0'][:2], stars_dec0=BENCH_STARS['dec0'][:2],
+        stars_pm_ra=BENCH_STARS['pm_ra'][:2], stars_pm_dec=BENCH_STARS['pm_dec'][:2],
+        loc_names=['Bologna, Italy'], lats=[44.4938], lons=[11.3426], tz_names=['Europe/Rome'],
+        sel_time='Civil', sel_days=sel_days, t_min='00:00', t_max='00:00', t_delta=1
+    )
+    t_uniform = timeit(lambda: myal.get_coords(**kwargs, batched=True), n_runs=1)
+    t_adaptive = timeit(lambda: myal.get_coords_adaptive(**kwargs), n_runs=1)
+    df_uniform = myal.get_coords(**kwargs, batched=True)
+    df_adaptive = myal.get_coords_adaptive(**kwargs)
+
+    # Largest deviation of the linearly interpolated adaptive curves from the uniform samples
+    x_u = df_uniform['t_current'].values.astype('datetime64[ns]').astype('int64')
+    x_a = df_adaptive['t_current'].values.astype('datetime64[ns]').astype('int64')
+    err_max = 0
+    for c in df_uniform.columns.difference(myal.TIME_COLUMNS):
+        period = 360 if c.endswith('azimuth_deg') else 24 if c.endswith('_ha') else None
+        y_a = df_adaptive[c].values if period is None else np.unwrap(df_adaptive[c].values, period=period)
+        err = np.interp(x_u, x_a, y_a) - df_uniform[c].values
+        if period is not None:
+            err = (err + period / 2) % period - period / 2
+        err_max = max(err_max, np.abs(err).max() * (15 if period == 24 else 1))
+    print(f'uniform: {len(df_uniform)} points, {t_uniform:.2f} s')
+    print(f'adaptive: {len(df_adaptive)} points ({len(df_uniform) / len(df_adaptive):.1f}x fewer), '
+          f'{t_adaptive:.2f} s, max deviation {err_max:.3f} deg')
+
+
+# --- EXPORT: FILE SIZE AND WRITE TIME PER FORMAT ---
+def bench_export(n_loc=5, n_days=10):
+    import os
+    import tempfile
+    import myastroexport as myax
+    sel_days = [f'{d:%Y-%m-%d}' for d in myal.pd.date_range(BENCH_DAY, periods=n_days)]
+    kwargs = dict(
+        sel_ssbodies=['SUN', 'MOON', 'MARS'], sel_stars=[], stars_ra0=[], stars_dec0=[], stars_pm_ra=[], stars_pm_dec=[],
+        sel_time='Civil', sel_days=sel_days, t_min='00:00', t_max='00:00', t_delta=1,
+        **bench_locations_input(n_loc)
+    )
+    df_out = myal.get_coords(**kwargs, batched=True, ephemeris='fast')
+    print(f'{len(df_out)} rows, {df_out.memory_usage(deep=True).sum() / 1024**2:.1f} MB in memory')
+    print(f'{"format":>8} {"write [s]":>10} {"size [MB]":>10}')
+    formats = [f for f in myax.EXPORT_FORMATS if f == 'csv' or myax.has_arrow()]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for format in formats:
+            file_path = os.path.join(tmp_dir, f'bench.{format}')
+            t_write = timeit(lambda: myax.write_frame(df_out, file_path, format), n_runs=1)
+            print(f'{format:>8} {t_write:>10.2f} {os.path.getsize(file_path) / 1024**2:>10.1f}')
+
+        # Streamed export (myastrolib.iter_coords, several chunks), read back and compared with the in-memory frame
+        for format in [f for f in formats if f != 'csv']:
+            file_path = os.path.join(tmp_dir, f'stream.{format}')
+            n_rows = myax.write_chunks(myal.iter_coords(**kwargs, ephemeris='fast', max_rows=len(df_out) // 4 + 1),
+                                       file_path)
+            df_back = myal.pd.read_feather(file_path) if format == 'feather' else myal.pd.read_parquet(file_path)
+            keys = ['loc_sel', 'day_sel'] # Chunks are split by day: rows compared in (location, day) order
+            df_back = df_back.sort_values(keys, kind='stable')
+            df_ref = df_out.astype({k: str for k in keys}).sort_values(keys, kind='stable')
+            same = (n_rows == len(df_back) == len(df_ref) and
+                    (df_back[keys].to_numpy() == df_ref[keys].to_numpy()).all() and
+                    np.allclose(df_back['MOON_altitude_deg'], df_ref['MOON_altitude_deg']))
+            print(f'{format:>8} streamed in 4 chunks: {n_rows} rows, read back {"OK" if same else "DIFFERENT"}')
+    if not myax.has_arrow():
+        print('pyarrow not installed: Parquet / Feather skipped')
+
+
+# --- OUTPUT STRUCTURE: WIDE FLOAT64 CONCAT vs COMPACT FLOAT32 CONTAINER ---
+def bench_result(n_loc=10, n_days=10):
+    import tracemalloc
+    pd = myal.pd
+    sel_days = [f'{d:%Y-%m-%d}' for d in pd.date_range(BENCH_DAY, periods=n_days)]
+    time_args = dict(sel_time='Civil', sel_days=sel_days, t_min='00:00', t_max='00:00', t_delta=1,
+                     **bench_locations_input(n_loc))
+    time_args['tz_names'] = ['Europe/Rome', 'America/New_York'] * (n_loc // 2) + ['UTC'] * (n_loc % 2)
+    result = myal.get_coords(
+        sel_ssbodies=['SUN', 'MOON', 'MARS'],
+        sel_stars=BENCH_STARS['star'], stars_ra0=BENCH_STARS['ra0'], stars_dec0=BENCH_STARS['dec0'],
+        stars_pm_ra=BENCH_STARS['pm_ra'], stars_pm_dec=BENCH_STARS['pm_dec'],
+        **time_args, ephemeris='fast', as_frame=False)
+
+    # Previous assembly: per-row labels, one float64 DataFrame per object, concat along columns then rows
+    def wide_concat():
+        df_s = []
+        for nl, (lon, loc_name, tz_name) in enumerate(zip(time_args['lons'], time_args['loc_names'], time_args['tz_names'])):
+            curr_tz = myal.get_time_zone('Civil', tz_name, lon)
+            t_current, n_day = myal.get_time_grid(sel_days, '00:00', '00:00', 1, curr_tz)
+            df_s1 = [myal.get_time_columns(t_current, n_day, loc_name, nl + 1)]
+            for obj in result.objects:
+                values = result.object_view(obj, nl).astype(float)
+                df_s1.append(pd.DataFrame(
+                    {f'{obj}_{q}': v for q, v in zip(myal.OBJECT_COLUMNS, values)}, index=df_s1[0].index))
+            df_s.append(pd.concat(df_s1, axis=1))
+        return pd.concat(df_s, axis=0)
+
+    # Compact container: time grid, labels as codes, preallocated float32 block
+    def compact():
+        compact_result = myal.get_flat_time_grid(**time_args, objects=result.objects)[0]
+        compact_result.data[:] = result.data
+        return compact_result
+
+    def measure(func):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        out = func()
+        t_build = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return out, t_build, peak
+
+    print(f'{len(result)} rows, {len(result.objects)} objects, {n_loc} locations x {n_days} days')
+    print(f'{"structure":>24} {"build [s]":>10} {"peak [MB]":>10} {"size [MB]":>10}')
+    df_wide, t_wide, peak_wide = measure(wide_concat)
+    print(f'{"wide float64 DataFrame":>24} {t_wide:>10.2f} {peak_wide / 1024**2:>10.1f} '
+          f'{df_wide.memory_usage(deep=True).sum() / 1024**2:>10.1f}')
+    del df_wide
+    compact_result, t_compact, peak_compact = measure(compact)
+    print(f'{"CoordsResult":>24} {t_compact:>10.2f} {peak_compact / 1024**2:>10.1f} {compact_result.nbytes / 1024**2:>10.1f}')
+    df_view, t_frame, peak_frame = measure(compact_result.to_frame)
+    print(f'{"CoordsResult.to_frame":>24} {t_frame:>10.2f} {peak_frame / 1024**2:>10.1f} '
+          f'{df_view.memory_usage(deep=True).sum() / 1024**2:>10.1f}')
+
+
+# --- TIME GRID: PER-DAY pd.date_range + PYTHON DATETIMES vs NUMPY GRID ON JULIAN DATES ---
+def bench_timegrid(n_days=730, t_delta=1):
+    import myastrotime as myat
+    pd = myal.pd
+    sel_days = [f'{d:%Y-%m-%d}' for d in pd.date_range('2024-01-01', periods=n_days)]
+
+    # Previous builder: one date_range per day, concatenated, then Time from Python datetimes
+    def date_ranges(curr_tz):
+        t_current_s = [pd.date_range(
+            start=f'{sel_day} 00:00', end=f'{pd.to_datetime(sel_day) + pd.Timedelta(days=1):%Y-%m-%d} 00:00',
+            freq=f'{t_delta}min', tz=curr_tz, nonexistent='shift_forward') for sel_day in sel_days]
+        t_current = pd.concat([r.to_series() for r in t_current_s]).index
+        return myal.Time(t_current.to_pydatetime())
+
+    def numpy_grid(curr_tz):
+        t_ns, _, _ = myat.get_time_grid_ns(sel_days, '00:00', '00:00', t_delta, curr_tz)
+        return myat.get_time_utc(t_ns)
+
+    print(f'{n_days} days, {t_delta} min step')
+    print(f'{"time zone":>17} {"date_range [s]":>15} {"numpy [s]":>10} {"speedup":>8} {"max diff [us]":>14}')
+    for curr_tz in ['Europe/Rome', 'Australia/Sydney', 0]:
+        t_old = timeit(lambda: date_ranges(curr_tz), n_runs=1)
+        t_new = timeit(lambda: numpy_grid(curr_tz), n_runs=1)
+        diff_us = np.abs((date_ranges(curr_tz) - numpy_grid(curr_tz)).to_value('s')).max() * 1e6
+        print(f'{str(curr_tz):>17} {t_old:>15.2f} {t_new:>10.3f} {t_old / t_new:>7.0f}x {diff_us:>14.3f}')
+
+
+# --- TIME ZONES: NEW TimezoneFinder + ZoneInfo PER LOCATION vs SHARED SERVICE (BATCH, MEMOISED) ---
+def bench_timezones(n_points=(10, 100, 1000, 10000), seed=0):
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+    from timezonefinder import TimezoneFinder
+    import myastrotz as myatz
+
+    # Previous lookup: one TimezoneFinder and one ZoneInfo offset per location
+    def per_location(lats, lons):
+        out = []
+        for lat, lon in zip(lats, lons):
+            tz_name = TimezoneFinder().timezone_at(lat=lat, lng=lon)
+            month = 1 if lat >= 0 else 7
+            out.append(ZoneInfo(tz_name).utcoffset(datetime(datetime.now().year, month, 1)).total_seconds() / 3600)
+        return out
+
+    rng = np.random.default_rng(seed)
+    myatz.get_finder() # Polygons loaded once per process
+    print(f'{"points":>8} {"per location [s]":>17} {"batch [s]":>10} {"memoised [s]":>13} {"speedup":>8} {"same":>5}')
+    for n in n_points:
+        lats, lons = rng.uniform(-60, 70, n), rng.uniform(-180, 180, n)
+        n_old = min(n, 1000) # Per-location timing extrapolated above 1000 points
+        t_old = timeit(lambda: per_location(lats[:n_old], lons[:n_old]), n_runs=1) * n / n_old
+        myatz.get_cell_timezone.cache_clear()
+        t_new = timeit(lambda: myatz.resolve_timezones(lats, lons), n_runs=1)
+        t_memo = timeit(lambda: myatz.resolve_timezones(lats, lons))
+        same = np.allclose(per_location(lats[:n_old], lons[:n_old]), myatz.resolve_timezones(lats, lons)[1][:n_old])
+        print(f'{n:>8} {t_old:>17.3f} {t_new:>10.3f} {t_memo:>13.4f} {t_old / t_new:>7.0f}x {str(same):>5}')
+
+    # Cells without a time zone: nautical zone from the longitude, as TimezoneFinder gives at sea (Etc/GMT zones)
+    lats, lons = rng.uniform(-60, 60, 20000), rng.uniform(-179.9, 179.9, 20000)
+    finder = myatz.get_finder()
+    at_sea = [(lon, tz) for lat, lon in zip(lats, lons)
+              if (tz := finder.timezone_at(lat=lat, lng=lon) or '').startswith('Etc/GMT')]
+    n_same = sum(myatz.get_nautical_timezone(lon) == tz for lon, tz in at_sea)
+    print(f'Nautical zones: {n_same} / {len(at_sea)} as TimezoneFinder at sea')
+
+    # Batch with cells without a time zone (TimezoneFinder returning None): nautical zones, no error
+    get_finder = myatz.get_finder
+    myatz.get_finder = lambda: type('NoTimezone', (), {'timezone_at': lambda self, lat, lng: None})()
+    myatz.get_cell_timezone.cache_clear()
+    try:
+        tz_names, fixed_utc, _ = myatz.resolve_timezones([10.0, -20.0, 0.0], [31.0, -100.0, 179.0])
+    finally:
+        myatz.get_finder = get_finder
+        myatz.get_cell_timezone.cache_clear()
+    print(f'No time zone found: {tz_names.tolist()} {fixed_utc.tolist()}')
+
+
+# --- BULK STAR IMPORT: SEQUENTIAL vs POOLED QUERIES, AGAINST A LOCAL MOCK OF SIMBAD (TAP) / VIZIER (ASU-TSV) ---
+# The mock answers after latency_s; every fail_every-th request first gets a 503 (retried by the client)
+def start_mock_cds(latency_s=0.05, fail_every=10):
+    import re
+    import threading
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    from urllib.parse import urlparse, parse_qs
+    counter = {'n': 0}
+    lock = threading.Lock()
+
+    class MockCDS(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1' # Keep-alive (sessions reuse connections)
+
+        def reply(self, code, text):
+            body = text.encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            time.sleep(latency_s)
+            with lock:
+                counter['n'] += 1
+                fail = fail_every and counter['n'] % fail_every == 0
+            if fail:
+                return self.reply(503, 'busy')
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path == '/simbad':
+                name = re.search(r"ident.id = '(.*)'", query['QUERY'][0]).group(1)
+                return self.reply(200, 'main_id\n' + ('' if 'Unknown' in name else f'"* {name}"\n'))
+            n = int(re.sub(r'\D', '', query['-c'][0]) or 0)
+            return self.reply(200, '#\n#Mock\nRAICRS\tDEICRS\tpmRA\tpmDE\ndeg\tdeg\tmas/yr\tmas/yr\n'
+                                   f'-\t-\t-\t-\n{n % 360:.4f}\t{n % 90:.4f}\t1.5\t-2.5\n')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockCDS)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def bench_bulkstars(n_stars=120, latency_s=0.05, n_workers=(1, 2, 6, 12)):
+    import myastrobulk as myabk
+    server, base_url = start_mock_cds(latency_s)
+    names = [f'Mock Star {n}' for n in range(n_stars - n_stars // 10)] + [f'Unknown {n}' for n in range(n_stars // 10)]
+    urls = dict(simbad_url=f'{base_url}/simbad', vizier_url=f'{base_url}/vizier')
+    print(f'{n_stars} stars, mock latency {latency_s * 1000:.0f} ms per request, 1 request in 10 retried')
+    print(f'{"workers":>8} {"time [s]":>9} {"stars/s":>8} {"found":>6}')
+    for n in n_workers:
+        t0 = time.perf_counter()
+        results = myabk.resolve_stars(names, n_workers=n, **urls)
+        t_run = time.perf_counter() - t0
+        n_found = sum(star_info is not None for star_info, _ in results.values())
+        print(f'{n:>8} {t_run:>9.2f} {n_stars / t_run:>8.1f} {n_found:>6}')
+    server.shutdown()
+
+
+# --- DB EDITS: WHOLE TABLE REWRITTEN (to_sql replace) vs TARGETED INSERT / DELETE, BY CATALOGUE SIZE ---
+def bench_dbedit(n_rows=(100, 10_000, 100_000), n_edits=20):
+    import os
+    import sqlite3
+    import tempfile
+    import myastrodb as myadb
+    pd = myal.pd
+
+    print(f'{"locations":>10} {"to_sql [ms]":>12} {"insert [ms]":>12} {"delete [ms]":>12}')
+    for n in n_rows:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, 'bench.db')
+            myadb.restore_db(db_path)
+            rows = [dict(location=f'Site {k}', latitude=k % 90, longitude=k % 180, time_zone='UTC', civil_utc=0.0,
+                         local_utc=0.0) for k in range(n)]
+            myadb.insert_rows(db_path, 'LOCATIONS', rows)
+            df_loc, _ = myadb.read_db(db_path)
+
+            # Previous persistence: the whole table rewritten at each edit
+            def rewrite():
+                with sqlite3.connect(db_path) as conn:
+                    df_loc.to_sql('LOCATIONS_COPY', conn, if_exists='replace', index=False)
+                conn.close()
+
+            new_rows = [dict(rows[0], location=f'New {k}') for k in range(n_edits)]
+            t_old = timeit(lambda: [rewrite() for _ in range(n_edits)], n_runs=1) / n_edits
+            t_ins = timeit(lambda: [myadb.insert_rows(db_path, 'LOCATIONS', [row]) for row in new_rows], n_runs=1)
+            t_del = timeit(lambda: [myadb.delete_rows(db_path, 'LOCATIONS', [row['location']]) for row in new_rows],
+                           n_runs=1)
+            print(f'{n:>10} {t_old * 1000:>12.2f} {t_ins / n_edits * 1000:>12.3f} {t_del / n_edits * 1000:>12.3f}')
+            myadb.close_connection(db_path)
+
+
+# --- REGISTRY: LOOKUP OF A STAR BY NAME (DATAFRAME SCAN VS CATALOGUE REGISTRY), ADD / REMOVE ---
+def bench_registry(n_rows=(100, 10_000, 100_000), n_lookups=200):
+    import myastrodb as myadb
+    import myastroreg as myarg
+    pd = myal.pd
+
+    print(f'{"stars":>10} {"scan [us]":>10} {"registry [us]":>14} {"add [us]":>10} {"remove [us]":>12}')
+    for n in n_rows:
+        df_stars = pd.DataFrame(dict(id=range(n), star=[f'Star {k:06d}' for k in range(n)],
+                                     vizier_name=[f'HIP {k}' for k in range(n)],
+                                     ra0=0.0, dec0=0.0, pm_ra=0.0, pm_dec=0.0))
+        df_loc = pd.DataFrame(columns=['id', *myadb.TABLE_COLUMNS['LOCATIONS']])
+        cat_stars, cat_loc = myarg.get_catalogues(df_loc, df_stars)
+        names = [f'Star {k:06d}' for k in range(0, n, max(1, n // n_lookups))]
+        t_scan = timeit(lambda: [df_stars.loc[df_stars['star'] == name].iloc[0] for name in names], n_runs=1)
+        t_reg = timeit(lambda: myadb.get_selection_args(cat_stars, cat_loc, names, [], []), n_runs=3)
+        new_rows = [dict(id=n + k, star=f'New {k}', vizier_name=f'HIP {n + k}', ra0=0.0, dec0=0.0, pm_ra=0.0,
+                         pm_dec=0.0) for k in range(n_lookups)]
+        t_add = timeit(lambda: cat_stars.add(new_rows), n_runs=1)
+        t_rem = timeit(lambda: cat_stars.remove([row['star'] for row in new_rows]), n_runs=1)
+        print(f'{n:>10} {t_scan / len(names) * 1e6:>10.1f} {t_reg / len(names) * 1e6:>14.2f} '
+              f'{t_add / n_lookups * 1e6:>10.2f} {t_rem / n_lookups * 1e6:>12.2f}')
+
+
+# --- STARTUP: IMPORT-TIME PROFILE OF THE GUI, BUDGET CHECK (FAILS IF EXCEEDED) ---
+STARTUP_BUDGET_S = 2.5
+STARTUP_DEFERRED = [ # Must not be imported at startup
+    'geopy', 'timezonefinder', 'astroquery', 'plotly.express', 'astropy', 'myastrolib',
+    'callbacks.add_stars', 'callbacks.import_stars', 'callbacks.add_locations', 'callbacks.remove_stars',
+    'callbacks.import_locations', 'callbacks.remove_locations', 'callbacks.long_range'
+]
+
+
+def bench_startup(budget_s=STARTUP_BUDGET_S, n_runs=3, n_top=15, module='main'):
+    import os
+    import subprocess
+
+    # Fresh interpreter each run (best run compared with the budget)
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    t_runs = []
+    for _ in range(n_runs):
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                              cwd=os.path.dirname(os.path.abspath(__file__)), env=env, capture_output=True, text=True)
+        t_runs.append(time.perf_counter() - t0)
+        if proc.returncode != 0:
+            print(proc.stderr.strip().splitlines()[-1])
+            return False
+
+    # Import-time report: heaviest imports done directly by the project modules
+    imports = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, t_cumul, name = line[len('import time:'):].split('|')
+        imports.append((int(t_cumul) / 1e6, len(name) - len(name.lstrip()), name.strip()))
+    print(f'{"module":>36} {"cumulative [s]":>15}')
+    for t_cumul, depth, name in sorted([i for i in imports if i[1] <= 3], reverse=True)[:n_top]:
+        print(f'{name:>36} {t_cumul:>15.3f}')
+
+    t_best = min(t_runs)
+    deferred = sorted({n for _, _, n in imports for d in STARTUP_DEFERRED if n == d or n.startswith(d + '.')})
+    print(f'import {module}: {t_best:.2f} s (best of {n_runs}), budget {budget_s:.2f} s')
+    if deferred:
+        print(f'Imported at startup (should be deferred): {", ".join(deferred)}')
+    ok = (t_best <= budget_s) and not deferred
+    print('PASS' if ok else 'FAIL')
+    return ok
+
+
+# Available benchmarks
+BENCHMARKS = {
+    'locations': bench_locations,
+    'stars': bench_stars,
+    'chebyshev': bench_chebyshev,
+    'fast': bench_fast,
+    'parallel': bench_parallel,
+    'events': bench_events,
+    'adaptive': bench_adaptive,
+    'export': bench_export,
+    'result': bench_result,
+    'timegrid': bench_timegrid,
+    'timezones': bench_timezones,
+    'bulkstars': bench_bulkstars,
+    'dbedit': bench_dbedit,
+    'registry': bench_registry,
+    'startup': bench_startup
+}
+
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or list(BENCHMARKS)
+    failed = []
+    for name in names:
+        print(f'=== {name} ===')
+        if BENCHMARKS[name]() is False: # Checks (e.g. startup budget) return False on failure
+            failed.append(name)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,234 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- BULK IMPORT: NAMES RESOLVED CONCURRENTLY (BOUNDED THREAD POOL, ONE HTTP SESSION PER WORKER) ---
+# Stars: offline catalogue first, then Simbad (TAP, main identifier) and Vizier (ASU, Hipparcos coordinates).
+# Locations: lat / lon as given, else offline gazetteer, then Nominatim (throttled); time zones in one batch.
+# Services are plain HTTP endpoints (base URLs are arguments: a local mock server can stand in for them).
+# Failed requests (connection errors, 429 / 5xx) are retried with exponential backoff.
+
+import io
+import re
+import csv
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import myastrocat as myacat
+import myastrogeo as myageo
+import myastrotz as myatz
+
+SIMBAD_TAP_URL = 'https://simbad.cds.unistra.fr/simbad/sim-tap/sync'
+VIZIER_ASU_URL = 'https://vizier.cds.unistra.fr/viz-bin/asu-tsv'
+HIP_CATALOG = 'I/239/hip_main'
+HIP_COLUMNS = ['RAICRS', 'DEICRS', 'pmRA', 'pmDE']
+
+N_WORKERS = 6 # Concurrent queries (CDS services throttle clients sending too many)
+HTTP_TIMEOUT = 10 # s
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.5 # s, doubled at each retry
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+thread_data = threading.local()
+
+# Location rows: 'name', 'lat, lon' or 'name; lat; lon' (columns also separated by ',' or tab)
+NUMBER = r'([+-]?(?:\d+(?:\.\d*)?|\.\d+))'
+LATLON_PATTERN = re.compile(rf'^{NUMBER}\s*,\s*{NUMBER}$')
+NAMED_LATLON_PATTERN = re.compile(rf'^(.*?)\s*[;,\t]\s*{NUMBER}\s*[;,\t]\s*{NUMBER}$')
+HEADERS = ['star', 'name', 'location']
+
+
+# --- HTTP SESSION OF THE CURRENT WORKER THREAD (KEEP-ALIVE CONNECTIONS, RETRIES) ---
+def get_session():
+    session = getattr(thread_data, 'session', None)
+    if session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        retry = Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF, status_forcelist=RETRY_STATUS)
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(max_retries=retry))
+        session.mount('https://', HTTPAdapter(max_retries=retry))
+        session.headers['User-Agent'] = 'astrotracker'
+        thread_data.session = session
+    return session
+
+
+def http_get(url, params):
+    response = get_session().get(url, params=params, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.text
+
+
+# --- SIMBAD: MAIN IDENTIFIER (SAME AS Simbad.query_object(...)['main_id']), None IF NOT FOUND ---
+def query_simbad_id(sel_star, simbad_url=SIMBAD_TAP_URL):
+    adql = ('SELECT basic.main_id FROM basic JOIN ident ON basic.oid = ident.oidref '
+            f"WHERE ident.id = '{sel_star.replace(chr(39), chr(39) * 2)}'")
+    text = http_get(simbad_url, {'REQUEST': 'doQuery', 'LANG': 'ADQL', 'FORMAT': 'csv', 'QUERY': adql})
+    rows = list(csv.reader(io.StringIO(text)))
+    return rows[1][0].replace('*', '').strip() if len(rows) > 1 and rows[1] else None
+
+
+# --- VIZIER: HIPPARCOS RA / DEC / PROPER MOTIONS OF THE NEAREST STAR, None IF NOT FOUND ---
+# ASU-TSV output: '#' comments, then column names, units, dashes and data rows
+def query_vizier_hip(sel_star, vizier_url=VIZIER_ASU_URL):
+    text = http_get(vizier_url, {
+        '-source': HIP_CATALOG, '-c': sel_star, '-out': ','.join(HIP_COLUMNS), '-out.max': 1, '-sort': '_r'
+    })
+    lines = [line for line in text.splitlines() if line.strip() and not line.startswith('#')]
+    if len(lines) < 4:
+        return None
+    row = dict(zip(lines[0].split('\t'), lines[3].split('\t')))
+    try:
+        return tuple(float(row[col]) for col in HIP_COLUMNS)
+    except (KeyError, ValueError):
+        return None
+
+
+# --- ONE STAR: ((vizier_name, ra0, dec0, pm_ra, pm_dec) or None, status) ---
+def resolve_star(sel_star, online=True, simbad_url=SIMBAD_TAP_URL, vizier_url=VIZIER_ASU_URL):
+    star_info = myacat.find_star(sel_star)
+    if star_info is not None:
+        return star_info, 'OK'
+    if not online:
+        return None, 'NOT FOUND'
+    import requests
+    try:
+        vizier_name = query_simbad_id(sel_star, simbad_url)
+        coords = query_vizier_hip(sel_star, vizier_url) if vizier_name else None
+    except requests.RequestException as e:
+        return None, f'ERROR ({type(e).__name__})'
+    if coords is None:
+        return None, 'NOT FOUND'
+    return (vizier_name, *coords), 'OK'
+
+
+# --- BOUNDED THREAD POOL: {item: func(item) or the exception raised} ---
+# progress(n_done, n_total) is called as results arrive; an exception raised by it cancels the pending calls
+def run_concurrent(func, items, n_workers=N_WORKERS, progress=None, n_done=0, n_total=None):
+    n_total = len(items) if n_total is None else n_total
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, n_workers)) as pool:
+        futures = {pool.submit(func, item): item for item in items}
+        try:
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = e
+                n_done += 1
+                if progress is not None:
+                    progress(n_done, n_total)
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    return results
+
+
+def get_error_status(e):
+    return f'ERROR ({type(e).__name__})'
+
+
+# --- MANY STARS: {name: (star info or None, status)} in input order ---
+def resolve_stars(names, online=True, n_workers=N_WORKERS, progress=None,
+                  simbad_url=SIMBAD_TAP_URL, vizier_url=VIZIER_ASU_URL):
+    names = list(dict.fromkeys(name.strip() for name in names if name.strip()))
+    results = run_concurrent(partial(resolve_star, online=online, simbad_url=simbad_url, vizier_url=vizier_url),
+                             names, n_workers, progress)
+    return {name: (None, get_error_status(results[name])) if isinstance(results[name], Exception) else results[name]
+            for name in names}
+
+
+# --- ONE LOCATION ROW: (name, lat, lon), lat / lon None if not given ---
+def parse_location_row(line):
+    line = line.strip()
+    m = LATLON_PATTERN.match(line)
+    if m:
+        return line, float(m.group(1)), float(m.group(2))
+    m = NAMED_LATLON_PATTERN.match(line)
+    if m:
+        lat, lon = float(m.group(2)), float(m.group(3))
+        return m.group(1).strip().strip('"') or f'{lat}, {lon}', lat, lon
+    return line.rstrip(';,\t').strip().strip('"'), None, None
+
+
+# --- MANY LOCATIONS: {name: ((lat, lon, tz_name, fixed_utc, local_utc) or None, status)} in input order ---
+# Status as myastrolib.get_location_coord: OK, NOT FOUND, Out of Range (or ERROR for failed online lookups)
+def resolve_locations(rows, online=True, n_workers=N_WORKERS, progress=None):
+    unique_rows = {}
+    for row in rows:
+        if row[0]:
+            unique_rows.setdefault(row[0], row) # First row of each name
+    rows = list(unique_rows.values())
+    results = {}
+    found = {} # name -> (lat, lon, tz_name or None)
+
+    # Coordinates given or in the gazetteer (with time zone)
+    to_geocode = []
+    for name, lat, lon in rows:
+        if lat is not None:
+            if -90 <= lat <= 90 and -180 <= lon <= 180:
+                found[name] = (lat, lon, None)
+            else:
+                results[name] = (None, 'Out of Range')
+            continue
+        location = myageo.find_location(name)
+        if location is not None:
+            found[name] = location
+        elif online:
+            to_geocode.append(name)
+        else:
+            results[name] = (None, 'NOT FOUND')
+    if progress is not None:
+        progress(len(rows) - len(to_geocode), len(rows))
+
+    # Other names online (concurrent requests, started at the rate allowed by Nominatim)
+    geocoded = run_concurrent(myageo.geocode_online, to_geocode, n_workers, progress,
+                              n_done=len(rows) - len(to_geocode), n_total=len(rows))
+    for name, location in geocoded.items():
+        if isinstance(location, Exception):
+            results[name] = (None, get_error_status(location))
+        elif location is None:
+            results[name] = (None, 'NOT FOUND')
+        else:
+            found[name] = (*location, None)
+
+    # Time zones, fixed / local UTC (one batch)
+    if found:
+        lats, lons, tz_names = zip(*found.values())
+        tz_names, fixed_utc, local_utc = myatz.resolve_timezones(lats, lons, tz_names=tz_names)
+        for n, (name, (lat, lon, _)) in enumerate(found.items()):
+            results[name] = ((lat, lon, tz_names[n], float(fixed_utc[n]), float(local_utc[n])), 'OK')
+    return {row[0]: results[row[0]] for row in rows}
+
+
+# --- NAMES FROM A TEXT / CSV FILE (FIRST COLUMN; '#' COMMENTS AND A 'star' / 'name' HEADER SKIPPED) ---
+def read_names(path):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        text = f.read()
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=',;\t')
+    except csv.Error: # One name per line
+        dialect = 'excel'
+    names = []
+    for row in csv.reader(io.StringIO(text), dialect):
+        if row and row[0].strip() and not row[0].startswith('#'):
+            names.append(row[0].strip())
+    if names and names[0].lower() in HEADERS:
+        names = names[1:]
+    return names
+
+
+# --- LOCATION ROWS FROM PASTED TEXT OR A TEXT / CSV FILE ('#' COMMENTS AND A HEADER SKIPPED) ---
+def parse_location_rows(text):
+    lines = [line for line in text.splitlines() if line.strip() and not line.lstrip().startswith('#')]
+    if lines and re.split(r'[;,\t]', lines[0])[0].strip().strip('"').lower() in HEADERS:
+        lines = lines[1:]
+    return [parse_location_row(line) for line in lines]
+
+
+def read_location_rows(path):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return parse_location_rows(f.read())
@@ -0,0 +1,246 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- CACHES FOR COMPUTED POSITIONS ---
+
+import io
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+# --- IN-PROCESS EPHEMERIS CACHE (LRU, MEMORY CAPPED) ---
+# Geocentric positions of Solar System bodies, keyed by (body, UTC instant grid).
+# Positions do not depend on the observer, so they can be shared by all locations and redraws.
+# The same class also holds per-series results (object, location, day) for incremental redraws.
+# Least recently used grids are evicted when the stored arrays exceed max_bytes.
+class EphemerisCache:
+
+    def __init__(self, max_bytes=64 * 1024**2):
+        self.max_bytes = max_bytes
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(body, t_ns, source='builtin'):
+        t_ns = np.ascontiguousarray(t_ns, dtype='int64')
+        t_hash = hashlib.blake2b(t_ns.tobytes(), digest_size=16).hexdigest()
+        return body.upper(), source, len(t_ns), t_hash
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        value = np.asarray(value)
+        if value.nbytes > self.max_bytes: # Too big to be cached
+            return value
+        value.setflags(write=False) # Shared between callers
+        with self._lock:
+            if key in self._data:
+                self.n_bytes -= self._data.pop(key).nbytes
+            self._data[key] = value
+            self.n_bytes += value.nbytes
+            while self.n_bytes > self.max_bytes:
+                _, old = self._data.popitem(last=False)
+                self.n_bytes -= old.nbytes
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.n_bytes = 0
+
+    def stats(self):
+        n_req = self.hits + self.misses
+        return {
+            'entries': len(self._data),
+            'bytes': self.n_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / n_req if n_req > 0 else 0.0
+        }
+
+    def __repr__(self):
+        st = self.stats()
+        return (f'EphemerisCache({st["entries"]} grids, {st["bytes"] / 1024**2:.1f}/'
+                f'{st["max_bytes"] / 1024**2:.0f} MB, hits={st["hits"]}, misses={st["misses"]})')
+
+
+# Process-wide instances used by myastrolib.get_coords and myastrolib.get_coords_incremental
+ephemeris_cache = EphemerisCache()
+series_cache = EphemerisCache(max_bytes=128 * 1024**2)
+
+
+# --- CANONICAL KEY OF A get_coords CALL ---
+# SHA-256 of the canonical JSON of all inputs that determine a get_coords result
+def make_result_key(engine_version, **params):
+    def canon(v):
+        if isinstance(v, (list, tuple, np.ndarray)):
+            return [canon(x) for x in v]
+        if isinstance(v, (float, np.floating)):
+            return float(round(float(v), 9))
+        if isinstance(v, np.integer):
+            return int(v)
+        return v
+    payload = {'engine_version': engine_version} | {k: canon(v) for k, v in params.items()}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+# --- COLUMNAR BLOBS (FLOAT32, COMPRESSED) ---
+def pack_columns(columns):
+    buffer = io.BytesIO()
+    names = list(columns)
+    arrays = {f'c{n}': np.asarray(columns[name], dtype=np.float32) for n, name in enumerate(names)}
+    np.savez_compressed(buffer, __names__=np.array(names), **arrays)
+    return buffer.getvalue()
+
+
+# Columns returned as stored (float32, copied into the CoordsResult block without conversion)
+def unpack_columns(blob):
+    with np.load(io.BytesIO(blob)) as data:
+        names = data['__names__'].tolist()
+        return {name: data[f'c{n}'] for n, name in enumerate(names)}
+
+
+# --- PERSISTENT RESULT CACHE (SQLITE, SIZE-BASED LRU) ---
+# Computed trajectories stored as compressed columnar blobs in an SQLite file.
+# SQLite locking (WAL journal, busy timeout) makes it safe for several app instances at once.
+# Least recently used results are deleted when the total blob size exceeds max_bytes.
+class ResultCache:
+
+    def __init__(self, db_path, max_bytes=256 * 1024**2, timeout=10):
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        try:
+            self._init_db()
+        except sqlite3.DatabaseError: # Corrupted cache file: start from scratch
+            self.reset()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        try:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS RESULTS ('
+                'key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS RESULTS_LAST_ACCESS ON RESULTS(last_access)')
+        finally:
+            conn.close()
+
+    def reset(self):
+        for suffix in ['', '-wal', '-shm']:
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+        self._init_db()
+
+    def get(self, key):
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute('SELECT data FROM RESULTS WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    conn.execute('UPDATE RESULTS SET last_access = ? WHERE key = ?', (time.time(), key))
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return unpack_columns(row[0])
+
+    def put(self, key, columns):
+        blob = pack_columns(columns)
+        if len(blob) > self.max_bytes:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.execute(
+                    'INSERT OR REPLACE INTO RESULTS (key, data, size, last_access) VALUES (?, ?, ?, ?)',
+                    (key, blob, len(blob), time.time()))
+
+                # Evict least recently used results above the size limit
+                total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM RESULTS').fetchone()[0]
+                if total > self.max_bytes:
+                    excess = total - self.max_bytes
+                    rows = conn.execute('SELECT key, size FROM RESULTS ORDER BY last_access').fetchall()
+                    old_keys = []
+                    for old_key, size in rows:
+                        if excess <= 0:
+                            break
+                        old_keys.append((old_key,))
+                        excess -= size
+                    conn.executemany('DELETE FROM RESULTS WHERE key = ?', old_keys)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f'Result cache not updated: {e}')
+
+    def clear(self):
+        conn = self._connect()
+        try:
+            conn.execute('DELETE FROM RESULTS')
+            conn.execute('VACUUM')
+        finally:
+            conn.close()
+
+    def stats(self):
+        try:
+            conn = self._connect()
+            try:
+                n_entries, n_bytes = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM RESULTS').fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            n_entries, n_bytes = 0, 0
+        return {
+            'entries': n_entries,
+            'bytes': n_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
@@ -0,0 +1,268 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- OFFLINE STAR CATALOGUE (HIPPARCOS I/239) WITH A NAME INDEX, MEMORY-MAPPED ---
+# catalogue/hip_main.npy:  HIP number, RA / Dec (ICRS, J1991.25, deg), proper motions (mas/yr), designation
+# catalogue/hip_names.npy: normalised names (HIP numbers, Bayer / Flamsteed designations, proper names) -> HIP
+# Both are sorted and opened with np.load(mmap_mode='r'): a lookup is a binary search touching a few pages.
+# Build (online, from Vizier):    python myastrocat.py build
+# Build (from CDS files):         python myastrocat.py build --hip hip_main.dat --bsc catalog
+# Build (from starplot tables):   python myastrocat.py build --hip-table stars.hipparcos.parquet \
+#                                                             --designations star_designations.parquet
+
+import os
+import re
+import sys
+from functools import lru_cache
+import numpy as np
+import myastrodb as myadb
+
+CATALOGUE_DIR = 'catalogue'
+STARS_FILE = 'hip_main.npy'
+NAMES_FILE = 'hip_names.npy'
+PROPER_NAMES_FILE = 'star_names.csv' # name;designation (bundled, editable)
+
+STARS_DTYPE = np.dtype([
+    ('hip', '<i4'), ('ra0', '<f8'), ('dec0', '<f8'), ('pm_ra', '<f8'), ('pm_dec', '<f8'), ('designation', 'S16')
+])
+NAMES_DTYPE = np.dtype([('name', 'S32'), ('hip', '<i4')])
+
+# Greek letters of Bayer designations: any spelling -> Simbad abbreviation
+GREEK_LETTERS = {
+    'alf': ['alpha', 'alp', 'α'], 'bet': ['beta', 'β'], 'gam': ['gamma', 'γ'], 'del': ['delta', 'δ'],
+    'eps': ['epsilon', 'ε'], 'zet': ['zeta', 'ζ'], 'eta': ['η'], 'tet': ['theta', 'the', 'θ'],
+    'iot': ['iota', 'ι'], 'kap': ['kappa', 'κ'], 'lam': ['lambda', 'λ'], 'mu.': ['mu', 'μ'],
+    'nu.': ['nu', 'ν'], 'ksi': ['xi', 'ξ'], 'omi': ['omicron', 'ο'], 'pi.': ['pi', 'π'], 'rho': ['ρ'],
+    'sig': ['sigma', 'σ'], 'tau': ['τ'], 'ups': ['upsilon', 'υ'], 'phi': ['φ'], 'chi': ['χ'],
+    'psi': ['ψ'], 'ome': ['omega', 'ω']
+}
+GREEK_ALIASES = {alias: abbr for abbr, aliases in GREEK_LETTERS.items() for alias in aliases + [abbr, abbr.rstrip('.')]}
+SUPERSCRIPT_DIGITS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹', '0123456789')
+
+
+# --- NAME NORMALISATION (INDEX KEYS) ---
+# 'Alpha CMa', 'α CMa', '* alf CMa' -> 'alf cma'; 'HIP32349' -> 'hip 32349'; 'alf01 Lib' -> 'alf1 lib'
+def normalize_name(name):
+    name = name.replace('*', ' ').strip().lower()
+    name = re.sub(r'^hip\s*(\d+)$', r'hip \1', name)
+    tokens = []
+    for token in name.split():
+        m = re.match(r'^([^\d]+?)\.?(\d*)$', token)
+        if m and m.group(1) in GREEK_ALIASES: # Letter index without leading zeros ('alf01' -> 'alf1')
+            token = GREEK_ALIASES[m.group(1)].rstrip('.') + (str(int(m.group(2))) if m.group(2) else '')
+        tokens.append(token)
+    return ' '.join(tokens)
+
+
+def get_catalogue_path(file_name):
+    return myadb.resource_path(os.path.join(CATALOGUE_DIR, file_name))
+
+
+# --- RUNTIME: MEMORY-MAPPED TABLES ---
+@lru_cache(maxsize=1)
+def get_catalogue():
+    stars_path, names_path = get_catalogue_path(STARS_FILE), get_catalogue_path(NAMES_FILE)
+    if not(os.path.exists(stars_path) and os.path.exists(names_path)):
+        return None
+    return np.load(stars_path, mmap_mode='r'), np.load(names_path, mmap_mode='r')
+
+
+def has_catalogue():
+    return get_catalogue() is not None
+
+
+# Star by name: (designation, ra0, dec0, pm_ra, pm_dec) as returned by myastrolib.get_star_info, None if not found
+def find_star(sel_star):
+    catalogue = get_catalogue()
+    if catalogue is None:
+        return None
+    stars, names = catalogue
+    key = normalize_name(sel_star).encode('utf-8')
+    n = np.searchsorted(names['name'], key)
+    if n >= len(names) or names['name'][n] != key:
+        return None
+    hip = names['hip'][n]
+    k = np.searchsorted(stars['hip'], hip)
+    if k >= len(stars) or stars['hip'][k] != hip:
+        return None
+    star = stars[k]
+    return (star['designation'].decode('utf-8'), float(star['ra0']), float(star['dec0']),
+            float(star['pm_ra']), float(star['pm_dec']))
+
+
+# --- BUILD: SOURCES ---
+# Hipparcos main catalogue (CDS hip_main.dat, '|' separated): HIP, RA, Dec, pmRA, pmDE, HD
+def read_hip_main(path):
+    rows = []
+    with open(path, 'r', encoding='ascii', errors='replace') as f:
+        for line in f:
+            fields = line.split('|')
+            try:
+                rows.append((int(fields[1]), float(fields[8]), float(fields[9]), float(fields[12]),
+                             float(fields[13]), int(fields[71]) if fields[71].strip() else 0))
+            except (ValueError, IndexError): # No astrometric solution
+                continue
+    return rows
+
+
+# Bright Star Catalogue (CDS V/50 catalog, fixed width): Flamsteed / Bayer name (bytes 5-14), HD (bytes 26-31)
+def read_bsc(path):
+    rows = []
+    with open(path, 'r', encoding='ascii', errors='replace') as f:
+        for line in f:
+            hd = line[25:31].strip()
+            if line[4:14].strip() and hd:
+                rows.append((line[4:14], int(hd)))
+    return rows
+
+
+# Bright Star Catalogue name (Flamsteed 3, Bayer 3, index 1, constellation 3 characters) -> designations
+# ('  9Alp CMa' -> ['alf CMa', '9 CMa'], '   Alp1Cen' -> ['alf01 Cen', 'alf Cen'])
+def parse_bsc_name(bsc_name):
+    bsc_name = bsc_name.rstrip().rjust(10)
+    flamsteed, greek, index, const = (bsc_name[:3].strip(), bsc_name[3:6].strip(), bsc_name[6].strip(),
+                                      bsc_name[7:].strip())
+    if not const.isalpha() or not(flamsteed.isdigit() or greek):
+        return []
+    names = []
+    if greek and greek.lower() in GREEK_ALIASES:
+        letter = GREEK_ALIASES[greek.lower()]
+        if index: # Multiple star: the first component also takes the plain letter
+            names.append(f'{letter}{int(index):02d} {const}')
+        names.append(f'{letter} {const}')
+    if flamsteed:
+        names.append(f'{flamsteed} {const}')
+    return names
+
+
+def read_proper_names(path):
+    rows = []
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if ';' in line and not line.startswith('#'):
+                    name, designation = line.rstrip('\n').split(';')[:2]
+                    rows.append((name.strip(), designation.strip()))
+    return rows
+
+
+# Hipparcos and designation tables as bundled with starplot (Parquet):
+# - Hipparcos in the layout of skyfield.data.hipparcos.load_dataframe (hip, ra_degrees, dec_degrees,
+#   ra_mas_per_year, dec_mas_per_year, magnitude), values of CDS hip_main
+# - designations: hip, name (IAU proper name), bayer ('α', 'β¹'), flamsteed; constellation from the position
+# Returns (hip rows as read_hip_main, designations as get_bsc_designations, proper names as read_proper_names)
+def read_hip_tables(hip_path, designations_path):
+    import pandas as pd
+    from astropy.coordinates import SkyCoord, get_constellation
+    hip = pd.read_parquet(hip_path).reset_index()
+    hip = hip.dropna(subset=['ra_degrees', 'dec_degrees', 'ra_mas_per_year', 'dec_mas_per_year'])
+    hip_rows = [(int(h), float(ra), float(dec), float(pm_ra), float(pm_dec), 0) for h, ra, dec, pm_ra, pm_dec in
+                hip[['hip', 'ra_degrees', 'dec_degrees', 'ra_mas_per_year', 'dec_mas_per_year']].to_numpy()]
+
+    # Brightest star first: it takes the plain letter shared by the components of a multiple star
+    desig = pd.read_parquet(designations_path).merge(hip[['hip', 'ra_degrees', 'dec_degrees', 'magnitude']], on='hip')
+    desig = desig.sort_values('magnitude', kind='stable')
+    consts = get_constellation(SkyCoord(desig['ra_degrees'], desig['dec_degrees'], unit='deg'), short_name=True)
+    designations = []
+    proper_names = []
+    for (h, name, bayer, flamsteed), const in zip(desig[['hip', 'name', 'bayer', 'flamsteed']].to_numpy(), consts):
+        names = []
+        m = re.match(r'^(\D)(\d*)$', str(bayer or '').translate(SUPERSCRIPT_DIGITS))
+        if m and m.group(1) in GREEK_ALIASES:
+            letter = GREEK_ALIASES[m.group(1)]
+            if m.group(2):
+                names.append(f'{letter}{int(m.group(2)):02d} {const}')
+            names.append(f'{letter} {const}')
+        if pd.notna(flamsteed):
+            names.append(f'{int(flamsteed)} {const}')
+        designations.append((int(h), names))
+        if isinstance(name, str) and name.strip():
+            proper_names.append((name.strip(), f'HIP {int(h)}'))
+    return hip_rows, designations, proper_names
+
+
+# Bright Star Catalogue names matched to Hipparcos through the HD number: [(hip, designations)]
+def get_bsc_designations(hip_rows, bsc_rows):
+    hip_of_hd = {hd: hip for hip, _, _, _, _, hd in hip_rows if hd > 0}
+    return [(hip_of_hd[hd], parse_bsc_name(bsc_name)) for bsc_name, hd in bsc_rows if hd in hip_of_hd]
+
+
+# Online sources (Vizier): same rows as read_hip_main / read_bsc
+def get_vizier_sources():
+    from astroquery.vizier import Vizier
+    hip = Vizier(columns=['HIP', 'RAICRS', 'DEICRS', 'pmRA', 'pmDE', 'HD'], row_limit=-1, timeout=300).get_catalogs(
+        'I/239/hip_main')[0]
+    hip = hip[~(hip['RAICRS'].mask | hip['pmRA'].mask)] if hasattr(hip['RAICRS'], 'mask') else hip
+    hip_rows = [(int(r['HIP']), float(r['RAICRS']), float(r['DEICRS']), float(r['pmRA']), float(r['pmDE']),
+                 int(r['HD']) if r['HD'] else 0) for r in hip]
+    bsc = Vizier(columns=['Name', 'HD'], row_limit=-1, timeout=300).get_catalogs('V/50/catalog')[0]
+    bsc_rows = [(str(r['Name']), int(r['HD'])) for r in bsc if r['Name'] and r['HD']]
+    return hip_rows, bsc_rows
+
+
+# --- BUILD: BINARY TABLES ---
+def build_catalogue(hip_rows, designations, proper_names, out_dir):
+    hip_rows = sorted(hip_rows)
+    stars = np.zeros(len(hip_rows), dtype=STARS_DTYPE)
+    for field, values in zip(['hip', 'ra0', 'dec0', 'pm_ra', 'pm_dec'], zip(*[r[:5] for r in hip_rows])):
+        stars[field] = values
+
+    # Designations: Bayer, then Flamsteed, else HIP number
+    aliases = {}
+    for hip, *_ in hip_rows:
+        aliases[f'HIP {hip}'] = hip
+    designation = {}
+    for hip, hip_names in designations:
+        if f'HIP {hip}' not in aliases: # No astrometric solution
+            continue
+        for name in hip_names:
+            aliases.setdefault(name, hip)
+            designation.setdefault(hip, name)
+    stars['designation'] = [designation.get(hip, f'HIP {hip}').encode('utf-8') for hip in stars['hip']]
+
+    # Proper names through any known designation
+    keys = {normalize_name(name): hip for name, hip in aliases.items()}
+    for name, desig in proper_names:
+        hip = keys.get(normalize_name(desig))
+        if hip is not None:
+            keys.setdefault(normalize_name(name), hip)
+
+    names = np.array(sorted((k.encode('utf-8'), hip) for k, hip in keys.items() if len(k.encode('utf-8')) <= 32),
+                     dtype=NAMES_DTYPE)
+    os.makedirs(out_dir, exist_ok=True)
+    np.save(os.path.join(out_dir, STARS_FILE), stars)
+    np.save(os.path.join(out_dir, NAMES_FILE), names)
+    get_catalogue.cache_clear()
+    return len(stars), len(names)
+
+
+# --- BUILD FROM THE COMMAND LINE ---
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Build the offline star catalogue')
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--hip', help='CDS hip_main.dat (default: download from Vizier)')
+    parser.add_argument('--bsc', help='CDS V/50 catalog (Bright Star Catalogue)')
+    parser.add_argument('--hip-table', help='Hipparcos Parquet table (starplot stars.hipparcos.parquet)')
+    parser.add_argument('--designations', help='Designations Parquet table (starplot star_designations.parquet)')
+    parser.add_argument('--out', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), CATALOGUE_DIR))
+    args = parser.parse_args()
+    if args.hip_table and not args.designations:
+        parser.error('--hip-table requires --designations')
+
+    proper_names = read_proper_names(os.path.join(args.out, PROPER_NAMES_FILE))
+    if args.hip_table:
+        hip_rows, designations, table_names = read_hip_tables(args.hip_table, args.designations)
+        proper_names += table_names
+    else:
+        if args.hip:
+            hip_rows, bsc_rows = read_hip_main(args.hip), (read_bsc(args.bsc) if args.bsc else [])
+        else:
+            hip_rows, bsc_rows = get_vizier_sources()
+        designations = get_bsc_designations(hip_rows, bsc_rows)
+    n_stars, n_names = build_catalogue(hip_rows, designations, proper_names, args.out)
+    print(f'{n_stars} stars, {n_names} names written to {args.out}')
+    sys.exit(0)
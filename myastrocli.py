@@ -0,0 +1,173 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- COMMAND LINE (HEADLESS): NO PyQt6 / QtWebEngine ---
+# python -m astrotracker compute -o MOON -o VEGA -l Rome -d 2025-08-12 --output positions.parquet
+# python -m astrotracker compute -o MARS -l Rome --from 2025-01-01 --to 2025-12-31 --summary --output mars.csv
+# python -m astrotracker list objects
+
+import os
+import sys
+import argparse
+from datetime import date
+import myastrodb as myadb
+import myastroreg as myarg
+
+# Heavy modules (astropy, plotly, pyarrow) are imported by the commands that need them
+
+EPHEMERIS_TYPES = {'astropy': 'builtin', 'chebyshev': 'chebyshev', 'fast': 'fast'}
+IMAGE_FORMATS = ['png', 'jpg', 'jpeg', 'svg', 'pdf', 'webp']
+
+
+# --- ARGUMENTS ---
+def get_parser():
+    parser = argparse.ArgumentParser(prog='astrotracker', description='Astrotracker (command line)')
+    parser.add_argument('--db', default=None, help='Catalogue database (default: the one of the app)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    # List catalogue
+    p_list = commands.add_parser('list', help='List objects or locations of the catalogue')
+    p_list.add_argument('what', choices=['objects', 'locations'])
+
+    # Compute positions
+    p_comp = commands.add_parser('compute', help='Compute positions; write data, daily summary or figure')
+    p_comp.add_argument('-o', '--object', action='append', required=True, help='Object (repeat for more)')
+    p_comp.add_argument('-l', '--location', action='append', required=True, help='Location (repeat for more)')
+    p_comp.add_argument('-d', '--day', action='append', help='Day YYYY-MM-DD (repeat for more; default: today)')
+    p_comp.add_argument('--from', dest='day_from', help='First day of a range (YYYY-MM-DD)')
+    p_comp.add_argument('--to', dest='day_to', help='Last day of a range (YYYY-MM-DD)')
+    p_comp.add_argument('--tmin', default='00:00', help='Start time HH:MM (default 00:00)')
+    p_comp.add_argument('--tmax', default='00:00', help='End time HH:MM (next day if <= tmin; default 00:00)')
+    p_comp.add_argument('--step', type=int, default=5, help='Time step in minutes (default 5)')
+    p_comp.add_argument('--time', default='Civil', choices=['Civil', 'Local', 'Greenwich'], help='Time type')
+    p_comp.add_argument('--ephemeris', default='astropy', choices=list(EPHEMERIS_TYPES))
+    p_comp.add_argument('--workers', type=int, default=0, help='Worker processes (default 0: single process)')
+    p_comp.add_argument('--summary', action='store_true', help='Daily summary instead of all positions')
+    p_comp.add_argument('--events', default=None, help='Also write rise / set / culminations to this CSV file')
+    p_comp.add_argument('--graph', default=None, help="Graph type (figure output; default 'Azimuth/Altidude')")
+    p_comp.add_argument('--output', default='-',
+        help='Output file: .csv .parquet .feather .arrow (data), .html .png .svg .pdf (figure); - is CSV on stdout')
+    return parser
+
+
+# --- LIST CATALOGUE ---
+def run_list(args, df_loc, df_stars):
+    if args.what == 'objects':
+        for obj in myadb.SS_OBJECTS + df_stars['star'].tolist():
+            print(obj)
+    else:
+        for _, row in df_loc.iterrows():
+            print(f"{row['location']};{row['latitude']};{row['longitude']};{row['time_zone']}")
+    return 0
+
+
+# --- COMPUTE ---
+def run_compute(args, df_loc, df_stars):
+    import myastrolib as myal
+    import myastroexport as myax
+
+    # Days
+    if args.day_from or args.day_to:
+        sel_days = myal.get_day_range(args.day_from or args.day_to, args.day_to or args.day_from)
+    else:
+        sel_days = list(dict.fromkeys(args.day or [date.today().isoformat()]))
+
+    cat_stars, cat_loc = myarg.get_catalogues(df_loc, df_stars)
+    coords_args = myadb.get_selection_args(
+        cat_stars, cat_loc, list(dict.fromkeys(args.object)), list(dict.fromkeys(args.location)), sel_days,
+        sel_time = args.time,
+        t_min = args.tmin,
+        t_max = args.tmax,
+        t_delta = args.step,
+        ephemeris = EPHEMERIS_TYPES[args.ephemeris],
+        n_workers = args.workers
+    )
+
+    # Output type
+    if args.output == '-':
+        format = 'csv'
+    else:
+        format = os.path.splitext(args.output)[1].lower().lstrip('.')
+        if format not in IMAGE_FORMATS + ['html']:
+            format = myax.get_format(args.output)
+
+    # Events (optional, also shown in figures)
+    df_events = None
+    if args.events:
+        df_events = myal.get_events(**{k: coords_args[k] for k in myal.EVENT_ARGS})
+        df_events.to_csv(args.events, sep=';', index=False)
+
+    # Figure
+    if format in IMAGE_FORMATS + ['html']:
+        fig = get_figure(args, coords_args, df_events, myal.get_coords(**coords_args))
+        if format == 'html':
+            fig.write_html(args.output)
+        else:
+            fig.write_image(args.output) # Needs kaleido
+        print(f'Figure saved as: {args.output}', file=sys.stderr)
+        return 0
+
+    # Data (streamed: memory does not grow with the range)
+    chunks = myal.iter_coords(**coords_args)
+    if args.summary:
+        df_summary = myal.get_daily_summary(chunks, args.step)
+        df_summary.to_csv(sys.stdout if args.output == '-' else args.output, sep=';', index=False)
+        n_rows = len(df_summary)
+    elif args.output == '-':
+        n_rows = 0
+        for n, df_chunk in enumerate(chunks):
+            df_chunk.to_csv(sys.stdout, sep=';', index=False, header=(n == 0))
+            n_rows += len(df_chunk)
+    else:
+        n_rows = myax.write_chunks(chunks, args.output, format)
+    if args.output != '-':
+        print(f'{n_rows} rows saved as: {args.output}', file=sys.stderr)
+    return 0
+
+
+# --- FIGURE (AS IN THE GUI: ONE MULTIPLE SELECTION AT MOST) ---
+def get_figure(args, coords_args, df_events, df_out):
+    import myastroplot as myap
+
+    objects = list(dict.fromkeys(args.object))
+    multi = {
+        'Multi Objects': objects,
+        'Multi Locations': coords_args['loc_names'],
+        'Multi Days': coords_args['sel_days']
+    }
+    multi = {k: v for k, v in multi.items() if len(v) > 1}
+    if len(multi) > 1:
+        raise ValueError('Figures support several objects, locations or days, but only one of them')
+
+    plot_type = args.graph or myap.PLOT_TYPES[0]
+    if plot_type not in myap.PLOT_TYPES:
+        raise ValueError(f'Unknown graph type: {plot_type} (available: {", ".join(myap.PLOT_TYPES)})')
+    opts = myap.PLOT_OPTIONS | dict(sel_time=args.time, df_events=df_events)
+    curr_obj = objects[0]
+    curr_location = coords_args['loc_names'][0]
+    curr_day = coords_args['sel_days'][0]
+    if len(multi) == 0:
+        return myap.get_fig_single(df_out, curr_obj, curr_location, curr_day, plot_type, opts)
+    multi_mode, multi_values = list(multi.items())[0]
+    return myap.get_fig_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_mode, multi_values, opts)
+
+
+# --- MAIN ---
+def main(argv=None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    db_path = args.db or (myadb.get_app_dir() / 'astrodb.db')
+    df_loc, df_stars = myadb.load_db(db_path)
+    try:
+        if args.command == 'list':
+            return run_list(args, df_loc, df_stars)
+        return run_compute(args, df_loc, df_stars)
+    except (KeyError, ValueError, ImportError) as e:
+        parser.exit(2, f'{parser.prog}: error: {e.args[0] if e.args else e}\n')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- CATALOGUE DATABASE (STARS, LOCATIONS): NO PyQt6, SHARED BY THE GUI AND THE COMMAND LINE ---
+# One long-lived connection per DB file (WAL journal); edits are targeted INSERT / DELETE statements with
+# parameters (prepared once and cached by sqlite3), so their cost does not depend on the catalogue size.
+
+import os
+import re
+import sys
+import shutil
+import sqlite3
+from pathlib import Path
+import pandas as pd
+
+# Solar system bodies (always available, not stored in the DB)
+SS_OBJECTS = ['SUN', 'MOON', 'MERCURY', 'VENUS', 'MARS', 'JUPITER', 'SATURN']
+
+# Tables: columns (besides the AUTOINCREMENT id), name column (indexed)
+TABLE_COLUMNS = {
+    'STARS': ['star', 'vizier_name', 'ra0', 'dec0', 'pm_ra', 'pm_dec'],
+    'LOCATIONS': ['location', 'latitude', 'longitude', 'time_zone', 'civil_utc', 'local_utc']
+}
+NAME_COLUMNS = {'STARS': 'star', 'LOCATIONS': 'location'}
+
+connections = {} # DB path -> open connection
+
+
+# --- PATHS ---
+def resource_path(relative_path):
+    try: # Compiled Version
+        base_path = sys._MEIPASS
+    except AttributeError: # Developer mode
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, relative_path)
+
+
+# App folder (created if it does not exist)
+def get_app_dir():
+    if os.name == 'nt':
+        app_dir = Path(os.getenv('LOCALAPPDATA')) / 'Astrotracker'
+    else:
+        app_dir = Path.home() / '.Astrotracker'
+    app_dir.mkdir(parents=True, exist_ok=True)
+    return app_dir
+
+
+# --- CONNECTION (OPENED ONCE: WAL JOURNAL, SCHEMA CHECKED, NAME INDEXES) ---
+def get_connection(db_path):
+    conn = connections.get(str(db_path))
+    if conn is not None:
+        return conn
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL') # Safe with WAL: a power loss can only undo the last commits
+        repair_schema(conn)
+        for table, column in NAME_COLUMNS.items():
+            if not has_index(conn, table, column): # UNIQUE names are indexed already
+                conn.execute(f'CREATE INDEX idx_{table.lower()}_{column} ON {table} ({column})')
+    except sqlite3.Error:
+        conn.close()
+        raise
+    connections[str(db_path)] = conn
+    return conn
+
+
+# Closing the last connection also merges the WAL file into the DB
+def close_connection(db_path):
+    conn = connections.pop(str(db_path), None)
+    if conn is not None:
+        conn.close()
+
+
+def has_index(conn, table, column):
+    indexes = [row[1] for row in conn.execute(f'PRAGMA index_list({table})')]
+    return any(conn.execute(f'PRAGMA index_info({index})').fetchone()[2] == column for index in indexes)
+
+
+# Table definitions (AUTOINCREMENT id, UNIQUE names) as in db_backup.sql
+def get_backup_schemas():
+    with open(resource_path('db_backup.sql'), 'r', encoding='utf-8') as f:
+        sql_script = f.read()
+    tables = re.finditer(r'CREATE TABLE IF NOT EXISTS "(\w+)" \(.*?\);', sql_script, re.S)
+    return {m.group(1): m.group(0) for m in tables}
+
+
+# Tables rewritten by older versions (DataFrame.to_sql) lost AUTOINCREMENT / UNIQUE: rebuilt, ids kept.
+# Rows breaking the constraints (name or id used twice) are kept under a new name / id, or reported if not possible
+def repair_schema(conn):
+    for table, create_sql in get_backup_schemas().items():
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+        if row is None or 'AUTOINCREMENT' in row[0]:
+            continue
+        columns = ', '.join(['id'] + TABLE_COLUMNS[table])
+        try:
+            conn.execute('BEGIN')
+            conn.execute(f'ALTER TABLE {table} RENAME TO {table}_OLD')
+            conn.execute(create_sql)
+            conn.execute(f'INSERT OR IGNORE INTO {table} ({columns}) SELECT {columns} FROM {table}_OLD ORDER BY id')
+            not_copied = conn.execute(
+                f'SELECT {columns} FROM {table}_OLD EXCEPT SELECT {columns} FROM {table} ORDER BY 1').fetchall()
+            for row in not_copied:
+                restore_row(conn, table, row)
+            conn.execute(f'DROP TABLE {table}_OLD')
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+
+# Row not copied by repair_schema: inserted with a new id, as 'name (2)', 'name (3)'... if its name is taken
+def restore_row(conn, table, row):
+    old_id, name, values = row[0], row[1], list(row[1:])
+    name_col = NAME_COLUMNS[table]
+    if name is not None:
+        n = 1
+        while conn.execute(f'SELECT 1 FROM {table} WHERE {name_col} = ?', (values[0],)).fetchone() is not None:
+            n += 1
+            values[0] = f'{name} ({n})'
+        columns = TABLE_COLUMNS[table]
+        sql = f'INSERT OR IGNORE INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})'
+        if conn.execute(sql, values).rowcount == 1:
+            if values[0] != name:
+                print(f'{table}: {name} (id {old_id}) already present, kept as {values[0]}')
+            return
+    print(f'{table}: row id {old_id} not copied (constraint not met): {tuple(row)}')
+
+
+# --- EDITS (ONE TRANSACTION EACH) ---
+# Rows: dicts with the table columns; returns the new ids. Raises sqlite3.IntegrityError if a name exists already
+def insert_rows(db_path, table, rows):
+    columns = TABLE_COLUMNS[table]
+    sql = f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})'
+    conn = get_connection(db_path)
+    with conn:
+        return [conn.execute(sql, [to_db_value(row[c]) for c in columns]).lastrowid for row in rows]
+
+
+def delete_rows(db_path, table, names):
+    conn = get_connection(db_path)
+    with conn:
+        conn.executemany(f'DELETE FROM {table} WHERE {NAME_COLUMNS[table]} = ?', [(name,) for name in names])
+
+
+# NumPy scalars (e.g. from Vizier tables) as Python values
+def to_db_value(value):
+    return value.item() if hasattr(value, 'item') else value
+
+
+# --- READ / RESTORE ---
+def read_db(db_path):
+    conn = get_connection(db_path)
+    df_loc = pd.read_sql_query('SELECT * FROM LOCATIONS ORDER BY location', conn)
+    df_stars = pd.read_sql_query('SELECT * FROM STARS ORDER BY star', conn)
+    return df_loc, df_stars
+
+
+def restore_db(db_path):
+    sql_file = resource_path('db_backup.sql')
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        with open(sql_file, 'r', encoding='utf-8') as f:
+            sql_script = f.read()
+        cursor.executescript(sql_script)
+        conn.commit()
+
+
+# Recreate DB if it does not exist or if it is faulty; returns (df_loc, df_stars)
+def load_db(db_path):
+    if not(os.path.exists(db_path)):
+        restore_db(db_path)
+        return read_db(db_path)
+    try:
+        return read_db(db_path)
+    except:
+        delete_db(db_path)
+        restore_db(db_path)
+        return read_db(db_path)
+
+
+# --- EXPORT (CONSISTENT COPY, WAL INCLUDED) / IMPORT / DELETE ---
+def export_db(db_path, export_path):
+    dst = sqlite3.connect(export_path)
+    try:
+        get_connection(db_path).backup(dst)
+    finally:
+        dst.close()
+
+
+def import_db(db_path, import_path):
+    shutil.copyfile(import_path, f'{db_path}.import') # Current DB kept if the copy fails
+    delete_db(db_path)
+    os.replace(f'{db_path}.import', db_path)
+
+
+def delete_db(db_path):
+    close_connection(db_path)
+    for path in [str(db_path), f'{db_path}-wal', f'{db_path}-shm']:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# --- COMPUTATION PARAMETERS OF A SELECTION (OBJECTS, LOCATIONS, DAYS) ---
+# The Sun is always computed (day / night); stars and locations are looked up in the catalogue registries
+# (myastroreg.Catalogue: constant time per name)
+def get_selection_args(cat_stars, cat_loc, objects, locations, sel_days, sel_time='Civil',
+                       t_min='00:00', t_max='00:00', t_delta=5, ephemeris='builtin', n_workers=0):
+    sel_ssbodies = [m for m in objects if m in SS_OBJECTS]
+    if not 'SUN' in sel_ssbodies:
+        sel_ssbodies = ['SUN'] + sel_ssbodies
+    sel_stars = [m for m in objects if m not in SS_OBJECTS]
+
+    for sel_star in sel_stars:
+        if sel_star not in cat_stars:
+            raise KeyError(f'Object not found: {sel_star}')
+    star_values = cat_stars.get_values(sel_stars, ['ra0', 'dec0', 'pm_ra', 'pm_dec'])
+    sel_stars_ra0, sel_stars_dec0, sel_stars_pm_ra, sel_stars_pm_dec = [c.tolist() for c in star_values.T]
+
+    for sel_location in locations:
+        if sel_location not in cat_loc:
+            raise KeyError(f'Location not found: {sel_location}')
+    lats, lons = [c.tolist() for c in cat_loc.get_values(locations, ['latitude', 'longitude']).T]
+    tz_names = [cat_loc.get(sel_location)['time_zone'] for sel_location in locations]
+
+    return dict(
+        sel_ssbodies = sel_ssbodies,
+        sel_stars = sel_stars,
+        stars_ra0 = sel_stars_ra0,
+        stars_dec0 = sel_stars_dec0,
+        stars_pm_ra = sel_stars_pm_ra,
+        stars_pm_dec = sel_stars_pm_dec,
+        loc_names= list(locations),
+        lats = lats,
+        lons = lons,
+        tz_names = tz_names,
+        sel_time = sel_time,
+        sel_days = list(sel_days),
+        t_min = t_min,
+        t_max = t_max,
+        t_delta = t_delta,
+        batched = True,
+        ephemeris = ephemeris,
+        n_workers = n_workers
+    )
@@ -0,0 +1,444 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- PRECOMPUTED CHEBYSHEV EPHEMERIS (SUN, MOON, PLANETS, 1900-2100) ---
+#
+# Geocentric apparent GCRS positions (as returned by astropy get_body with the 'builtin' ephemeris)
+# are fitted per body with Chebyshev polynomials over fixed-length segments of TT Julian Date.
+#
+# File format (little endian):
+#   header:  magic b'ATCHEB\0\0' | version (uint32) | nr of bodies (uint32)
+#   bodies:  name (8 bytes) | jd_start (float64) | seg_days (float64) | n_seg (uint32) | n_coef (uint32) | offset (uint64)
+#   data:    float32 coefficients [n_seg, 3 (x, y, z), n_coef] in km, starting at offset
+
+import os
+import sys
+import struct
+import numpy as np
+from numpy.polynomial import chebyshev as cheb
+
+EPHEM_MAGIC = b'ATCHEB\0\0'
+EPHEM_VERSION = 1
+EPHEM_HEADER = struct.Struct('<8sII')
+EPHEM_RECORD = struct.Struct('<8sddIIQ')
+
+# Covered range (TT Julian Date): 1900-01-01 ... 2100-12-31, plus margins for time zones
+EPHEM_JD_START = 2415014.5 # 1899-12-26
+EPHEM_JD_END = 2488440.5 # 2101-01-07
+
+# Segment length [days] and polynomial degree per body
+EPHEM_BODIES = {
+    'SUN': (32, 12),
+    'MOON': (16, 16),
+    'MERCURY': (16, 12),
+    'VENUS': (16, 12),
+    'MARS': (32, 12),
+    'JUPITER': (64, 12),
+    'SATURN': (64, 12)
+}
+
+
+# --- Default file path (for both dev and compiled environment) ---
+def ephem_path():
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, 'assets', 'ephemeris.bin')
+
+
+# --- BUILD TABLES (requires astropy) ---
+def build_tables(path=None, bodies=None, chunk=20000, verbose=True):
+    import warnings
+    from erfa import ErfaWarning
+    from astropy.time import Time
+    from astropy.coordinates import solar_system_ephemeris, get_body
+    import astropy.units as u
+    warnings.simplefilter('ignore', ErfaWarning)
+
+    path = path or ephem_path()
+    bodies = bodies or list(EPHEM_BODIES)
+    solar_system_ephemeris.set('builtin')
+
+    tables = {}
+    for body in bodies:
+        seg_days, deg = EPHEM_BODIES[body]
+        n_coef = deg + 1
+        n_seg = int(np.ceil((EPHEM_JD_END - EPHEM_JD_START) / seg_days))
+
+        # Chebyshev nodes (first kind) of every segment
+        x_k = np.cos(np.pi * (np.arange(n_coef) + 0.5) / n_coef)[::-1]
+        jd_nodes = (EPHEM_JD_START + seg_days * (np.arange(n_seg)[:, np.newaxis] + (x_k + 1) / 2)).ravel()
+
+        # Positions at nodes [km]
+        pos = np.empty((len(jd_nodes), 3))
+        for i0 in range(0, len(jd_nodes), chunk):
+            t_tt = Time(jd_nodes[i0:i0 + chunk], format='jd', scale='tt')
+            pos[i0:i0 + chunk] = get_body(body.lower(), t_tt).cartesian.xyz.to_value(u.km).T
+
+        # Fit all segments and coordinates at once
+        y = pos.reshape(n_seg, n_coef, 3).transpose(1, 0, 2).reshape(n_coef, -1)
+        coefs = cheb.chebfit(x_k, y, deg).reshape(n_coef, n_seg, 3).transpose(1, 2, 0)
+        tables[body] = (seg_days, coefs.astype('<f4'))
+        if verbose:
+            print(f'{body}: {n_seg} segments, {n_coef} coefficients, {coefs.size * 4 / 1024:.0f} kB')
+
+    write_tables(path, tables)
+    return path
+
+
+# --- WRITE TABLES ---
+def write_tables(path, tables):
+    offset = EPHEM_HEADER.size + EPHEM_RECORD.size * len(tables)
+    records = []
+    for body, (seg_days, coefs) in tables.items():
+        n_seg, _, n_coef = coefs.shape
+        records.append(EPHEM_RECORD.pack(body.encode('ascii'), EPHEM_JD_START, seg_days, n_seg, n_coef, offset))
+        offset += coefs.nbytes
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as fh:
+        fh.write(EPHEM_HEADER.pack(EPHEM_MAGIC, EPHEM_VERSION, len(tables)))
+        for record in records:
+            fh.write(record)
+        for _, coefs in tables.values():
+            fh.write(np.ascontiguousarray(coefs, dtype='<f4').tobytes())
+
+
+# --- CHEBYSHEV EPHEMERIS EVALUATOR ---
+class ChebyshevEphemeris:
+
+    def __init__(self, path=None):
+        self.path = path or ephem_path()
+        data = np.memmap(self.path, dtype=np.uint8, mode='r')
+        magic, version, n_bodies = EPHEM_HEADER.unpack_from(data, 0)
+        if magic != EPHEM_MAGIC or version != EPHEM_VERSION:
+            raise ValueError(f'{self.path} is not a valid ephemeris file')
+
+        self.tables = {}
+        for nb in range(n_bodies):
+            name, jd_start, seg_days, n_seg, n_coef, offset = (
+                EPHEM_RECORD.unpack_from(data, EPHEM_HEADER.size + nb * EPHEM_RECORD.size))
+            coefs = np.frombuffer(data, dtype='<f4', count=n_seg * 3 * n_coef, offset=offset)
+            self.tables[name.rstrip(b'\0').decode('ascii')] = (
+                jd_start, seg_days, coefs.reshape(n_seg, 3, n_coef))
+
+    @property
+    def bodies(self):
+        return list(self.tables)
+
+    # Segments of the TT Julian Dates, None if the body or any time is not covered by the tables
+    def get_segments(self, body, jd1, jd2=0.0):
+        if body.upper() not in self.tables:
+            return None
+        jd_start, seg_days, coefs = self.tables[body.upper()]
+        t = ((np.asarray(jd1, dtype=float) - jd_start) + np.asarray(jd2, dtype=float)) / seg_days
+        n_seg = np.floor(t).astype(np.int64)
+        if np.any(n_seg < 0) or np.any(n_seg >= coefs.shape[0]):
+            return None
+        return t, n_seg
+
+    def covers(self, body, jd1, jd2=0.0):
+        return self.get_segments(body, jd1, jd2) is not None
+
+    # Geocentric position [km] at TT Julian Dates (jd1 + jd2 keeps full precision)
+    def position(self, body, jd1, jd2=0.0):
+        coefs = self.tables[body.upper()][2]
+        segments = self.get_segments(body, jd1, jd2)
+        if segments is None:
+            raise ValueError(f'{body}: time outside ephemeris range (1900-2100)')
+        t, n_seg = segments
+        x = 2 * (t - n_seg) - 1
+
+        # Clenshaw recurrence, vectorised over all times
+        c = coefs[n_seg].astype(float)
+        x = x[..., np.newaxis]
+        b1 = np.zeros(c.shape[:-1])
+        b2 = np.zeros(c.shape[:-1])
+        for j in range(c.shape[-1] - 1, 0, -1):
+            b1, b2 = 2 * x * b1 - b2 + c[..., j], b1
+        return x * b1 - b2 + c[..., 0]
+
+
+# --- LOW-PRECISION ANALYTIC EPHEMERIS (PURE NUMPY) ---
+#
+# Truncated analytic theories, evaluated on whole time grids:
+#   SUN:      Meeus, Astronomical Algorithms, ch. 25 (low accuracy method)
+#   MOON:     Meeus, ch. 47, main terms of tables 47.A / 47.B
+#   PLANETS:  mean orbital elements of date (P. Schlyter) with the main Jupiter/Saturn perturbations
+# Earth orientation uses IAU 1976 precession, the main nutation terms and UT1 = UTC.
+#
+# Error bounds against astropy 'builtin' over 1900-2100 (python myastrobench.py fast), geocentric direction:
+#   SUN, MOON 0.015 deg | MERCURY, VENUS, JUPITER 0.04 deg | MARS, SATURN 0.06 deg
+#   Stars 0.01 deg (aberration neglected). Alt/Az add at most 0.01 deg (UT1 = UTC, no polar motion).
+
+AU_KM = 149597870.7
+
+# Moon, longitude (sin) and distance (cos) terms: D, M, M', F, sum_l [1e-6 deg], sum_r [1e-3 km]
+MOON_LR_TERMS = np.array([
+    (0, 0, 1, 0, 6288774, -20905355),
+    (2, 0, -1, 0, 1274027, -3699111),
+    (2, 0, 0, 0, 658314, -2955968),
+    (0, 0, 2, 0, 213618, -569925),
+    (0, 1, 0, 0, -185116, 48888),
+    (0, 0, 0, 2, -114332, -3149),
+    (2, 0, -2, 0, 58793, 246158),
+    (2, -1, -1, 0, 57066, -152138),
+    (2, 0, 1, 0, 53322, -170733),
+    (2, -1, 0, 0, 45758, -204586),
+    (0, 1, -1, 0, -40923, -129620),
+    (1, 0, 0, 0, -34720, 108743),
+    (0, 1, 1, 0, -30383, 104755),
+    (2, 0, 0, -2, 15327, 10321),
+    (0, 0, 1, 2, -12528, 0),
+    (0, 0, 1, -2, 10980, 79661),
+    (4, 0, -1, 0, 10675, -34782),
+    (0, 0, 3, 0, 10034, -23210),
+    (4, 0, -2, 0, 8548, -21636),
+    (2, 1, -1, 0, -7888, 24208),
+    (2, 1, 0, 0, -6766, 30824),
+    (1, 0, -1, 0, -5163, -8379),
+    (1, 1, 0, 0, 4987, -16675),
+    (2, -1, 1, 0, 4036, -12831),
+    (2, 0, 2, 0, 3994, -10445),
+    (4, 0, 0, 0, 3861, -11650),
+    (2, 0, -3, 0, 3665, 14403),
+    (0, 1, -2, 0, -2689, -7003),
+    (2, -1, -2, 0, 2390, 10056),
+    (1, 0, 1, 0, -2348, 6322),
+    (2, -2, 0, 0, 2236, -9884),
+    (0, 1, 2, 0, -2120, 5751),
+    (0, 2, 0, 0, -2069, 0),
+    (2, -2, -1, 0, 2048, -4950)
+], dtype=float)
+
+# Moon, latitude (sin) terms: D, M, M', F, sum_b [1e-6 deg]
+MOON_B_TERMS = np.array([
+    (0, 0, 0, 1, 5128122),
+    (0, 0, 1, 1, 280602),
+    (0, 0, 1, -1, 277693),
+    (2, 0, 0, -1, 173237),
+    (2, 0, -1, 1, 55413),
+    (2, 0, -1, -1, 46271),
+    (2, 0, 0, 1, 32573),
+    (0, 0, 2, 1, 17198),
+    (2, 0, 1, -1, 9266),
+    (0, 0, 2, -1, 8822),
+    (2, -1, 0, -1, 8216),
+    (2, 0, -2, -1, 4324),
+    (2, 0, 1, 1, 4200),
+    (2, 1, 0, -1, -3359),
+    (2, -1, -1, 1, 2463),
+    (2, -1, 0, 1, 2211),
+    (2, -1, -1, -1, 2065),
+    (0, 1, -1, -1, -1870),
+    (4, 0, -1, -1, 1828),
+    (0, 1, 0, 1, -1794),
+    (0, 0, 0, 3, -1749),
+    (0, 1, -1, 1, -1565),
+    (1, 0, 0, 1, -1491),
+    (0, 1, 1, 1, -1475),
+    (0, 1, 1, -1, -1410),
+    (0, 1, 0, -1, -1344),
+    (1, 0, 0, -1, -1335),
+    (0, 0, 3, 1, 1107),
+    (4, 0, 0, -1, 1021),
+    (4, 0, -1, 1, 833)
+], dtype=float)
+
+# Planets, orbital elements of date: N, i, w [deg], a [AU], e, M [deg], as (value, rate per day from 2000 Jan 0.0)
+PLANET_ELEMENTS = {
+    'MERCURY': ((48.3313, 3.24587e-5), (7.0047, 5.00e-8), (29.1241, 1.01444e-5),
+                (0.387098, 0), (0.205635, 5.59e-10), (168.6562, 4.0923344368)),
+    'VENUS': ((76.6799, 2.46590e-5), (3.3946, 2.75e-8), (54.8910, 1.38374e-5),
+              (0.723330, 0), (0.006773, -1.302e-9), (48.0052, 1.6021302244)),
+    'MARS': ((49.5574, 2.11081e-5), (1.8497, -1.78e-8), (286.5016, 2.92961e-5),
+             (1.523688, 0), (0.093405, 2.516e-9), (18.6021, 0.5240207766)),
+    'JUPITER': ((100.4542, 2.76854e-5), (1.3030, -1.557e-7), (273.8777, 1.64505e-5),
+                (5.20256, 0), (0.048498, 4.469e-9), (19.8950, 0.0830853001)),
+    'SATURN': ((113.6634, 2.38980e-5), (2.4886, -1.081e-7), (339.3939, 2.97661e-5),
+               (9.55475, 0), (0.055546, -9.499e-9), (316.9670, 0.0334442282))
+}
+
+
+# --- DELTA T = TT - UT [s] (Espenak & Meeus polynomials, 1900-2150) ---
+def delta_t(jd_utc):
+    y = 2000 + (np.asarray(jd_utc, dtype=float) - 2451544.5) / 365.2425
+    t = y - np.select([y < 1920, y < 1941, y < 1961, y < 1986, y < 2005, y < 2050],
+                      [1900, 1920, 1950, 1975, 2000, 2000], 2000)
+    return np.select([y < 1920, y < 1941, y < 1961, y < 1986, y < 2005, y < 2050], [
+        -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4,
+        21.20 + 0.84493 * t - 0.076100 * t**2 + 0.0020936 * t**3,
+        29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547,
+        45.45 + 1.067 * t - t**2 / 260 - t**3 / 718,
+        63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3 + 0.000651814 * t**4 + 0.00002373599 * t**5,
+        62.92 + 0.32217 * t + 0.005589 * t**2
+    ], -20 + 32 * ((y - 1820) / 100)**2 - 0.5628 * (2150 - y))
+
+
+# --- ROTATION MATRICES (arrays of angles in radians -> [..., 3, 3]) ---
+def rot_x(a):
+    c, s, o, z = np.cos(a), np.sin(a), np.ones_like(a), np.zeros_like(a)
+    return np.stack([np.stack([o, z, z], -1), np.stack([z, c, s], -1), np.stack([z, -s, c], -1)], -2)
+
+def rot_y(a):
+    c, s, o, z = np.cos(a), np.sin(a), np.ones_like(a), np.zeros_like(a)
+    return np.stack([np.stack([c, z, -s], -1), np.stack([z, o, z], -1), np.stack([s, z, c], -1)], -2)
+
+def rot_z(a):
+    c, s, o, z = np.cos(a), np.sin(a), np.ones_like(a), np.zeros_like(a)
+    return np.stack([np.stack([c, s, z], -1), np.stack([-s, c, z], -1), np.stack([z, z, o], -1)], -2)
+
+
+# --- EARTH ORIENTATION: NUTATION, OBLIQUITY, PRECESSION, SIDEREAL TIME ---
+def earth_orientation(jd_utc, jd_tt):
+    T = (jd_tt - 2451545.0) / 36525
+    as2r = np.pi / (180 * 3600)
+
+    # Main nutation terms (Meeus ch. 22)
+    om = np.radians(125.04452 - 1934.136261 * T)
+    l_sun = np.radians(280.4665 + 36000.7698 * T)
+    l_moon = np.radians(218.3165 + 481267.8813 * T)
+    dpsi = (-17.20 * np.sin(om) - 1.32 * np.sin(2 * l_sun) - 0.23 * np.sin(2 * l_moon) + 0.21 * np.sin(2 * om)) * as2r
+    deps = (9.20 * np.cos(om) + 0.57 * np.cos(2 * l_sun) + 0.10 * np.cos(2 * l_moon) - 0.09 * np.cos(2 * om)) * as2r
+    eps0 = (84381.448 - 46.8150 * T - 0.00059 * T**2 + 0.001813 * T**3) * as2r
+
+    # IAU 1976 precession (J2000 mean equator -> mean equator of date)
+    zeta = (2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3) * as2r
+    z = (2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3) * as2r
+    theta = (2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3) * as2r
+    prec = rot_z(-z) @ rot_y(theta) @ rot_z(-zeta)
+    nut = rot_x(-(eps0 + deps)) @ rot_z(-dpsi) @ rot_x(eps0)
+
+    # Apparent sidereal time at Greenwich [deg] (UT1 = UTC)
+    d = jd_utc - 2451545.0
+    gmst = 280.46061837 + 360.98564736629 * d + 0.000387933 * T**2 - T**3 / 38710000
+    gast = (gmst + np.degrees(dpsi * np.cos(eps0 + deps))) % 360
+    return prec, nut, eps0, gast
+
+
+# --- GEOCENTRIC ECLIPTIC POSITIONS OF DATE [km] ---
+def sun_ecliptic(jd_tt, aberration=True):
+    T = (jd_tt - 2451545.0) / 36525
+    l0 = 280.46646 + 36000.76983 * T + 0.0003032 * T**2
+    m = np.radians(357.52911 + 35999.05029 * T - 0.0001537 * T**2)
+    e = 0.016708634 - 0.000042037 * T - 0.0000001267 * T**2
+    c = ((1.914602 - 0.004817 * T - 0.000014 * T**2) * np.sin(m)
+         + (0.019993 - 0.000101 * T) * np.sin(2 * m) + 0.000289 * np.sin(3 * m))
+    nu = m + np.radians(c)
+    r = 1.000001018 * (1 - e**2) / (1 + e * np.cos(nu)) * AU_KM
+    lon = np.radians(l0 + c - (20.4898 / 3600 / (r / AU_KM) if aberration else 0))
+    return np.stack([r * np.cos(lon), r * np.sin(lon), np.zeros_like(r)], -1)
+
+
+def moon_ecliptic(jd_tt):
+    T = (jd_tt - 2451545.0) / 36525
+    lp = 218.3164477 + 481267.88123421 * T - 0.0015786 * T**2 + T**3 / 538841 - T**4 / 65194000
+    d = 297.8501921 + 445267.1114034 * T - 0.0018819 * T**2 + T**3 / 545868 - T**4 / 113065000
+    m = 357.5291092 + 35999.0502909 * T - 0.0001536 * T**2 + T**3 / 24490000
+    mp = 134.9633964 + 477198.8675055 * T + 0.0087414 * T**2 + T**3 / 69699 - T**4 / 14712000
+    f = 93.2720950 + 483202.0175233 * T - 0.0036539 * T**2 - T**3 / 3526000 + T**4 / 863310000
+    a1 = np.radians(119.75 + 131.849 * T)
+    a2 = np.radians(53.09 + 479264.290 * T)
+    a3 = np.radians(313.45 + 481266.484 * T)
+    e = 1 - 0.002516 * T - 0.0000074 * T**2
+
+    # Periodic terms (terms in M scaled by E, E^2)
+    args = np.radians(np.stack([d, m, mp, f], -1))
+    arg_lr = args @ MOON_LR_TERMS[:, :4].T
+    arg_b = args @ MOON_B_TERMS[:, :4].T
+    e_lr = e[..., np.newaxis] ** np.abs(MOON_LR_TERMS[:, 1])
+    e_b = e[..., np.newaxis] ** np.abs(MOON_B_TERMS[:, 1])
+    sum_l = np.sum(MOON_LR_TERMS[:, 4] * e_lr * np.sin(arg_lr), -1)
+    sum_r = np.sum(MOON_LR_TERMS[:, 5] * e_lr * np.cos(arg_lr), -1)
+    sum_b = np.sum(MOON_B_TERMS[:, 4] * e_b * np.sin(arg_b), -1)
+
+    # Additive terms (Venus, Jupiter, flattening of the Earth)
+    lp_r, mp_r, f_r = np.radians(lp), np.radians(mp), np.radians(f)
+    sum_l += 3958 * np.sin(a1) + 1962 * np.sin(lp_r - f_r) + 318 * np.sin(a2)
+    sum_b += (-2235 * np.sin(lp_r) + 382 * np.sin(a3) + 175 * np.sin(a1 - f_r) + 175 * np.sin(a1 + f_r)
+              + 127 * np.sin(lp_r - mp_r) - 115 * np.sin(lp_r + mp_r))
+
+    lon = np.radians(lp + sum_l / 1e6)
+    lat = np.radians(sum_b / 1e6)
+    r = 385000.56 + sum_r / 1000
+    return np.stack([r * np.cos(lat) * np.cos(lon), r * np.cos(lat) * np.sin(lon), r * np.sin(lat)], -1)
+
+
+def planet_heliocentric(body, jd_tt):
+    d = jd_tt - 2451543.5 # Days from 2000 Jan 0.0
+    n, i, w, a, e, m = [v0 + v1 * d for v0, v1 in PLANET_ELEMENTS[body]]
+    n, i, w, m = np.radians(n), np.radians(i), np.radians(w), np.radians(m % 360)
+
+    # Kepler equation (Newton iterations)
+    ea = m + e * np.sin(m) * (1 + e * np.cos(m))
+    for _ in range(5):
+        ea = ea - (ea - e * np.sin(ea) - m) / (1 - e * np.cos(ea))
+    xv, yv = a * (np.cos(ea) - e), a * np.sqrt(1 - e**2) * np.sin(ea)
+    v, r = np.arctan2(yv, xv), np.hypot(xv, yv)
+
+    # Heliocentric ecliptic longitude / latitude
+    xh = r * (np.cos(n) * np.cos(v + w) - np.sin(n) * np.sin(v + w) * np.cos(i))
+    yh = r * (np.sin(n) * np.cos(v + w) + np.cos(n) * np.sin(v + w) * np.cos(i))
+    zh = r * np.sin(v + w) * np.sin(i)
+    lon, lat = np.arctan2(yh, xh), np.arctan2(zh, np.hypot(xh, yh))
+
+    # Main perturbations of Jupiter and Saturn (great inequality)
+    if body in ('JUPITER', 'SATURN'):
+        mj = np.radians(19.8950 + 0.0830853001 * d)
+        ms = np.radians(316.9670 + 0.0334442282 * d)
+        dg = np.radians
+        if body == 'JUPITER':
+            lon = lon + dg(
+                - 0.332 * np.sin(2 * mj - 5 * ms - dg(67.6)) - 0.056 * np.sin(2 * mj - 2 * ms + dg(21))
+                + 0.042 * np.sin(3 * mj - 5 * ms + dg(21)) - 0.036 * np.sin(mj - 2 * ms)
+                + 0.022 * np.cos(mj - ms) + 0.023 * np.sin(2 * mj - 3 * ms + dg(52))
+                - 0.016 * np.sin(mj - 5 * ms - dg(69)))
+        else:
+            lon = lon + dg(
+                0.812 * np.sin(2 * mj - 5 * ms - dg(67.6)) - 0.229 * np.cos(2 * mj - 4 * ms - dg(2))
+                + 0.119 * np.sin(mj - 2 * ms - dg(3)) + 0.046 * np.sin(2 * mj - 6 * ms - dg(69))
+                + 0.014 * np.sin(mj - 3 * ms + dg(32)))
+            lat = lat + dg(-0.020 * np.cos(2 * mj - 4 * ms - dg(2)) + 0.018 * np.sin(2 * mj - 6 * ms - dg(49)))
+
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], -1) * (r * AU_KM)[..., np.newaxis]
+
+
+def planet_ecliptic(body, jd_tt):
+    earth = -sun_ecliptic(jd_tt, aberration=False)
+    geo = planet_heliocentric(body, jd_tt) - earth
+    tau = np.linalg.norm(geo, axis=-1) / 299792.458 / 86400 # Light time [days]
+    return planet_heliocentric(body, jd_tt - tau) - earth
+
+
+# --- ANALYTIC GEOCENTRIC POSITION, TRUE EQUATOR OF DATE [km] ---
+def analytic_position(body, jd_tt, eps0, nut):
+    body = body.upper()
+    if body == 'SUN':
+        ecl = sun_ecliptic(jd_tt)
+    elif body == 'MOON':
+        ecl = moon_ecliptic(jd_tt)
+    elif body in PLANET_ELEMENTS:
+        ecl = planet_ecliptic(body, jd_tt)
+    else:
+        raise ValueError(f'{body}: not available in fast ephemeris')
+
+    # Ecliptic of date -> mean equator -> true equator of date
+    mean_eq = np.einsum('...ij,...j->...i', rot_x(-eps0), ecl)
+    return np.einsum('...ij,...j->...i', nut, mean_eq)
+
+
+# Lazily loaded process-wide instance
+_ephemeris = None
+def get_ephemeris():
+    global _ephemeris
+    if _ephemeris is None:
+        _ephemeris = ChebyshevEphemeris()
+    return _ephemeris
+
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 2 and sys.argv[1] == 'build':
+        print(f'Ephemeris written to {build_tables(sys.argv[2] if len(sys.argv) > 2 else None)}')
+    else:
+        print('Usage: python myastroephem.py build [path]')
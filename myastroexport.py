@@ -0,0 +1,109 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- EXPORT OF COMPUTED POSITIONS: CSV (STREAMED), PARQUET, ARROW IPC / FEATHER ---
+
+import os
+import pandas as pd
+
+# Columnar binary formats need pyarrow (optional: CSV export works without it)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+# Supported formats: file extension -> description
+EXPORT_FORMATS = {
+    'csv': 'CSV',
+    'parquet': 'Parquet',
+    'feather': 'Feather (Arrow IPC)'
+}
+
+# Default compression of the binary formats
+EXPORT_COMPRESSION = {
+    'parquet': 'zstd',
+    'feather': 'lz4'
+}
+
+
+def has_arrow():
+    return pa is not None
+
+
+# Format from file extension (.arrow is the Arrow IPC file format, same as Feather v2)
+def get_format(file_path):
+    ext = os.path.splitext(file_path)[1].lower().lstrip('.')
+    if ext == 'arrow':
+        return 'feather'
+    if ext not in EXPORT_FORMATS:
+        raise ValueError(f'Unknown export format: .{ext}')
+    return ext
+
+
+# --- IN-MEMORY DATAFRAME AS BOUNDED CHUNKS ---
+def iter_frame(df, chunk_rows=100_000):
+    for n in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[n:n + chunk_rows]
+
+
+# --- DATAFRAME CHUNK TO ARROW TABLE ---
+# Locations with different time zones give an object column of local timestamps: it is stored as UTC instants
+# (local time is still available in hour_current / day_sel)
+# Categorical labels (day_sel, loc_sel) are written as strings: each chunk has its own categories, and an IPC file
+# only allows one dictionary per column (Parquet dictionary-encodes strings anyway)
+def to_arrow_table(df_chunk, schema=None):
+    if df_chunk['t_current'].dtype == object:
+        df_chunk = df_chunk.assign(t_current=pd.to_datetime(df_chunk['t_current'], utc=True))
+    categories = [c for c in df_chunk.columns if isinstance(df_chunk[c].dtype, pd.CategoricalDtype)]
+    if categories:
+        df_chunk = df_chunk.astype({c: str for c in categories})
+    table = pa.Table.from_pandas(df_chunk, preserve_index=False)
+    if schema is not None:
+        table = table.cast(schema)
+    return table
+
+
+# --- WRITE A STREAM OF CHUNKS (ONE CHUNK IN MEMORY AT A TIME) ---
+# Chunks must share the same columns (e.g. myastrolib.iter_coords or iter_frame); returns the number of rows
+def write_chunks(chunks, file_path, format=None, compression=None, sep=';'):
+    format = format or get_format(file_path)
+    if format != 'csv' and pa is None:
+        raise ImportError(f'{EXPORT_FORMATS[format]} export requires pyarrow (pip install pyarrow)')
+    compression = compression or EXPORT_COMPRESSION.get(format)
+
+    n_rows = 0
+    writer = None
+    try:
+        if format == 'csv':
+            writer = open(file_path, 'w', newline='', encoding='utf-8')
+            for n, df_chunk in enumerate(chunks):
+                df_chunk.to_csv(writer, sep=sep, index=False, header=(n == 0))
+                n_rows += len(df_chunk)
+        else:
+            schema = None
+            for df_chunk in chunks:
+                table = to_arrow_table(df_chunk, schema)
+                if writer is None: # Schema from the first chunk
+                    schema = table.schema
+                    if format == 'parquet':
+                        writer = pq.ParquetWriter(file_path, schema, compression=compression)
+                    else:
+                        writer = pa.ipc.new_file(file_path, schema,
+                                                 options=pa.ipc.IpcWriteOptions(compression=compression))
+                writer.write_table(table) # One Parquet row group / IPC record batch per chunk
+                n_rows += len(df_chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return n_rows
+
+
+# --- WRITE AN IN-MEMORY DATAFRAME ---
+def write_frame(df, file_path, format=None, compression=None, chunk_rows=100_000):
+    return write_chunks(iter_frame(df, chunk_rows), file_path, format, compression)
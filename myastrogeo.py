@@ -0,0 +1,227 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- OFFLINE GAZETTEER (GEONAMES CITIES) WITH A NORMALISED-NAME PREFIX INDEX, MEMORY-MAPPED ---
+# gazetteer/cities.npy:    name, country code, lat / lon, population, time zone code (one row per city)
+# gazetteer/names.npy:     normalised names (city names, Latin alternate names of large cities) -> city row, sorted
+# gazetteer/zones.npy:     time zone names
+# gazetteer/countries.npy: country code, country name
+# A lookup is a binary search on the sorted names (prefix range), ranked by population.
+# Build: python myastrogeo.py build [--cities cities15000.txt --countries countryInfo.txt] (default: geonamescache)
+# Places not in the gazetteer are looked up online (Nominatim, at most one request per second, results cached).
+
+import os
+import re
+import sys
+import time
+import threading
+import unicodedata
+from functools import lru_cache
+import numpy as np
+import myastrodb as myadb
+
+GAZETTEER_DIR = 'gazetteer'
+CITIES_DTYPE = np.dtype([
+    ('name', 'S48'), ('country', 'S2'), ('lat', '<f4'), ('lon', '<f4'), ('population', '<i4'), ('zone', '<i2')
+])
+NAMES_DTYPE = np.dtype([('key', 'S32'), ('city', '<i4'), ('alt', '?')])
+COUNTRIES_DTYPE = np.dtype([('code', 'S2'), ('name', 'S48')])
+ALT_NAMES_MIN_POPULATION = 100_000 # Alternate names (e.g. Roma, Muenchen) are indexed for large cities only
+NOMINATIM_INTERVAL = 1.0 # s between requests (Nominatim usage policy), shared by all threads
+
+
+# --- NAME NORMALISATION (INDEX KEYS): 'Bogotà' -> 'bogota', 'Saint-Étienne' -> 'saint etienne' ---
+def normalize_name(name):
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+    return ' '.join(re.sub(r'[^0-9a-z]+', ' ', name).split())
+
+
+def get_gazetteer_path(file_name):
+    return myadb.resource_path(os.path.join(GAZETTEER_DIR, file_name))
+
+
+# --- RUNTIME: MEMORY-MAPPED TABLES ---
+@lru_cache(maxsize=1)
+def get_gazetteer():
+    paths = [get_gazetteer_path(f'{table}.npy') for table in ['cities', 'names', 'zones', 'countries']]
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    cities, names, zones, countries = [np.load(path, mmap_mode='r') for path in paths]
+    country_names = {code.decode(): name.decode('utf-8') for code, name in zip(countries['code'], countries['name'])}
+    return cities, names, zones, country_names, {code: normalize_name(name) for code, name in country_names.items()}
+
+
+def has_gazetteer():
+    return get_gazetteer() is not None
+
+
+# 'City, Country' -> normalised city, country codes matching the country part (None: any country)
+def parse_query(text, country_keys):
+    city, _, country = text.partition(',')
+    country = normalize_name(country)
+    if not country:
+        return normalize_name(city), None
+    codes = {code for code, key in country_keys.items() if key.startswith(country) or code.lower() == country}
+    return normalize_name(city), codes
+
+
+# Cities whose name starts with the city part of the query: exact names first, then city names before alternate
+# names, then by population
+def search_cities(text, n_max=10):
+    gazetteer = get_gazetteer()
+    if gazetteer is None:
+        return []
+    cities, names, _, _, country_keys = gazetteer
+    city, codes = parse_query(text, country_keys)
+    if not city:
+        return []
+    key = city.encode('utf-8')[:NAMES_DTYPE['key'].itemsize]
+    lo = np.searchsorted(names['key'], key, side='left')
+    hi = np.searchsorted(names['key'], key + b'\xff', side='left')
+    idx, alt = np.asarray(names['city'][lo:hi]), np.asarray(names['alt'][lo:hi])
+    exact = np.asarray(names['key'][lo:hi]) == key
+    if codes is not None:
+        in_country = np.isin(np.asarray(cities['country'][idx]), np.array(sorted(codes), dtype='S2'))
+        idx, alt, exact = idx[in_country], alt[in_country], exact[in_country]
+
+    # Rank, then drop repeated cities (a city can match through several names): [(city row, exact name), ...]
+    order = np.lexsort((-np.asarray(cities['population'][idx]), alt, ~exact))
+    ranked = {}
+    for n, is_exact in zip(idx[order].tolist(), exact[order].tolist()):
+        ranked.setdefault(n, is_exact)
+        if len(ranked) == n_max:
+            break
+    return list(ranked.items())
+
+
+def get_display_name(n):
+    cities, _, _, country_names, _ = get_gazetteer()
+    name = cities['name'][n].decode('utf-8', errors='ignore')
+    country = cities['country'][n].decode()
+    return f'{name}, {country_names.get(country, country)}'
+
+
+# Ranked suggestions while typing ('City, Country', as stored in the LOCATIONS table)
+def suggest_locations(text, n_max=10):
+    return list(dict.fromkeys(get_display_name(n) for n, _ in search_cities(text, n_max * 2)))[:n_max]
+
+
+# Location by name: (lat, lon, tz_name) of the best match with the exact city name, None if not found
+def find_location(text):
+    found = search_cities(text, n_max=1)
+    if not found or not found[0][1]:
+        return None
+    cities, _, zones, _, _ = get_gazetteer()
+    city = cities[found[0][0]]
+    return round(float(city['lat']), 5), round(float(city['lon']), 5), zones[city['zone']].decode()
+
+
+# --- ONLINE FALLBACK (NOMINATIM): ONE GEOCODER, THROTTLED, RESULTS CACHED ---
+@lru_cache(maxsize=1)
+def get_geolocator():
+    from geopy.geocoders import Nominatim
+    return Nominatim(user_agent='city_locator')
+
+
+throttle_lock = threading.Lock()
+throttle = {'t_next': 0.0}
+
+
+# Requests start at most once per NOMINATIM_INTERVAL (concurrent callers overlap only the waits for answers)
+def wait_nominatim_turn():
+    with throttle_lock:
+        t_now = time.monotonic()
+        t_start = max(t_now, throttle['t_next'])
+        throttle['t_next'] = t_start + NOMINATIM_INTERVAL
+    time.sleep(t_start - t_now)
+
+
+# (lat, lon) of a place, None if not found (raises if offline)
+@lru_cache(maxsize=4096)
+def geocode_online(text):
+    wait_nominatim_turn()
+    location = get_geolocator().geocode(text)
+    return (location.latitude, location.longitude) if location else None
+
+
+# --- BUILD: SOURCES (ROWS: NAME, COUNTRY CODE, LAT, LON, POPULATION, TIME ZONE, ALTERNATE NAMES) ---
+# GeoNames dump files (cities15000.txt, countryInfo.txt: tab separated)
+def read_geonames(cities_path, countries_path):
+    rows = []
+    with open(cities_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = line.rstrip('\n').split('\t')
+            rows.append((fields[1], fields[8], float(fields[4]), float(fields[5]), int(fields[14] or 0), fields[17],
+                         fields[3].split(',') if fields[3] else []))
+    countries = {}
+    with open(countries_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.startswith('#'):
+                fields = line.rstrip('\n').split('\t')
+                countries[fields[0]] = fields[4]
+    return rows, countries
+
+
+# Same data from the geonamescache package (pip install geonamescache)
+def read_geonamescache():
+    import geonamescache
+    gc = geonamescache.GeonamesCache(min_city_population=15000)
+    rows = [(c['name'], c['countrycode'], c['latitude'], c['longitude'], c['population'], c['timezone'],
+             c.get('alternatenames', [])) for c in gc.get_cities().values()]
+    countries = {code: c['name'] for code, c in gc.get_countries().items()}
+    return rows, countries
+
+
+# --- BUILD: BINARY TABLES ---
+def build_gazetteer(rows, countries, out_dir):
+    rows = sorted(rows, key=lambda r: -r[4])
+    zone_names = sorted({r[5] for r in rows})
+    zone_code = {z: n for n, z in enumerate(zone_names)}
+
+    cities = np.zeros(len(rows), dtype=CITIES_DTYPE)
+    cities['name'] = [r[0].encode('utf-8')[:CITIES_DTYPE['name'].itemsize] for r in rows]
+    cities['country'] = [r[1].encode() for r in rows]
+    cities['lat'] = [r[2] for r in rows]
+    cities['lon'] = [r[3] for r in rows]
+    cities['population'] = [r[4] for r in rows]
+    cities['zone'] = [zone_code[r[5]] for r in rows]
+
+    # Name index: city name, plus Latin-script alternate names of large cities
+    keys = {}
+    for n, (name, _, _, _, population, _, alt_names) in enumerate(rows):
+        keys[(normalize_name(name), n)] = False
+        if population >= ALT_NAMES_MIN_POPULATION:
+            for alt_name in alt_names:
+                if re.fullmatch(r'[A-Za-zÀ-ɏ .\'-]+', alt_name):
+                    keys.setdefault((normalize_name(alt_name), n), True)
+    names = np.array(sorted((k.encode('utf-8')[:NAMES_DTYPE['key'].itemsize], n, alt) for (k, n), alt in keys.items()
+                            if k), dtype=NAMES_DTYPE)
+
+    os.makedirs(out_dir, exist_ok=True)
+    np.save(os.path.join(out_dir, 'cities.npy'), cities)
+    np.save(os.path.join(out_dir, 'names.npy'), names)
+    np.save(os.path.join(out_dir, 'zones.npy'), np.array([z.encode() for z in zone_names], dtype='S40'))
+    np.save(os.path.join(out_dir, 'countries.npy'), np.array(
+        sorted((code.encode(), name.encode('utf-8')[:48]) for code, name in countries.items()), dtype=COUNTRIES_DTYPE))
+    get_gazetteer.cache_clear()
+    return len(cities), len(names)
+
+
+# --- BUILD FROM THE COMMAND LINE ---
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Build the offline gazetteer')
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--cities', help='GeoNames cities15000.txt (default: geonamescache package)')
+    parser.add_argument('--countries', help='GeoNames countryInfo.txt')
+    parser.add_argument('--out', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), GAZETTEER_DIR))
+    args = parser.parse_args()
+
+    rows, countries = read_geonames(args.cities, args.countries) if args.cities else read_geonamescache()
+    n_cities, n_names = build_gazetteer(rows, countries, args.out)
+    print(f'{n_cities} cities, {n_names} names written to {args.out}')
+    sys.exit(0)
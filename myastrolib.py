@@ -5,31 +5,47 @@
 # See the LICENSE.txt file in the project root for full license information.
 
 import re
+import numpy as np
 import pandas as pd
-from geopy.geocoders import Nominatim
-from timezonefinder import TimezoneFinder
 from datetime import datetime, timedelta, timezone
 from dateutil.tz import tzoffset
-from zoneinfo import ZoneInfo
 from astropy.time import Time
 from astropy.coordinates import EarthLocation, AltAz
 from astropy.coordinates import solar_system_ephemeris, get_body
 import astropy.units as u
-from astropy.coordinates import SkyCoord
-from astroquery.vizier import Vizier
-from astroquery.simbad import Simbad
-Simbad.TIMEOUT = 2
+from astropy.coordinates import SkyCoord, GCRS, CartesianRepresentation
+from astropy.coordinates.builtin_frames.utils import get_polar_motion
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import warnings
+import erfa
 from erfa import ErfaWarning
 warnings.simplefilter('ignore', ErfaWarning)
+import myastrocache as myac
+import myastrocat as myacat
+import myastrogeo as myageo
+import myastroephem as myae
+import myastroresult as myar
+import myastrotime as myat
+import myastrotz as myatz
 
+# Online lookups (geopy, astroquery) are imported when first used: they are not needed at startup
 
-# --- GET LOCATION INFO ---
-def get_location_coord(sel_location):
+# Bump when the computed values change (invalidates the persistent result cache)
+# 2: float32 result container, NumPy time grids, Chebyshev tables rebuilt up to 2101
+# 3: per-location mode through the shared geocentric ephemeris
+ENGINE_VERSION = 3
+
+
+# Raised by a progress callback to stop a running computation
+class ComputeCancelled(Exception):
+    pass
+
+
+# --- GET LOCATION INFO (OFFLINE GAZETTEER FIRST, NOMINATIM AS FALLBACK) ---
+def get_location_coord(sel_location, online=True):
 
     # Init output structures
     lat, lon, tz_name, fixed_utc, local_utc = [], [], [], [], []
-    current_year = datetime.now().year
 
     # Regexp to get lat/lon pattern
     latlon_pattern = re.compile(r'''
@@ -45,33 +61,48 @@ def get_location_coord(sel_location):
         if lat > 90 or lat < -90 or lon > 180 or lon < -180:
             return [], [], [], [], [], 'Out of Range'
 
-    else: # Look for city
-        geolocator = Nominatim(user_agent='city_locator')
-        location = geolocator.geocode(sel_location)
-        if location: # Location found
-            lat, lon = location.latitude, location.longitude
-        else: # Location not found
+    else: # Look for city (the gazetteer also gives the time zone)
+        location = myageo.find_location(sel_location)
+        if location: # Location found offline
+            lat, lon, tz_name = location
+        elif online:
+            location = myageo.geocode_online(sel_location)
+            if not location: # Location not found
+                return [], [], [], [], [], 'NOT FOUND'
+            lat, lon = location
+        else: # Location not found (offline)
             return [], [], [], [], [], 'NOT FOUND'
 
-    # Timezone
-    tf_i = TimezoneFinder()
-    tz_name = tf_i.timezone_at(lat=lat, lng=lon)
+    # Timezone (shared time zone service), UTC without DST, Local Time
+    tz_name, fixed_utc, local_utc = myatz.get_location_tz(lat, lon, tz_name or None)
 
-    # Get UTC of Timezone without DST
-    tz_info = ZoneInfo(tz_name)
-    if lat >= 0: # Northern Hemisphere. Consider Jan, 1st
-        fixed_utc = tz_info.utcoffset(datetime(current_year, 1, 1)).total_seconds()/3600
-    else: # Southern Hemisphere. Consider Jul, 1st
-        fixed_utc = tz_info.utcoffset(datetime(current_year, 7, 1)).total_seconds()/3600
+    return lat, lon, tz_name, fixed_utc, local_utc, 'OK'
 
-    # Get Local Time
-    local_utc = lon / 15
 
-    return lat, lon, tz_name, fixed_utc, local_utc, 'OK'
+# --- ONLINE SERVICES (RAISES IF OFFLINE) ---
+def get_simbad():
+    from astroquery.simbad import Simbad
+    Simbad.TIMEOUT = 2
+    return Simbad
+
+
+def check_online():
+    get_simbad().add_votable_fields('main_id')
+
+
+# --- GET STAR INFO (OFFLINE CATALOGUE FIRST, SIMBAD / VIZIER AS FALLBACK) ---
+def get_star_info(sel_star, online=True):
+    star_info = myacat.find_star(sel_star)
+    if star_info is not None:
+        return star_info
+    if not online:
+        return [], [], [], [], []
+    return get_star_info_online(sel_star)
 
 
-# --- GET STAR INFO ---
-def get_star_info(sel_star):
+def get_star_info_online(sel_star):
+    from astroquery.vizier import Vizier
+    Simbad = get_simbad()
 
     # Init output structures
     Simbad.add_votable_fields('main_id')
@@ -102,19 +133,103 @@ def get_star_info(sel_star):
     return vizier_name, star_ra0, star_dec0, star_pm_ra, star_pm_dec
 
 
+# --- TIME ZONE FOR SELECTED TIME TYPE ---
+def get_time_zone(sel_time, tz_name, lon):
+    if sel_time == 'Civil': return tz_name
+    elif sel_time == 'Local': return tzoffset(None, int((lon/15) * 3600))
+    elif sel_time == 'Greenwich': return 0
+
+
+# --- TIME GRID (MULTIPLE DAYS) AS LOCAL TIME STAMPS ---
+def get_time_grid(sel_days, t_min, t_max, t_delta, curr_tz):
+    t_ns, _, n_day = myat.get_time_grid_ns(sel_days, t_min, t_max, t_delta, curr_tz)
+    return myat.to_local_index(t_ns, curr_tz), n_day
+
+
+# --- TIME / LOCATION COLUMNS OF OUTPUT STRUCTURE ---
+TIME_COLUMNS = ['t_current', 'n_day', 'hour_current', 'day_sel', 'loc_sel', 'n_loc']
+
+
+def get_time_columns(t_current, n_day, loc_name, nl):
+    wall_ns = t_current.tz_localize(None).as_unit('ns').asi8
+    day_code, day_labels = myat.get_day_codes(wall_ns)
+    return pd.DataFrame({
+        't_current': t_current,
+        'n_day': n_day,
+        'hour_current': myat.get_hour(wall_ns),
+        'day_sel': day_labels[day_code],
+        'loc_sel': [loc_name] * len(t_current),
+        'n_loc': [nl] * len(t_current)
+    })
+
+
+# --- OBJECT VALUES OF OUTPUT STRUCTURE (ASTROPY COORDINATES) ---
+def set_object_values(result, sel_obj, obj_altaz, obj_radec, t_current_sid, rows=slice(None)):
+    obj_ha = (t_current_sid - obj_radec.ra).wrap_at(360 * u.deg)
+    result.set_object(
+        sel_obj, obj_altaz.az.degree, obj_altaz.alt.degree, obj_ha.to_value(u.hourangle), obj_radec.dec.degree, rows)
+
+
+# --- PROPAGATE STAR POSITIONS TO TODAY (ALL STARS AT ONCE) ---
+def get_stars_radec(stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec):
+    stars_2000 = SkyCoord(
+        ra = np.asarray(stars_ra0, dtype=float) * u.deg,
+        dec = np.asarray(stars_dec0, dtype=float) * u.deg,
+        pm_ra_cosdec = np.asarray(stars_pm_ra, dtype=float) * u.mas / u.yr,  # milliarcsec/year
+        pm_dec = np.asarray(stars_pm_dec, dtype=float) * u.mas / u.yr,  # milliarcsec/year
+        frame='icrs',
+        obstime=Time('J2000')
+    )
+    today = Time.now()
+    stars_today = stars_2000.apply_space_motion(new_obstime=today)
+    stars_radec = SkyCoord(
+        ra=stars_today.ra,
+        dec=stars_today.dec,
+        frame='icrs'
+    )
+    return stars_radec
+
+
 # --- GET SOLAR SYSTEM BODIES COORDINATES ---
 def get_coords(
         sel_ssbodies,
         sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
         loc_names, lats, lons, tz_names, sel_time,
-        sel_days, t_min, t_max, t_delta):
+        sel_days, t_min, t_max, t_delta, batched=False, ephemeris='builtin', n_workers=0, as_frame=True):
+
+    # Process pool: (location, day) units computed in parallel
+    if n_workers > 1 and len(loc_names) * len(sel_days) > 1:
+        return get_coords_parallel(
+            n_workers,
+            sel_ssbodies,
+            sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+            loc_names, lats, lons, tz_names, sel_time,
+            sel_days, t_min, t_max, t_delta, batched, ephemeris, as_frame=as_frame)
+
+    # Fast analytic mode (pure NumPy)
+    if ephemeris == 'fast':
+        return get_coords_fast(
+            sel_ssbodies,
+            sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+            loc_names, lats, lons, tz_names, sel_time,
+            sel_days, t_min, t_max, t_delta, as_frame)
 
-    df_s = [] # Init output structure
+    # Batched mode: all locations computed at once (only mode supporting non-astropy ephemerides)
+    if batched or ephemeris != 'builtin':
+        return get_coords_batched(
+            sel_ssbodies,
+            sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+            loc_names, lats, lons, tz_names, sel_time,
+            sel_days, t_min, t_max, t_delta, ephemeris, as_frame)
+
+    # Output structure (all locations)
+    result = get_flat_time_grid(
+        loc_names, lats, lons, tz_names, sel_time, sel_days, t_min, t_max, t_delta, sel_ssbodies + sel_stars)[0]
+    not_found = []
 
     # Loop through locations
-    nl = 0
-    for lat, lon, loc_name, tz_name in zip(lats, lons, loc_names,tz_names):
-        nl += 1
+    for nl, (lat, lon) in enumerate(zip(lats, lons)):
+        rows = result.loc_rows(nl)
 
         # Create location
         location = EarthLocation(
@@ -123,102 +238,810 @@ def get_coords(
             height = 0 * u.m
         )
 
-        # Select Time Type
-        if sel_time == 'Civil': curr_tz = tz_name
-        elif sel_time == 'Local': curr_tz = tzoffset(None, int((lon/15) * 3600))
-        elif sel_time == 'Greenwich': curr_tz = 0
-
-        # Get local time (multiple days)
-        delta_days = 1 if t_min >= t_max else 0
-        t_current_s = [pd.date_range(
-            start=f'{sel_day} {t_min}',
-            end=f'{pd.to_datetime(sel_day) + pd.Timedelta(days=delta_days):%Y-%m-%d} {t_max}',
-            freq=f'{t_delta}min',
-            tz=curr_tz,
-            nonexistent='shift_forward'
-        ) for sel_day in sel_days]
-        t_current = pd.concat([r.to_series() for r in t_current_s]).index
-        n_day_s = [[i+1 for _ in row] for i, row in enumerate(t_current_s)]
-        n_day = [elem for row in n_day_s for elem in row]
-
-        # Day and location
-        day_sel = [f'{t:%Y-%m-%d}' for t in t_current]
-        loc_sel = [loc_name] * len(t_current)
-        n_loc = [nl] * len(t_current)
-
         # Conversion to UTC and sidereal
-        hour_current = t_current.hour + t_current.minute / 60 + t_current.second / 3600
-        t_utc = Time(t_current.to_pydatetime())
+        t_utc = myat.get_time_utc(result.t_ns[rows])
         t_current_sid = t_utc.sidereal_time('apparent', lon * u.deg)
 
         # Coordinate transform
         altaz_frame = AltAz(obstime=t_utc, location=location)
+        obsgeoloc, obsgeovel = location.get_gcrs_posvel(t_utc)
+        topo_frame = GCRS(obstime=t_utc, obsgeoloc=obsgeoloc, obsgeovel=obsgeovel)
 
-        # Init current location output structure
-        df_s1 = [
-            pd.DataFrame({
-                't_current': t_current,
-                'n_day': n_day,
-                'hour_current': hour_current,
-                'day_sel': day_sel,
-                'loc_sel': loc_sel,
-                'n_loc': n_loc
-            })
-        ]
-
-        # Get Solar System Objects Position
+        # Get Solar System Objects Position (geocentric, shared with the other locations and cached), then as seen
+        # from the location (as get_body with location)
         solar_system_ephemeris.set('builtin')
         for sel_ssbody in sel_ssbodies:
             try:
-                ssb_radec = get_body(sel_ssbody, t_utc, location=location)
-            except:
+                ssb_geo = get_body_geocentric(sel_ssbody, t_utc, result.t_ns[rows].view('datetime64[ns]'))
+            except KeyError:
                 print(f'Solar System Body {sel_ssbody} not found. Skipped')
+                not_found.append(sel_ssbody)
+                continue
+            ssb_radec = SkyCoord(GCRS(CartesianRepresentation(ssb_geo.T * u.m), obstime=t_utc)).transform_to(topo_frame)
             ssb_altaz = ssb_radec.transform_to(altaz_frame)
-            ssb_ha = (t_current_sid - ssb_radec.ra).wrap_at(360 * u.deg)
-
-            # Current Object results
-            df_i = pd.DataFrame({
-                f'{sel_ssbody}_azimuth_deg': ssb_altaz.az.degree,
-                f'{sel_ssbody}_altitude_deg': ssb_altaz.alt.degree,
-                f'{sel_ssbody}_ha': ssb_ha,
-                f'{sel_ssbody}_declination_deg': ssb_radec.dec.degree,
-            })
-            df_s1.append(df_i)
-
-        for (sel_star, star_ra0, star_dec0, star_pm_ra, star_pm_dec) in (
-            zip(sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec)):
-
-            # Propagte Star position to today
-            star_2000 = SkyCoord(
-                ra = star_ra0 * u.deg,
-                dec = star_dec0 * u.deg,
-                pm_ra_cosdec = star_pm_ra * u.mas / u.yr,  # milliarcsec/year
-                pm_dec = star_pm_dec * u.mas / u.yr,  # milliarcsec/year
-                frame='icrs',
-                obstime=Time('J2000')
-            )
-            today = Time.now()
-            star_today = star_2000.apply_space_motion(new_obstime=today)
-            star_radec = SkyCoord(
-                ra=star_today.ra,
-                dec=star_today.dec,
-                frame='icrs'
-            )
-            star_altaz = star_radec.transform_to(altaz_frame)
-            star_ha = (t_current_sid - star_radec.ra).wrap_at(360 * u.deg)
-
-            # Current Star results
-            df_i = pd.DataFrame({
-                f'{sel_star}_azimuth_deg': star_altaz.az.degree,
-                f'{sel_star}_altitude_deg': star_altaz.alt.degree,
-                f'{sel_star}_ha': star_ha,
-                f'{sel_star}_declination_deg': star_radec.dec.degree,
-            })
-            df_s1.append(df_i)
-
-        # Update output structure with current location values
-        df_s.append(pd.concat(df_s1, axis=1))
+            set_object_values(result, sel_ssbody, ssb_altaz, ssb_radec, t_current_sid, rows)
+
+        # Get Stars Position (all stars stacked, broadcast against the time grid)
+        if len(sel_stars) > 0:
+            stars_radec = get_stars_radec(stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec)
+            stars_altaz = stars_radec[:, np.newaxis].transform_to(altaz_frame)
+            for ns, sel_star in enumerate(sel_stars):
+                set_object_values(result, sel_star, stars_altaz[ns], stars_radec[ns], t_current_sid, rows)
 
     # Output
+    result.drop_objects(not_found)
+    return result.to_frame() if as_frame else result
+
+
+# --- EARTH ROTATION MATRICES (GCRS -> ITRS) ---
+def get_earth_rotation(t_utc):
+    xp, yp = get_polar_motion(t_utc)
+    return erfa.c2t06a(t_utc.tt.jd1, t_utc.tt.jd2, t_utc.ut1.jd1, t_utc.ut1.jd2, xp, yp)
+
+
+# --- TOPOCENTRIC ALT/AZ FROM ITRS VECTORS ---
+def get_altaz(v_itrs, lat, lon):
+
+    # Local East / North / Up unit vectors (geodetic latitude)
+    lat_r, lon_r = np.radians(lat), np.radians(lon)
+    v_e = -np.sin(lon_r) * v_itrs[..., 0] + np.cos(lon_r) * v_itrs[..., 1]
+    v_n = (- np.sin(lat_r) * np.cos(lon_r) * v_itrs[..., 0]
+           - np.sin(lat_r) * np.sin(lon_r) * v_itrs[..., 1]
+           + np.cos(lat_r) * v_itrs[..., 2])
+    v_u = (np.cos(lat_r) * np.cos(lon_r) * v_itrs[..., 0]
+           + np.cos(lat_r) * np.sin(lon_r) * v_itrs[..., 1]
+           + np.sin(lat_r) * v_itrs[..., 2])
+
+    az = np.degrees(np.arctan2(v_e, v_n)) % 360
+    alt = np.degrees(np.arctan2(v_u, np.hypot(v_e, v_n)))
+    return az, alt
+
+
+# --- RA/DEC FROM CARTESIAN VECTORS ---
+def get_radec(v):
+    ra = np.degrees(np.arctan2(v[..., 1], v[..., 0])) % 360
+    dec = np.degrees(np.arctan2(v[..., 2], np.hypot(v[..., 0], v[..., 1])))
+    return ra, dec
+
+
+# --- OBJECT VALUES FROM PLAIN ARRAYS (DEGREES, SIDEREAL TIME IN HOURS) ---
+def set_object_arrays(result, sel_obj, az, alt, ra, dec, t_current_sid):
+    result.set_object(sel_obj, az, alt, (t_current_sid - ra / 15) % 24, dec)
+
+
+# --- GEOCENTRIC BODY POSITION [m] (SHARED BY ALL OBSERVERS, CACHED) ---
+def get_body_geocentric(sel_ssbody, t_utc, t_ns, ephemeris='builtin', cache=True):
+
+    def compute():
+        if ephemeris == 'chebyshev': # Precomputed tables (astropy outside their range)
+            t_tt = t_utc.tt
+            ephem = myae.get_ephemeris()
+            if ephem.covers(sel_ssbody, t_tt.jd1, t_tt.jd2):
+                return ephem.position(sel_ssbody, t_tt.jd1, t_tt.jd2) * 1000
+        return get_body(sel_ssbody, t_utc).cartesian.xyz.to_value(u.m).T
+
+    if not cache: # One-off time grids (e.g. root finding iterations)
+        return compute()
+    key = myac.ephemeris_cache.make_key(sel_ssbody, t_ns, ephemeris)
+    return myac.ephemeris_cache.get_or_compute(key, compute)
+
+
+# --- FLATTENED (LOCATION x TIME) GRID: ONE OBSERVER PER TIME STAMP ---
+# Returns the output structure (objects preallocated, see myastroresult.CoordsResult) and the unique UTC instants
+def get_flat_time_grid(loc_names, lats, lons, tz_names, sel_time, sel_days, t_min, t_max, t_delta, objects=()):
+
+    # Time grids of all locations (each location keeps its own time zone)
+    curr_tzs = [get_time_zone(sel_time, tz_name, lon) for lon, tz_name in zip(lons, tz_names)]
+    grids = [myat.get_time_grid_ns(sel_days, t_min, t_max, t_delta, curr_tz) for curr_tz in curr_tzs]
+    result = myar.CoordsResult(loc_names, curr_tzs, *zip(*grids), objects) if len(grids) > 0 else \
+        myar.CoordsResult(loc_names, [], [], [], [], objects)
+
+    # Time-only quantities are computed once per UTC instant (t_ns), then expanded with i_t
+    t_ns, i_t = np.unique(result.t_ns.view('datetime64[ns]'), return_inverse=True)
+    i_loc = result.n_loc - 1
+    return result, t_ns, i_t, i_loc
+
+
+# --- GET COORDINATES (ALL LOCATIONS AT ONCE) ---
+def get_coords_batched(
+        sel_ssbodies,
+        sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+        loc_names, lats, lons, tz_names, sel_time,
+        sel_days, t_min, t_max, t_delta, ephemeris='builtin', as_frame=True):
+
+    # Flattened (location x time) arrays
+    result, t_ns, i_t, i_loc = get_flat_time_grid(
+        loc_names, lats, lons, tz_names, sel_time, sel_days, t_min, t_max, t_delta, sel_ssbodies + sel_stars)
+    t_utc = myat.get_time_utc(t_ns)
+    location = EarthLocation(
+        lat = np.asarray(lats, dtype=float) * u.deg,
+        lon = np.asarray(lons, dtype=float) * u.deg,
+        height = np.zeros(len(lats)) * u.m
+    )
+    lat_all = location.lat.degree[i_loc]
+    lon_all = location.lon.degree[i_loc]
+    obs_itrs = np.stack([location.x.to_value(u.m), location.y.to_value(u.m), location.z.to_value(u.m)], axis=-1)[i_loc]
+
+    # Earth rotation and apparent sidereal time
+    rot = get_earth_rotation(t_utc)
+    obs_gcrs = np.einsum('nji,nj->ni', rot[i_t], obs_itrs)
+    t_current_sid = (t_utc.sidereal_time('apparent', 'greenwich').hour[i_t] + lon_all / 15) % 24
+
+    # Get Solar System Objects Position (geocentric, once per body and cached), then topocentric for each observer
+    not_found = []
+    solar_system_ephemeris.set('builtin')
+    for sel_ssbody in sel_ssbodies:
+        try:
+            ssb_geo = get_body_geocentric(sel_ssbody, t_utc, t_ns, ephemeris)
+        except KeyError:
+            print(f'Solar System Body {sel_ssbody} not found. Skipped')
+            not_found.append(sel_ssbody)
+            continue
+        ssb_itrs = np.einsum('nij,nj->ni', rot, ssb_geo)[i_t] - obs_itrs
+        ssb_az, ssb_alt = get_altaz(ssb_itrs, lat_all, lon_all)
+        ssb_ra, ssb_dec = get_radec(ssb_geo[i_t] - obs_gcrs)
+        set_object_arrays(result, sel_ssbody, ssb_az, ssb_alt, ssb_ra, ssb_dec, t_current_sid)
+
+    # Get Stars Position: all stars propagated and transformed at once (parallax neglected)
+    if len(sel_stars) > 0:
+        stars_radec = get_stars_radec(stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec)
+        stars_geo = stars_radec[:, np.newaxis].transform_to(GCRS(obstime=t_utc)).cartesian.xyz.value
+        stars_itrs = np.einsum('nij,jsn->sni', rot, stars_geo)
+        for ns, sel_star in enumerate(sel_stars):
+            star_az, star_alt = get_altaz(stars_itrs[ns, i_t], lat_all, lon_all)
+            set_object_arrays(
+                result, sel_star, star_az, star_alt, stars_radec.ra.degree[ns], stars_radec.dec.degree[ns], t_current_sid)
+
+    # Output
+    result.drop_objects(not_found)
+    return result.to_frame() if as_frame else result
+
+
+# --- GEODETIC (WGS84) TO ITRS [m] ---
+def get_itrs_location(lat, lon, height=0.0):
+    a, f = 6378137.0, 1 / 298.257223563
+    e2 = f * (2 - f)
+    lat_r, lon_r = np.radians(lat), np.radians(lon)
+    n = a / np.sqrt(1 - e2 * np.sin(lat_r)**2)
+    return np.stack([
+        (n + height) * np.cos(lat_r) * np.cos(lon_r),
+        (n + height) * np.cos(lat_r) * np.sin(lon_r),
+        (n * (1 - e2) + height) * np.sin(lat_r)
+    ], axis=-1)
+
+
+# --- STARS: LINEAR PROPER MOTION TO TODAY, J2000 UNIT VECTORS (FAST MODE) ---
+def get_stars_vectors_fast(stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec):
+    years = (datetime.now(timezone.utc) - datetime(2000, 1, 1, 12, tzinfo=timezone.utc)).days / 365.25
+    stars_dec = np.asarray(stars_dec0, dtype=float) + np.asarray(stars_pm_dec, dtype=float) * years / 3.6e6
+    stars_ra = (np.asarray(stars_ra0, dtype=float)
+                + np.asarray(stars_pm_ra, dtype=float) * years / 3.6e6 / np.cos(np.radians(stars_dec))) % 360
+    dec_r, ra_r = np.radians(stars_dec), np.radians(stars_ra)
+    stars_vec = np.stack([np.cos(dec_r) * np.cos(ra_r), np.cos(dec_r) * np.sin(ra_r), np.sin(dec_r)], axis=-1)
+    return stars_ra, stars_dec, stars_vec
+
+
+# --- GET COORDINATES (FAST ANALYTIC MODE, PURE NUMPY) ---
+def get_coords_fast(
+        sel_ssbodies,
+        sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+        loc_names, lats, lons, tz_names, sel_time,
+        sel_days, t_min, t_max, t_delta, as_frame=True):
+
+    # Flattened (location x time) arrays
+    result, t_ns, i_t, i_loc = get_flat_time_grid(
+        loc_names, lats, lons, tz_names, sel_time, sel_days, t_min, t_max, t_delta, sel_ssbodies + sel_stars)
+    lat_all = np.asarray(lats, dtype=float)[i_loc]
+    lon_all = np.asarray(lons, dtype=float)[i_loc]
+    obs_itrs = get_itrs_location(np.asarray(lats, dtype=float), np.asarray(lons, dtype=float))[i_loc]
+
+    # Julian Dates and Earth orientation (UT1 = UTC, polar motion neglected)
+    jd_utc = sum(myat.get_jd(t_ns))
+    jd_tt = jd_utc + myae.delta_t(jd_utc) / 86400
+    prec, nut, eps0, gast = myae.earth_orientation(jd_utc, jd_tt)
+    earth_rot = myae.rot_z(np.radians(gast))
+    rot = earth_rot @ nut @ prec # J2000 equator -> terrestrial
+    obs_j2000 = np.einsum('nji,nj->ni', rot[i_t], obs_itrs)
+    t_current_sid = (gast[i_t] + lon_all) / 15 % 24
+
+    # Solar System Objects: geocentric true equator of date, then topocentric for each observer
+    not_found = []
+    for sel_ssbody in sel_ssbodies:
+        try:
+            ssb_true = myae.analytic_position(sel_ssbody, jd_tt, eps0, nut) * 1000
+        except ValueError:
+            print(f'Solar System Body {sel_ssbody} not found. Skipped')
+            not_found.append(sel_ssbody)
+            continue
+        ssb_itrs = np.einsum('nij,nj->ni', earth_rot, ssb_true)[i_t] - obs_itrs
+        ssb_az, ssb_alt = get_altaz(ssb_itrs, lat_all, lon_all)
+        ssb_j2000 = np.einsum('nji,nj->ni', nut @ prec, ssb_true)
+        ssb_ra, ssb_dec = get_radec(ssb_j2000[i_t] - obs_j2000)
+        set_object_arrays(result, sel_ssbody, ssb_az, ssb_alt, ssb_ra, ssb_dec, t_current_sid)
+
+    # Stars: linear proper motion to today, precession / nutation / rotation (aberration neglected)
+    if len(sel_stars) > 0:
+        stars_ra, stars_dec, stars_vec = get_stars_vectors_fast(stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec)
+        stars_itrs = np.einsum('nij,sj->sni', rot, stars_vec)
+        for ns, sel_star in enumerate(sel_stars):
+            star_az, star_alt = get_altaz(stars_itrs[ns, i_t], lat_all, lon_all)
+            set_object_arrays(result, sel_star, star_az, star_alt, stars_ra[ns], stars_dec[ns], t_current_sid)
+
+    # Output
+    result.drop_objects(not_found)
+    return result.to_frame() if as_frame else result
+
+
+# --- GET COORDINATES THROUGH THE PERSISTENT RESULT CACHE ---
+def get_coords_cached(result_cache, n_workers=0, as_frame=True, **kwargs):
+    return get_coords_cached_many(result_cache, [kwargs], n_workers, as_frame=as_frame)[0]
+
+
+# Several get_coords calls: cached results are rebuilt, missing ones run in parallel when n_workers > 1
+def get_coords_cached_many(result_cache, args_list, n_workers=0, progress=None, as_frame=True):
+
+    # Canonical key: all inputs, engine version and star propagation epoch (proper motion is applied to today)
+    keys = [myac.make_result_key(
+        ENGINE_VERSION, stars_epoch=datetime.now(timezone.utc).year if len(kwargs['sel_stars']) > 0 else None,
+        **kwargs) for kwargs in args_list]
+
+    # Only object columns are stored: the time / location columns are cheaply rebuilt
+    results = [None] * len(args_list)
+    for n, (key, kwargs) in enumerate(zip(keys, args_list)):
+        columns = result_cache.get(key) if result_cache is not None else None
+        if columns is not None:
+            results[n] = get_coords_from_columns(columns, kwargs)
+
+    # Missing results
+    i_miss = [n for n, result in enumerate(results) if result is None]
+    if n_workers > 1 and len(i_miss) > 1:
+        columns_miss = run_parallel(get_coords_columns, [args_list[n] for n in i_miss], n_workers, progress)
+        for n, columns in zip(i_miss, columns_miss):
+            results[n] = get_coords_from_columns(columns, args_list[n])
+    else:
+        for n_done, n in enumerate(i_miss):
+            if progress is not None: progress(n_done, len(i_miss))
+            results[n] = get_coords(**args_list[n], n_workers=n_workers, as_frame=False)
+        if progress is not None: progress(len(i_miss), len(i_miss))
+    if result_cache is not None:
+        for n in i_miss:
+            result_cache.put(keys[n], results[n].object_columns())
+    return [result.to_frame() for result in results] if as_frame else results
+
+
+# Output structure from object columns (time / location columns rebuilt)
+def get_coords_from_columns(columns, kwargs):
+    time_args = ['loc_names', 'lats', 'lons', 'tz_names', 'sel_time', 'sel_days', 't_min', 't_max', 't_delta']
+    objects = [obj for obj in kwargs['sel_ssbodies'] + kwargs['sel_stars'] if f'{obj}_{OBJECT_COLUMNS[0]}' in columns]
+    result = get_flat_time_grid(**{k: kwargs[k] for k in time_args}, objects=objects)[0]
+    result.set_object_columns(columns)
+    return result
+
+
+# --- PROCESS POOL (CREATED ON FIRST USE, SHARED BY ALL CALLS) ---
+process_pool = None
+
+
+def get_process_pool(n_workers):
+    global process_pool
+    if process_pool is None or process_pool._max_workers != n_workers:
+        if process_pool is not None:
+            process_pool.shutdown(wait=False, cancel_futures=True)
+        process_pool = ProcessPoolExecutor(max_workers=n_workers)
+    return process_pool
+
+
+# Run func on all tasks in worker processes (results in task order, progress reported as tasks complete)
+def run_parallel(func, tasks, n_workers, progress=None):
+    pool = get_process_pool(n_workers)
+    futures = {pool.submit(func, task): n for n, task in enumerate(tasks)}
+    results = [None] * len(tasks)
+    try:
+        if progress is not None: progress(0, len(tasks))
+        for n_done, future in enumerate(as_completed(futures)):
+            results[futures[future]] = future.result()
+            if progress is not None: progress(n_done + 1, len(tasks))
+    except BaseException: # Cancelled or failed: pending tasks are dropped
+        for future in futures:
+            future.cancel()
+        raise
+    return results
+
+
+# Work unit run in a worker process: object columns only, as plain float32 arrays
+def get_coords_columns(kwargs):
+    return get_coords(**kwargs, as_frame=False).object_columns()
+
+
+# --- GET COORDINATES (LOCATION x DAY UNITS SHARDED ACROSS A PROCESS POOL) ---
+def get_coords_parallel(
+        n_workers,
+        sel_ssbodies,
+        sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+        loc_names, lats, lons, tz_names, sel_time,
+        sel_days, t_min, t_max, t_delta, batched=False, ephemeris='builtin', progress=None, as_frame=True):
+
+    # Work units: (location, day). Locations of the same day are grouped (about 4 tasks per worker)
+    n_groups = min(len(loc_names), int(np.ceil(4 * n_workers / len(sel_days))))
+    tasks, units = [], []
+    for nd, sel_day in enumerate(sel_days):
+        for i_locs in np.array_split(np.arange(len(loc_names)), n_groups):
+            tasks.append(dict(
+                sel_ssbodies = sel_ssbodies,
+                sel_stars = sel_stars,
+                stars_ra0 = stars_ra0,
+                stars_dec0 = stars_dec0,
+                stars_pm_ra = stars_pm_ra,
+                stars_pm_dec = stars_pm_dec,
+                loc_names = [loc_names[nl] for nl in i_locs],
+                lats = [lats[nl] for nl in i_locs],
+                lons = [lons[nl] for nl in i_locs],
+                tz_names = [tz_names[nl] for nl in i_locs],
+                sel_time = sel_time,
+                sel_days = [sel_day],
+                t_min = t_min,
+                t_max = t_max,
+                t_delta = t_delta,
+                batched = batched,
+                ephemeris = ephemeris
+            ))
+            units.append((i_locs, nd))
+    results = run_parallel(get_coords_columns, tasks, n_workers, progress)
+
+    # Reassemble: rows of each task are the (location, day) rows of the full grid, in the same order
+    objects = [obj for obj in sel_ssbodies + sel_stars if f'{obj}_{OBJECT_COLUMNS[0]}' in results[0]]
+    result = get_flat_time_grid(
+        loc_names, lats, lons, tz_names, sel_time, sel_days, t_min, t_max, t_delta, objects)[0]
+    columns = result.object_columns() # Views of the output block
+    for (i_locs, nd), unit_columns in zip(units, results):
+        rows = np.flatnonzero(np.isin(result.n_loc, i_locs + 1) & (result.n_day == nd + 1))
+        for c, v in unit_columns.items():
+            columns[c][rows] = v
+    return result.to_frame() if as_frame else result
+
+
+# --- PER-SERIES (OBJECT, LOCATION, DAY) INCREMENTAL COMPUTATION ---
+OBJECT_COLUMNS = myar.RESULT_QUANTITIES
+
+
+# Local day chunk holding each sample: a full-day chunk spans [day 00:00, day+1 00:00]
+def get_chunk_days(t_current, n_day, sel_days):
+    day_start = pd.to_datetime(np.asarray(sel_days)[np.asarray(n_day) - 1])
+    t_naive = t_current.tz_localize(None)
+    chunk_days = t_naive.normalize()
+    in_first_day = (t_naive > day_start) & (t_naive == chunk_days) & (chunk_days == day_start + pd.Timedelta(days=1))
+    chunk_days = chunk_days.where(~in_first_day, day_start)
+    return np.asarray(chunk_days.strftime('%Y-%m-%d'))
+
+
+def get_coords_incremental(series_cache, result_cache, progress=None, n_workers=0, **kwargs):
+
+    sel_ssbodies, sel_stars = kwargs['sel_ssbodies'], kwargs['sel_stars']
+    sel_time, t_delta, ephemeris = kwargs['sel_time'], kwargs['t_delta'], kwargs.get('ephemeris', 'builtin')
+    stars_par = list(zip(kwargs['stars_ra0'], kwargs['stars_dec0'], kwargs['stars_pm_ra'], kwargs['stars_pm_dec']))
+    objs = [(b, ()) for b in sel_ssbodies] + [(s, tuple(float(p) for p in par)) for s, par in zip(sel_stars, stars_par)]
+    locs = list(zip(kwargs['loc_names'], kwargs['lats'], kwargs['lons'], kwargs['tz_names']))
+
+    def series_key(obj, loc, day):
+        return (obj[0], obj[1], loc[0], float(loc[1]), float(loc[2]), loc[3], day,
+                sel_time, t_delta, ephemeris, kwargs.get('batched', False), ENGINE_VERSION)
+
+    # Requested samples of each location, mapped onto full-day chunks
+    loc_grids = []
+    chunks = {} # Chunks used by this request (kept here, so they cannot be evicted before assembly)
+    missing = {} # day -> (location indexes, object indexes) to be computed
+    for nl, loc in enumerate(locs):
+        curr_tz = get_time_zone(sel_time, loc[3], loc[2])
+        t_current, n_day = get_time_grid(kwargs['sel_days'], kwargs['t_min'], kwargs['t_max'], t_delta, curr_tz)
+        chunk_days = get_chunk_days(t_current, n_day, kwargs['sel_days'])
+        t_ns = t_current.tz_convert('UTC').tz_localize(None).values.astype('datetime64[ns]').view('int64')
+        pos = np.zeros(len(t_current), dtype=int)
+        for day in np.unique(chunk_days):
+            t_chunk = get_time_grid([day], '00:00', '00:00', t_delta, curr_tz)[0]
+            t_chunk = t_chunk.tz_convert('UTC').tz_localize(None).values.astype('datetime64[ns]').view('int64')
+            mask = chunk_days == day
+            i_chunk = np.minimum(np.searchsorted(t_chunk, t_ns[mask]), len(t_chunk) - 1)
+            if not np.array_equal(t_chunk[i_chunk], t_ns[mask]):
+                # Time window not aligned with the full-day grid (e.g. tmin not multiple of tdelta): direct computation
+                return get_coords_cached_many(result_cache, [kwargs], n_workers, progress)[0]
+            pos[mask] = i_chunk
+            for no, obj in enumerate(objs):
+                key = series_key(obj, loc, day)
+                chunks[key] = series_cache.get(key)
+                if chunks[key] is None:
+                    missing.setdefault(day, (set(), set()))
+                    missing[day][0].add(nl)
+                    missing[day][1].add(no)
+        loc_grids.append((t_current, n_day, chunk_days, pos))
+
+    # Compute missing full-day chunks, one call per day (in parallel with n_workers > 1).
+    # Progress is reported, and cancellation checked, per chunk
+    missing = [(day, sorted(i_locs), sorted(i_objs)) for day, (i_locs, i_objs) in missing.items()]
+    args_list = []
+    for day, i_locs, i_objs in missing:
+        day_stars = [objs[no] for no in i_objs if objs[no][1]]
+        args_list.append(dict(
+            sel_ssbodies = [objs[no][0] for no in i_objs if not objs[no][1]],
+            sel_stars = [s[0] for s in day_stars],
+            stars_ra0 = [s[1][0] for s in day_stars],
+            stars_dec0 = [s[1][1] for s in day_stars],
+            stars_pm_ra = [s[1][2] for s in day_stars],
+            stars_pm_dec = [s[1][3] for s in day_stars],
+            loc_names = [locs[nl][0] for nl in i_locs],
+            lats = [locs[nl][1] for nl in i_locs],
+            lons = [locs[nl][2] for nl in i_locs],
+            tz_names = [locs[nl][3] for nl in i_locs],
+            sel_time = sel_time,
+            sel_days = [day],
+            t_min = '00:00',
+            t_max = '00:00',
+            t_delta = t_delta,
+            batched = kwargs.get('batched', False),
+            ephemeris = ephemeris
+        ))
+    day_results = get_coords_cached_many(result_cache, args_list, n_workers, progress, as_frame=False)
+
+    for (day, i_locs, i_objs), day_result in zip(missing, day_results):
+        for n, nl in enumerate(i_locs):
+            for no in i_objs:
+                if objs[no][0] in day_result.objects: # Bodies not found are skipped
+                    key = series_key(objs[no], locs[nl], day)
+                    chunks[key] = series_cache.put(key, day_result.object_view(objs[no][0], n).copy())
+
+    # Assemble the output from the stored chunks (objects found for all locations and days)
+    found = [obj for obj in objs if all(
+        chunks[series_key(obj, loc, day)] is not None
+        for loc, grid in zip(locs, loc_grids) for day in np.unique(grid[2]))]
+    result = myar.CoordsResult.from_local_times(
+        [loc[0] for loc in locs], [grid[0] for grid in loc_grids], [grid[1] for grid in loc_grids],
+        [obj[0] for obj in found])
+    for nl, (loc, (t_current, n_day, chunk_days, pos)) in enumerate(zip(locs, loc_grids)):
+        for obj in found:
+            values = result.object_view(obj[0], nl)
+            for day in np.unique(chunk_days):
+                mask = chunk_days == day
+                values[:, mask] = chunks[series_key(obj, loc, day)][:, pos[mask]]
+    return result.to_frame()
+
+
+# --- POSITIONS OF ONE OBJECT FROM ONE LOCATION AT ARBITRARY UTC INSTANTS ---
+def get_positions(sel_obj, star_par, lat, lon, t_ns, ephemeris='builtin', cache=False):
+    t_ns = np.asarray(t_ns, dtype='datetime64[ns]')
+    obs_itrs = get_itrs_location(lat, lon)
+
+    # Rotation to terrestrial frame, geocentric object position (GCRS / J2000), Greenwich sidereal time [h]
+    if ephemeris == 'fast':
+        jd_utc = sum(myat.get_jd(t_ns))
+        jd_tt = jd_utc + myae.delta_t(jd_utc) / 86400
+        prec, nut, eps0, gast = myae.earth_orientation(jd_utc, jd_tt)
+        rot = myae.rot_z(np.radians(gast)) @ nut @ prec
+        if star_par:
+            ra, dec, vec = get_stars_vectors_fast(*[[p] for p in star_par])
+            geo = np.broadcast_to(vec, (len(t_ns), 3))
+        else:
+            geo = np.einsum('nji,nj->ni', nut @ prec, myae.analytic_position(sel_obj, jd_tt, eps0, nut) * 1000)
+        sid = gast / 15
+    else:
+        t_utc = myat.get_time_utc(t_ns)
+        rot = get_earth_rotation(t_utc)
+        if star_par:
+            stars_radec = get_stars_radec(*[[p] for p in star_par])
+            ra, dec = stars_radec.ra.degree, stars_radec.dec.degree
+            geo = stars_radec[:, np.newaxis].transform_to(GCRS(obstime=t_utc)).cartesian.xyz.value[:, 0].T
+        else:
+            geo = get_body_geocentric(sel_obj, t_utc, t_ns, ephemeris, cache)
+        sid = t_utc.sidereal_time('apparent', 'greenwich').hour
+
+    # Topocentric vectors (stars: no parallax)
+    v_itrs = np.einsum('nij,nj->ni', rot, geo)
+    if not star_par:
+        v_itrs = v_itrs - obs_itrs
+        ra, dec = get_radec(geo - np.einsum('nji,nj->ni', rot, np.broadcast_to(obs_itrs, geo.shape)))
+    az, alt = get_altaz(v_itrs, lat, lon)
+    return {
+        'azimuth_deg': az,
+        'altitude_deg': alt,
+        'ha': (sid + lon / 15 - ra / 15) % 24,
+        'declination_deg': np.broadcast_to(dec, az.shape),
+        'lha': ((lon - np.degrees(np.arctan2(v_itrs[:, 1], v_itrs[:, 0]))) / 15 + 12) % 24 - 12 # Local hour angle [-12, 12)
+    }
+
+
+# --- EVENTS (RISE, SET, CULMINATIONS, TWILIGHTS): CROSSINGS OF (QUANTITY, LEVEL) ---
+# Rise / set altitudes: refraction (34') plus semi-diameter for SUN / MOON, refraction only otherwise
+def get_event_specs(sel_obj):
+    h0 = -0.8333 if sel_obj in ['SUN', 'MOON'] else -0.5667
+    specs = [
+        ('altitude', h0, 'Rise', 'Set'),
+        ('upper', 0, 'Upper Culmination', None),
+        ('lower', 0, 'Lower Culmination', None)
+    ]
+    if sel_obj == 'SUN':
+        specs += [
+            ('altitude', -6, 'Civil Dawn', 'Civil Dusk'),
+            ('altitude', -12, 'Nautical Dawn', 'Nautical Dusk'),
+            ('altitude', -18, 'Astronomical Dawn', 'Astronomical Dusk')
+        ]
+    return specs
+
+
+# Function whose zero is the event (hour angle ones only increase through zero, jumps are decreasing)
+def get_event_function(pos, quantity, level):
+    if quantity == 'altitude':
+        return pos['altitude_deg'] - level
+    elif quantity == 'upper':
+        return pos['lha']
+    return pos['lha'] % 24 - 12
+
+
+# Vectorised Illinois (modified regula falsi) on brackets [t_a, t_b] [s]: one evaluation call per iteration
+def refine_roots(func, t_a, t_b, f_a, f_b, tol_s=1.0, max_iter=30):
+    t_a, t_b, f_a, f_b = [np.array(v, dtype=float) for v in [t_a, t_b, f_a, f_b]]
+    pos_root = {}
+    n_eval = np.zeros(len(t_a), dtype=int)
+    active = np.arange(len(t_a))
+    for _ in range(max_iter):
+        if len(active) == 0:
+            break
+        t_c = t_b[active] - f_b[active] * (t_b[active] - t_a[active]) / (f_b[active] - f_a[active])
+        f_c, pos = func(t_c, active)
+        flip = np.sign(f_c) != np.sign(f_b[active])
+        t_a[active] = np.where(flip, t_b[active], t_a[active])
+        f_a[active] = np.where(flip, f_b[active], f_a[active] * 0.5)
+        t_b[active], f_b[active] = t_c, f_c
+        n_eval[active] += 1
+        for k, v in pos.items():
+            pos_root.setdefault(k, np.full(len(t_a), np.nan))[active] = v
+        active = active[(np.abs(t_b[active] - t_a[active]) >= tol_s) & (f_c != 0)]
+    return t_b, pos_root, n_eval
+
+
+# --- GET EVENTS: COARSE GRID BRACKETING + ROOT REFINEMENT ---
+# Arguments of get_events shared with get_coords
+EVENT_ARGS = [
+    'sel_ssbodies', 'sel_stars', 'stars_ra0', 'stars_dec0', 'stars_pm_ra', 'stars_pm_dec',
+    'loc_names', 'lats', 'lons', 'tz_names', 'sel_time', 'sel_days', 't_min', 't_max', 'ephemeris'
+]
+
+
+def get_events(
+        sel_ssbodies,
+        sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+        loc_names, lats, lons, tz_names, sel_time,
+        sel_days, t_min='00:00', t_max='00:00', ephemeris='builtin', step_min=10, tol_s=1.0):
+
+    stars_par = list(zip(stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec))
+    objs = [(b, ()) for b in sel_ssbodies] + [(s, tuple(float(p) for p in par)) for s, par in zip(sel_stars, stars_par)]
+    df_s = []
+
+    for lat, lon, loc_name, tz_name in zip(lats, lons, loc_names, tz_names):
+
+        # Coarse grid of the selected time windows
+        curr_tz = get_time_zone(sel_time, tz_name, lon)
+        t_grid, n_day = get_time_grid(sel_days, t_min, t_max, step_min, curr_tz)
+        t_ns = t_grid.tz_convert('UTC').tz_localize(None).values.astype('datetime64[ns]')
+        t_ref = t_ns[0]
+        t_s = (t_ns - t_ref).astype('int64') / 1e9
+        n_day = np.asarray(n_day)
+        same_day = n_day[1:] == n_day[:-1]
+
+        for sel_obj, star_par in objs:
+            try:
+                pos = get_positions(sel_obj, star_par, lat, lon, t_ns, ephemeris, cache=True)
+            except Exception:
+                print(f'Events of {sel_obj} not computed. Skipped')
+                continue
+            specs = get_event_specs(sel_obj)
+
+            # Bracket sign changes
+            i_brk, i_spec, rising = [], [], []
+            for ns, (quantity, level, name_up, name_down) in enumerate(specs):
+                f = get_event_function(pos, quantity, level)
+                up = (f[:-1] < 0) & (f[1:] >= 0) & same_day
+                down = (f[:-1] >= 0) & (f[1:] < 0) & same_day if name_down else np.zeros(len(f) - 1, dtype=bool)
+                for mask, is_up in [(up, True), (down, False)]:
+                    idx = np.flatnonzero(mask)
+                    i_brk.append(idx)
+                    i_spec.append(np.full(len(idx), ns))
+                    rising.append(np.full(len(idx), is_up))
+            i_brk, i_spec, rising = np.concatenate(i_brk), np.concatenate(i_spec), np.concatenate(rising)
+            if len(i_brk) == 0:
+                continue
+            f_all = np.stack([get_event_function(pos, q, l) for q, l, _, _ in specs])
+
+            # Refine all events of current object / location at once
+            def func(t_c, active):
+                t_c_ns = t_ref + np.round(t_c * 1e9).astype('int64').astype('timedelta64[ns]')
+                pos_c = get_positions(sel_obj, star_par, lat, lon, t_c_ns, ephemeris)
+                f_c = np.zeros(len(active))
+                for ns, (quantity, level, _, _) in enumerate(specs):
+                    m = i_spec[active] == ns
+                    if m.any():
+                        f_c[m] = get_event_function({k: v[m] for k, v in pos_c.items()}, quantity, level)
+                return f_c, pos_c
+
+            t_root, pos_root, n_eval = refine_roots(
+                func, t_s[i_brk], t_s[i_brk + 1], f_all[i_spec, i_brk], f_all[i_spec, i_brk + 1], tol_s)
+
+            # Output structure
+            t_event = (pd.to_datetime(t_ref + np.round(t_root * 1e9).astype('int64').astype('timedelta64[ns]'))
+                       .tz_localize('UTC').tz_convert(t_grid.tz))
+            df_s.append(pd.DataFrame({
+                'loc_sel': loc_name,
+                'day_sel': np.asarray(sel_days)[n_day[i_brk] - 1],
+                'n_day': n_day[i_brk],
+                'object': sel_obj,
+                'event': [specs[ns][2] if up else specs[ns][3] for ns, up in zip(i_spec, rising)],
+                't_event': t_event,
+                'hour_event': t_event.hour + t_event.minute / 60 + t_event.second / 3600,
+                'azimuth_deg': pos_root['azimuth_deg'],
+                'altitude_deg': pos_root['altitude_deg'],
+                'ha': pos_root['ha'],
+                'declination_deg': pos_root['declination_deg'],
+                'n_eval': n_eval
+            }))
+
+    if not df_s:
+        return pd.DataFrame(columns=[
+            'loc_sel', 'day_sel', 'n_day', 'object', 'event', 't_event', 'hour_event',
+            'azimuth_deg', 'altitude_deg', 'ha', 'declination_deg', 'n_eval'])
+    df_events = pd.concat(df_s, axis=0, ignore_index=True)
+    df_events = df_events.sort_values(['loc_sel', 'object', 't_event'], kind='stable', ignore_index=True)
+    return df_events
+
+
+# --- GET COORDINATES ON AN ADAPTIVE TIME GRID ---
+# Samples are a subset of the uniform t_delta grid: coarse samples every coarse_min minutes, then intervals are
+# bisected where linear interpolation misses the midpoint by more than tol_deg (curvature), where an object
+# crosses the horizon or the SUN crosses a twilight level, and where azimuth / hour angle wrap around
+def get_coords_adaptive(
+        sel_ssbodies,
+        sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+        loc_names, lats, lons, tz_names, sel_time,
+        sel_days, t_min, t_max, t_delta, ephemeris='builtin',
+        coarse_min=30, tol_deg=0.05, twil_levels=(0, -6), progress=None):
+
+    stars_par = list(zip(stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec))
+    objs = [(b, ()) for b in sel_ssbodies] + [(s, tuple(float(p) for p in par)) for s, par in zip(sel_stars, stars_par)]
+    df_s = []
+
+    for nl, (lat, lon, loc_name, tz_name) in enumerate(zip(lats, lons, loc_names, tz_names)):
+        if progress is not None: progress(nl, len(loc_names))
+
+        # Uniform (finest) grid
+        curr_tz = get_time_zone(sel_time, tz_name, lon)
+        t_fine, n_day = get_time_grid(sel_days, t_min, t_max, t_delta, curr_tz)
+        t_ns = t_fine.tz_convert('UTC').tz_localize(None).values.astype('datetime64[ns]')
+        t_s = (t_ns - t_ns[0]).astype('int64') / 1e9
+        n_day = np.asarray(n_day)
+        n = len(t_ns)
+
+        # Coarse samples: every k-th sample of each day, plus the last one
+        k = max(1, int(round(coarse_min / t_delta)))
+        is_first = np.r_[True, n_day[1:] != n_day[:-1]]
+        is_last = np.r_[n_day[1:] != n_day[:-1], True]
+        i_day_start = np.maximum.accumulate(np.where(is_first, np.arange(n), 0))
+        keep = ((np.arange(n) - i_day_start) % k == 0) | is_last
+        accepted = np.zeros(n, dtype=bool) # Interval starting at this sample is final
+
+        # Positions evaluated so far (NaN elsewhere)
+        values = {obj[0]: {c: np.full(n, np.nan) for c in OBJECT_COLUMNS} for obj in objs}
+        valid_objs = list(objs)
+
+        def evaluate(idx):
+            for obj in list(valid_objs):
+                try:
+                    pos = get_positions(obj[0], obj[1], lat, lon, t_ns[idx], ephemeris)
+                except Exception:
+                    print(f'Solar System Body {obj[0]} not found. Skipped')
+                    valid_objs.remove(obj)
+                    continue
+                for c in OBJECT_COLUMNS:
+                    values[obj[0]][c][idx] = pos[c]
+
+        def wrapped(d, period):
+            return (d + period / 2) % period - period / 2
+
+        evaluate(np.flatnonzero(keep))
+        while True:
+            i_kept = np.flatnonzero(keep)
+            i, j = i_kept[:-1], i_kept[1:]
+            cand = ~accepted[i] & (n_day[i] == n_day[j]) & (j - i > 1)
+            i, j = i[cand], j[cand]
+            if len(i) == 0:
+                break
+            m = (i + j) // 2
+            evaluate(m)
+            dt = t_s[j] - t_s[i]
+            w = np.divide(t_s[m] - t_s[i], dt, out=np.full(len(i), 0.5), where=dt > 0)
+
+            need = np.zeros(len(i), dtype=bool)
+            for obj in valid_objs:
+                v = values[obj[0]]
+                alt, az, ha, dec = v['altitude_deg'], v['azimuth_deg'], v['ha'] * 15, v['declination_deg']
+
+                # Horizon crossing, wrap-around
+                need |= (alt[i] >= 0) != (alt[j] >= 0)
+                need |= (np.abs(az[j] - az[i]) > 180) | (np.abs(ha[j] - ha[i]) > 180)
+                if obj[0] == 'SUN':
+                    for level in twil_levels:
+                        need |= (alt[i] >= level) != (alt[j] >= level)
+
+                # Curvature: midpoint against linear interpolation of the interval ends
+                for y, period in [(alt, None), (dec, None), (az, 360), (ha, 360)]:
+                    if period is None:
+                        err = y[m] - (y[i] + w * (y[j] - y[i]))
+                    else:
+                        err = wrapped(y[m] - (y[i] + w * wrapped(y[j] - y[i], period)), period)
+                    need |= np.abs(err) > tol_deg
+
+            keep[m[need]] = True
+            accepted[i[~need]] = True
+
+        # Output structure (irregular time stamps)
+        rows = np.flatnonzero(keep)
+        df_s1 = [get_time_columns(t_fine[rows], n_day[rows].tolist(), loc_name, nl + 1)]
+        for obj in valid_objs:
+            df_s1.append(pd.DataFrame(
+                {f'{obj[0]}_{c}': values[obj[0]][c][rows] for c in OBJECT_COLUMNS}, index=df_s1[0].index))
+        df_s.append(pd.concat(df_s1, axis=1))
+
+    if progress is not None: progress(len(loc_names), len(loc_names))
     df_out = pd.concat(df_s, axis=0)
     return df_out
+
+
+# --- LONG RANGES: LIST OF DAYS ---
+def get_day_range(start_day, end_day):
+    return [f'{d:%Y-%m-%d}' for d in pd.date_range(start_day, end_day, freq='D')]
+
+
+# --- STREAMING COORDINATES: BOUNDED CHUNKS (BLOCKS OF DAYS, ALL LOCATIONS) ---
+# Each chunk has the get_coords structure (n_day counted over the whole run) and at most about max_rows rows
+def iter_coords(
+        sel_ssbodies,
+        sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+        loc_names, lats, lons, tz_names, sel_time,
+        sel_days, t_min, t_max, t_delta, batched=True, ephemeris='builtin', n_workers=0,
+        max_rows=100_000, progress=None):
+
+    rows_per_day = len(loc_names) * (24 * 60 // t_delta + 1)
+    block_days = max(1, max_rows // rows_per_day)
+    n_blocks = int(np.ceil(len(sel_days) / block_days))
+    for nb in range(n_blocks):
+        if progress is not None: progress(nb, n_blocks)
+        df_chunk = get_coords(
+            sel_ssbodies,
+            sel_stars, stars_ra0, stars_dec0, stars_pm_ra, stars_pm_dec,
+            loc_names, lats, lons, tz_names, sel_time,
+            sel_days[nb * block_days:(nb + 1) * block_days], t_min, t_max, t_delta,
+            batched=batched, ephemeris=ephemeris, n_workers=n_workers)
+        df_chunk['n_day'] += nb * block_days
+        yield df_chunk
+    if progress is not None: progress(n_blocks, n_blocks)
+
+
+# --- STREAMING CONSUMERS (FILE EXPORT: myastroexport.write_chunks) ---
+# Daily summary of each object / location: altitude max (and its time), altitude min, hours above horizon
+def get_daily_summary(chunks, t_delta):
+    df_s = []
+    for df_chunk in chunks:
+        df_chunk = df_chunk.reset_index(drop=True)
+        keys = [df_chunk['loc_sel'], df_chunk['n_day']]
+        day_sel = df_chunk['day_sel'].groupby(keys, sort=False).first() # Last sample may belong to next day
+        for col in [c for c in df_chunk.columns if c.endswith('_altitude_deg')]:
+            alt = df_chunk[col]
+            g = alt.groupby(keys, sort=False)
+            i_max = g.idxmax()
+            df_s.append(pd.DataFrame({
+                'loc_sel': i_max.index.get_level_values(0),
+                'n_day': i_max.index.get_level_values(1),
+                'day_sel': day_sel.values,
+                'object': col[:-len('_altitude_deg')],
+                'altitude_max_deg': g.max().values,
+                't_altitude_max': df_chunk['t_current'].iloc[i_max.values].tolist(),
+                'altitude_min_deg': g.min().values,
+                'hours_above_horizon': (alt >= 0).groupby(keys, sort=False).sum().values * t_delta / 60
+            }))
+    df_summary = pd.concat(df_s, axis=0, ignore_index=True)
+    return df_summary
@@ -9,15 +9,90 @@ import tempfile
 import numpy as np
 import pandas as pd
 from datetime import datetime, date, timedelta
-from PyQt6.QtCore import QUrl
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import plotly.express as px
 import plotly.colors as pc
 
+# Plotting builds plotly figures only (no PyQt6): rendering in the GUI WebView is done by render
+
+# Colour schemes (multiple lines)
+DISCRETE_COLOUR_MAP = {
+    'Plotly': pc.qualitative.Plotly,
+    'Set1': pc.qualitative.Set1,
+    'Set2': pc.qualitative.Set2,
+    'Bold': pc.qualitative.Bold,
+    'Dark24': pc.qualitative.Dark24
+}
+CONTINUOUS_COLOUR_MAP = {
+    'Viridis': pc.sequential.Viridis,
+    'Plasma': pc.sequential.Plasma,
+    'Turbo': pc.sequential.Turbo,
+    'Oranges': pc.sequential.Oranges,
+    'Greens': pc.sequential.Greens
+}
+
+# Graph types and graph options (defaults as in the GUI)
+PLOT_TYPES = [
+    'Azimuth/Altidude',
+    'Azimuth/Altidude (Polar)',
+    'Equatorial',
+    'Equatorial (Polar, North)',
+    'Equatorial (Polar, South)'
+]
+PLOT_OPTIONS = dict(
+    sel_time = 'Civil',
+    twil_thresh = -6,
+    daynight = 'Day and Night',
+    horizonview = 'All positions',
+    halfhemisphere = False,
+    colour_scheme = 'Plotly',
+    df_events = None
+)
+
+
+# --- GRAPH OPTIONS FROM THE GUI ---
+def get_plot_options(self):
+    return dict(
+        sel_time = self.sel_time,
+        twil_thresh = self.twilsel.value(),
+        daynight = self.daynight.currentText(),
+        horizonview = self.horizonview.currentText(),
+        halfhemisphere = self.halfhemisphere.isChecked(),
+        colour_scheme = self.selcolour.currentText(),
+        df_events = self.df_events if self.showevents.isChecked() else None
+    )
+
+
+# --- RENDER IN PyQt6 WEBVIEW ---
+def render(self, fig):
+    from PyQt6.QtCore import QUrl
+    self.fig = fig
+    tmp_dir = tempfile.gettempdir()
+    html_path = os.path.join(tmp_dir, 'plot.html')
+    fig.write_html(html_path, include_plotlyjs='directory')
+    self.webview.load(QUrl.fromLocalFile(html_path))
+
 
 # --- LAUNCH PLOT (SINGLE) ---
 def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
+    render(self, get_fig_single(df_out, curr_obj, curr_location, curr_day, plot_type, get_plot_options(self)))
+
+
+# --- LAUNCH PLOT (MULTI) ---
+def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_mode, multi_values, self):
+    render(self, get_fig_multi(
+        df_out, curr_obj, curr_location, curr_day, plot_type, multi_mode, multi_values, get_plot_options(self)))
+
+
+# --- LAUNCH PLOT (LONG RANGE: DAILY SUMMARY) ---
+def makeplot_longrange(df_summary, title, self):
+    render(self, get_fig_longrange(df_summary, title, get_plot_options(self)))
+
+
+# --- FIGURE (SINGLE) ---
+def get_fig_single(df_out, curr_obj, curr_location, curr_day, plot_type, opts):
+    sel_time = opts['sel_time']
+    df_events = opts['df_events']
 
     # Define Variables
     if 'Azimuth/Altidude' in plot_type:
@@ -97,7 +172,7 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
     star_alt = df_out[f'{curr_obj}_altitude_deg'].copy()
 
     # Look for (night, twilight, day) and (above, below)
-    twil_thresh = self.twilsel.value()
+    twil_thresh = opts['twil_thresh']
     positions = [
         'Night Above', 'Twilight Above', 'Day Above',
         'Night Below', 'Twilight Below', 'Day Below'
@@ -109,15 +184,15 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
     is_below = star_alt < 0
 
     # Filter positions
-    if self.daynight.currentText() == 'Night Only':
+    if opts['daynight'] == 'Night Only':
         positions = [p for p in positions if ('Night' in p)]
-    if self.daynight.currentText() == 'Night Only (+Twilight)':
+    if opts['daynight'] == 'Night Only (+Twilight)':
         positions = [p for p in positions if ('Night' in p) or ('Twilight' in p)]
-    if self.daynight.currentText() == 'Day Only':
+    if opts['daynight'] == 'Day Only':
         positions = [p for p in positions if ('Day' in p)]
-    if self.daynight.currentText() == 'Day Only (+Twilight)':
+    if opts['daynight'] == 'Day Only (+Twilight)':
         positions = [p for p in positions if ('Day' in p) or ('Twilight' in p)]
-    if self.horizonview.currentText() == 'Above Horizon':
+    if opts['horizonview'] == 'Above Horizon':
         positions = [p for p in positions if ('Above' in p)]
 
     def extend(v): # Function to extend segments (for better plots)
@@ -157,10 +232,10 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
     if not('Polar' in plot_type):
 
         # Create subplots: 2 rows, 1 col
-        self.fig = make_subplots(rows=2, cols=1, vertical_spacing=0.1, row_heights=[0.5, 0.5],
+        fig = make_subplots(rows=2, cols=1, vertical_spacing=0.1, row_heights=[0.5, 0.5],
             subplot_titles=[
-                f'{curr_obj} in {curr_location} on {curr_day} - {label1} ({self.sel_time} Time)',
-                f'{curr_obj} in {curr_location} on {curr_day} - {label2} ({self.sel_time} Time)'
+                f'{curr_obj} in {curr_location} on {curr_day} - {label1} ({sel_time} Time)',
+                f'{curr_obj} in {curr_location} on {curr_day} - {label2} ({sel_time} Time)'
             ]
             )
 
@@ -169,25 +244,25 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
             p1, p2 = position.split(' ')
             cust_data = list(zip(times[position], azs[position], alts[position], has[position], decs[position]))
             dash_type = 'solid' if p2 == 'Above' else 'dot'
-            self.fig.add_trace(go.Scatter(x=x_gr, y=y1s[position], mode='lines',
+            fig.add_trace(go.Scatter(x=x_gr, y=y1s[position], mode='lines',
                 line=dict(color=cols[p1], dash=dash_type, width=3),
                 customdata=cust_data, hovertemplate='<b>' + position + '</b><br>'+hover_templ,
                 name=position), row=1, col=1)
 
         # Axes 1st ROW
-        self.fig.update_xaxes(
+        fig.update_xaxes(
             showticklabels=True, matches='x',
             range=[x_gr.min(), x_gr.max()],
             row=1, col=1, tickformat='%H:%M', nticks=20
         )
-        self.fig.update_yaxes(range=[-90, 90], tickvals=np.arange(-90, 91, 30), title_text=label1, row=1, col=1)
+        fig.update_yaxes(range=[-90, 90], tickvals=np.arange(-90, 91, 30), title_text=label1, row=1, col=1)
 
         # Add lines 2nd ROW
         for position in positions:
             p1, p2 = position.split(' ')
             cust_data = list(zip(times[position], azs[position], alts[position], has[position], decs[position]))
             dash_type = 'solid' if p2 == 'Above' else 'dot'
-            self.fig.add_trace(go.Scatter(x=x_gr, y=y2s[position], mode='lines',
+            fig.add_trace(go.Scatter(x=x_gr, y=y2s[position], mode='lines',
                 line=dict(color=cols[p1], dash=dash_type, width=3),
                 customdata=cust_data, hovertemplate='<b>' + position + '</b><br>'+hover_templ,
                 name=position, showlegend=False), row=2, col=1)
@@ -197,13 +272,13 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
             tickvals2 = np.arange(0, 361, 45)
         elif 'Equatorial' in plot_type:
             tickvals2 = np.arange(0, 25, 3)
-        self.fig.update_xaxes(
+        fig.update_xaxes(
             showticklabels=True, matches='x',
             range=[x_gr.min(), x_gr.max()],
             row=2, col=1, tickformat='%H:%M', nticks=20
         )
-        self.fig.update_yaxes(range=[min(tickvals2), max(tickvals2)], tickvals=tickvals2, title_text=label2, row=2, col=1)
-        self.fig.update_layout(margin=dict(t=20, b=10, l=50, r=50))
+        fig.update_yaxes(range=[min(tickvals2), max(tickvals2)], tickvals=tickvals2, title_text=label2, row=2, col=1)
+        fig.update_layout(margin=dict(t=20, b=10, l=50, r=50))
 
 
 
@@ -227,9 +302,9 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
             ticktext_th[18] = '<span style="font-size:18px;"><b>W</b></span>'
             ticktext_th[21] = '<span style="font-size:14px;"><b>NW</b></span>'
 
-        rng = 90 if ('Equatorial' in plot_type) and (self.halfhemisphere.isChecked()) else 180
-        self.fig = go.Figure()
-        self.fig.update_layout(
+        rng = 90 if ('Equatorial' in plot_type) and opts['halfhemisphere'] else 180
+        fig = go.Figure()
+        fig.update_layout(
             polar=dict(
                 radialaxis=dict(
                     range=[0, rng],  # because radius = elevation + 90
@@ -249,13 +324,13 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
                 #bgcolor='rgb(240,240,240)'
             ),
             margin=dict(t=40, b=20, l=50, r=50),
-            title=f'{curr_obj} in {curr_location} on {curr_day} ({self.sel_time} Time)'
+            title=f'{curr_obj} in {curr_location} on {curr_day} ({sel_time} Time)'
         )
 
         # Add "N" or "S" at the center
         if 'Equatorial' in plot_type:
             center_label = 'N' if 'North' in plot_type else 'S'
-            self.fig.add_annotation(
+            fig.add_annotation(
                 text=f'<b>{center_label}</b>',   # bold
                 x=0.5, y=0.5, showarrow=False,
                 font=dict(size=18),
@@ -265,7 +340,7 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
         # Add black circle
         theta_circle = np.linspace(0, 360, 361)  # full circle, 1° step
         r_circle = np.full_like(theta_circle, 90)  # constant radius = 90°
-        self.fig.add_trace(go.Scatterpolar(
+        fig.add_trace(go.Scatterpolar(
             r=r_circle, theta=theta_circle,
             mode='lines', line=dict(color='black', width=1.5),
             name='Horizon', hoverinfo='skip', showlegend=False # optional: disable hover
@@ -276,21 +351,26 @@ def makeplot_single(df_out, curr_obj, curr_location, curr_day, plot_type, self):
             p1, p2 = position.split(' ')
             cust_data = list(zip(times[position], azs[position], alts[position], has [position], decs[position]))
             dash_type = 'solid' if p2 == 'Above' else 'dot'
-            self.fig.add_trace(go.Scatterpolar(r=y1s[position], theta=y2s[position], mode='lines',
+            fig.add_trace(go.Scatterpolar(r=y1s[position], theta=y2s[position], mode='lines',
                 line=dict(color=cols[p1], dash=dash_type, width=3),
                 customdata=cust_data, hovertemplate='<b>' + position + '</b><br>'+hover_templ,
                 name=position)
             )
 
-    # Render in PyQt6 WebView
-    tmp_dir = tempfile.gettempdir()
-    html_path = os.path.join(tmp_dir, 'plot.html')
-    self.fig.write_html(html_path, include_plotlyjs='directory')
-    self.webview.load(QUrl.fromLocalFile(html_path))
+    # Events: markers (rise, set, culminations) and twilight lines
+    if df_events is not None:
+        df_ev = df_events[df_events['loc_sel'] == curr_location]
+        add_event_markers(fig, df_ev[df_ev['object'] == curr_obj], plot_type, first_date, 'black', 'Events')
+        if not('Polar' in plot_type):
+            add_twilight_lines(fig, df_ev, first_date)
 
+    return fig
 
-# --- LAUNCH PLOT (SINGLE) ---
-def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_mode, multi_values, self):
+
+# --- FIGURE (MULTI) ---
+def get_fig_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_mode, multi_values, opts):
+    sel_time = opts['sel_time']
+    df_events = opts['df_events']
 
     # Init new structure (that will be filtered)
     df_outspl = {}
@@ -349,7 +429,7 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
     # Init variables
     y1s = {} ; y2s = {}
     times = {} ; azs = {} ; alts = {} ; has = {} ; decs = {}
-    x_gr = {}
+    x_gr = {} ; first_dates = {}
 
     for multi_value in multi_values:
         dfos = df_outspl[multi_value].copy()
@@ -375,7 +455,7 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
             y2[y2_isdisc] = np.nan
 
         # Look for (night, twilight, day) and (above, below)
-        twil_thresh = self.twilsel.value()
+        twil_thresh = opts['twil_thresh']
         star_alt = dfos['obj_altitude_deg']
         sun_alt = dfos['SUN_altitude_deg']
         is_night = sun_alt < twil_thresh
@@ -385,19 +465,19 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
         is_below = star_alt < 0
 
         # Filter positions
-        if self.daynight.currentText() == 'Night Only':
+        if opts['daynight'] == 'Night Only':
             y1[is_day | is_twilight] = np.nan
             y2[is_day | is_twilight] = np.nan
-        if self.daynight.currentText() == 'Night Only (+Twilight)':
+        if opts['daynight'] == 'Night Only (+Twilight)':
             y1[is_day] = np.nan
             y2[is_day] = np.nan
-        if self.daynight.currentText() == 'Day Only':
+        if opts['daynight'] == 'Day Only':
             y1[is_night | is_twilight] = np.nan
             y2[is_night | is_twilight] = np.nan
-        if self.daynight.currentText() == 'Day Only (+Twilight)':
+        if opts['daynight'] == 'Day Only (+Twilight)':
             y1[is_night] = np.nan
             y2[is_night] = np.nan
-        if self.horizonview.currentText() == 'Above Horizon':
+        if opts['horizonview'] == 'Above Horizon':
             y1[~is_above] = np.nan
             y2[~is_above] = np.nan
 
@@ -430,6 +510,7 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
         # Define x-axis (time) - Equal for all lines. A dummy day is used for reference
         t_series = df_outspl[multi_value].t_current
         first_date = t_series.iloc[0].date()
+        first_dates[multi_value] = first_date
         x_gr[multi_value] = t_series.apply(
             lambda t: datetime.combine(
                 date(1970, 1, 1) + timedelta(days=(t.date() - first_date).days),
@@ -447,11 +528,11 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
     )
 
     # Get colour scheme and apply it
-    curr_colscheme = self.selcolour.currentText()
-    if curr_colscheme in self.discrete_colour_map.keys():
-        graphcols = self.discrete_colour_map[curr_colscheme]
-    elif curr_colscheme in self.continuous_colour_map.keys():
-        graphcols = pc.sample_colorscale(self.continuous_colour_map[curr_colscheme], len(multi_values))
+    curr_colscheme = opts['colour_scheme']
+    if curr_colscheme in DISCRETE_COLOUR_MAP.keys():
+        graphcols = DISCRETE_COLOUR_MAP[curr_colscheme]
+    elif curr_colscheme in CONTINUOUS_COLOUR_MAP.keys():
+        graphcols = pc.sample_colorscale(CONTINUOUS_COLOUR_MAP[curr_colscheme], len(multi_values))
     n_colours = len(graphcols)
 
 
@@ -459,33 +540,33 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
     if not('Polar' in plot_type):
 
         # Create subplots: 2 rows, 1 col
-        self.fig = make_subplots(rows=2, cols=1, vertical_spacing=0.1, row_heights=[0.5, 0.5],
+        fig = make_subplots(rows=2, cols=1, vertical_spacing=0.1, row_heights=[0.5, 0.5],
             subplot_titles=[
-                f'{curr_obj_txt} in {curr_location} on {curr_day} - {label1} ({self.sel_time} Time)',
-                f'{curr_obj_txt} in {curr_location} on {curr_day} - {label2} ({self.sel_time} Time)'
+                f'{curr_obj_txt} in {curr_location} on {curr_day} - {label1} ({sel_time} Time)',
+                f'{curr_obj_txt} in {curr_location} on {curr_day} - {label2} ({sel_time} Time)'
             ]
             )
 
         # Add lines 1st ROW
         for nv, multi_value in enumerate(multi_values):
             cust_data = list(zip(times[multi_value], azs[multi_value], alts[multi_value], has[multi_value], decs[multi_value]))
-            self.fig.add_trace(go.Scatter(x=x_gr[multi_value], y=y1s[multi_value], mode='lines',
+            fig.add_trace(go.Scatter(x=x_gr[multi_value], y=y1s[multi_value], mode='lines',
                 line=dict(color=graphcols[nv], width=2),
                 customdata=cust_data, hovertemplate='<b>' + multi_value + '</b><br>'+hover_templ,
                 name=multi_value), row=1, col=1)
 
         # Axes 1st ROW
-        self.fig.update_xaxes(
+        fig.update_xaxes(
             showticklabels=True, matches='x',
             range=[x_gr[multi_value].min(), x_gr[multi_value].max()],
             row=1, col=1, tickformat='%H:%M', nticks=20
         )
-        self.fig.update_yaxes(range=[-90, 90], tickvals=np.arange(-90, 91, 30), title_text=label1, row=1, col=1)
+        fig.update_yaxes(range=[-90, 90], tickvals=np.arange(-90, 91, 30), title_text=label1, row=1, col=1)
 
         # Add lines 2nd ROW
         for nv, multi_value in enumerate(multi_values):
             cust_data = list(zip(times[multi_value], azs[multi_value], alts[multi_value], has[multi_value], decs[multi_value]))
-            self.fig.add_trace(go.Scatter(x=x_gr[multi_value], y=y2s[multi_value], mode='lines',
+            fig.add_trace(go.Scatter(x=x_gr[multi_value], y=y2s[multi_value], mode='lines',
                 line=dict(color=graphcols[nv % n_colours], width=2),
                 customdata=cust_data, hovertemplate='<b>' + multi_value + '</b><br>'+hover_templ,
                 name=multi_value, showlegend=False), row=2, col=1)
@@ -495,13 +576,13 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
             tickvals2 = np.arange(0, 361, 45)
         elif 'Equatorial' in plot_type:
             tickvals2 = np.arange(0, 25, 3)
-        self.fig.update_xaxes(
+        fig.update_xaxes(
             showticklabels=True, matches='x',
             range=[x_gr[multi_value].min(), x_gr[multi_value].max()],
             row=2, col=1, tickformat='%H:%M', nticks=20
         )
-        self.fig.update_yaxes(range=[min(tickvals2), max(tickvals2)], tickvals=tickvals2, title_text=label2, row=2, col=1)
-        self.fig.update_layout(margin=dict(t=20, b=10, l=50, r=50))
+        fig.update_yaxes(range=[min(tickvals2), max(tickvals2)], tickvals=tickvals2, title_text=label2, row=2, col=1)
+        fig.update_layout(margin=dict(t=20, b=10, l=50, r=50))
 
 
     # --- POLAR PLOT ---
@@ -524,9 +605,9 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
             ticktext_th[18] = '<span style="font-size:18px;"><b>W</b></span>'
             ticktext_th[21] = '<span style="font-size:14px;"><b>NW</b></span>'
 
-        rng = 90 if ('Equatorial' in plot_type) and (self.halfhemisphere.isChecked()) else 180
-        self.fig = go.Figure()
-        self.fig.update_layout(
+        rng = 90 if ('Equatorial' in plot_type) and opts['halfhemisphere'] else 180
+        fig = go.Figure()
+        fig.update_layout(
             polar=dict(
                 radialaxis=dict(
                     range=[0, rng],  # because radius = elevation + 90
@@ -546,13 +627,13 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
                 #bgcolor='rgb(240,240,240)'
             ),
             margin=dict(t=40, b=20, l=50, r=50),
-            title=f'{curr_obj_txt} in {curr_location} on {curr_day} ({self.sel_time} Time)'
+            title=f'{curr_obj_txt} in {curr_location} on {curr_day} ({sel_time} Time)'
         )
 
         # Add "N" or "S" at the center
         if 'Equatorial' in plot_type:
             center_label = 'N' if 'North' in plot_type else 'S'
-            self.fig.add_annotation(
+            fig.add_annotation(
                 text=f'<b>{center_label}</b>',   # bold
                 x=0.5, y=0.5, showarrow=False,
                 font=dict(size=18),
@@ -562,7 +643,7 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
         # Add lines
         for nv, multi_value in enumerate(multi_values):
             cust_data = list(zip(times[multi_value], azs[multi_value], alts[multi_value], has[multi_value], decs[multi_value]))
-            self.fig.add_trace(go.Scatterpolar(r=y1s[multi_value], theta=y2s[multi_value], mode='lines',
+            fig.add_trace(go.Scatterpolar(r=y1s[multi_value], theta=y2s[multi_value], mode='lines',
                 line=dict(color=graphcols[nv % n_colours], width=2),
                 customdata=cust_data, hovertemplate='<b>' + multi_value + '</b><br>'+hover_templ,
                 name=multi_value)
@@ -571,17 +652,122 @@ def makeplot_multi(df_out, curr_obj, curr_location, curr_day, plot_type, multi_m
         # Add black circle
         theta_circle = np.linspace(0, 360, 361)  # full circle, 1° step
         r_circle = np.full_like(theta_circle, 90)  # constant radius = 90°
-        self.fig.add_trace(go.Scatterpolar(
+        fig.add_trace(go.Scatterpolar(
             r=r_circle, theta=theta_circle,
             mode='lines', line=dict(color='black', width=1.5, dash='dot'),
             name='Horizon', hoverinfo='skip', showlegend=False # optional: disable hover
         ))
 
-    # Render in PyQt6 WebView
-    tmp_dir = tempfile.gettempdir()
-    html_path = os.path.join(tmp_dir, 'plot.html')
-    self.fig.write_html(html_path, include_plotlyjs='directory')
-    self.webview.load(QUrl.fromLocalFile(html_path))
+    # Events: markers (rise, set, culminations) of each line, twilight lines if a single location / day is shown
+    if df_events is not None:
+        for nv, multi_value in enumerate(multi_values):
+            dfos = df_outspl[multi_value]
+            ev_obj = multi_value if multi_mode == 'Multi Objects' else curr_obj
+            df_ev = df_events[
+                (df_events['object'] == ev_obj) &
+                (df_events['loc_sel'] == dfos['loc_sel'].iloc[0]) &
+                (df_events['n_day'].isin(dfos['n_day'].unique()))
+            ]
+            add_event_markers(fig, df_ev, plot_type, first_dates[multi_value], graphcols[nv % n_colours], multi_value)
+        if multi_mode == 'Multi Objects' and not('Polar' in plot_type):
+            dfos = df_outspl[multi_values[0]]
+            add_twilight_lines(fig, df_events[df_events['loc_sel'] == dfos['loc_sel'].iloc[0]],
+                               first_dates[multi_values[0]])
+
+    return fig
+
+
+# --- FIGURE (LONG RANGE: DAILY SUMMARY) ---
+def get_fig_longrange(df_summary, title, opts):
+
+    # One line per object / location
+    series = list(dict.fromkeys(zip(df_summary['object'], df_summary['loc_sel'])))
+    curr_colscheme = opts['colour_scheme']
+    if curr_colscheme in DISCRETE_COLOUR_MAP.keys():
+        graphcols = DISCRETE_COLOUR_MAP[curr_colscheme]
+    elif curr_colscheme in CONTINUOUS_COLOUR_MAP.keys():
+        graphcols = pc.sample_colorscale(CONTINUOUS_COLOUR_MAP[curr_colscheme], max(len(series), 2))
+    n_colours = len(graphcols)
+
+    fig = make_subplots(rows=2, cols=1, vertical_spacing=0.1, row_heights=[0.5, 0.5], shared_xaxes=True,
+        subplot_titles=[f'{title} - Max Altitude', f'{title} - Hours above Horizon'])
+    for ns, (obj, loc) in enumerate(series):
+        dfs = df_summary[(df_summary['object'] == obj) & (df_summary['loc_sel'] == loc)]
+        name = f'{obj} - {loc}' if len(set(df_summary['loc_sel'])) > 1 else obj
+        colour = graphcols[ns % n_colours]
+        fig.add_trace(go.Scatter(x=pd.to_datetime(dfs['day_sel']), y=dfs['altitude_max_deg'], mode='lines',
+            line=dict(color=colour, width=2), customdata=dfs['t_altitude_max'].astype(str),
+            hovertemplate='<b>' + name + '</b><br>%{x|%Y-%m-%d}<br>Max Altitude: %{y:.2f}°<br>At: %{customdata}',
+            name=name), row=1, col=1)
+        fig.add_trace(go.Scatter(x=pd.to_datetime(dfs['day_sel']), y=dfs['hours_above_horizon'], mode='lines',
+            line=dict(color=colour, width=2),
+            hovertemplate='<b>' + name + '</b><br>%{x|%Y-%m-%d}<br>Above Horizon: %{y:.2f} h',
+            name=name, showlegend=False), row=2, col=1)
+    fig.update_yaxes(range=[-90, 90], tickvals=np.arange(-90, 91, 30), title_text='Max Altitude (°)', row=1, col=1)
+    fig.update_yaxes(range=[0, 24], tickvals=np.arange(0, 25, 3), title_text='Hours', row=2, col=1)
+    fig.update_layout(margin=dict(t=20, b=10, l=50, r=50))
+
+    return fig
+
+
+# --- EVENT MARKERS (RISE, SET, CULMINATIONS) ---
+EVENT_SYMBOLS = {
+    'Rise': 'triangle-up',
+    'Set': 'triangle-down',
+    'Upper Culmination': 'star',
+    'Lower Culmination': 'star-open'
+}
+
+
+# Time axis value of a (local) time: a dummy day is used for reference, as for the plotted lines
+def event_x(t, first_date):
+    return datetime.combine(date(1970, 1, 1) + timedelta(days=(t.date() - first_date).days), t.time())
+
+
+def add_event_markers(fig, df_ev, plot_type, first_date, colour, name):
+    df_ev = df_ev[df_ev['event'].isin(EVENT_SYMBOLS.keys())]
+    if df_ev.empty:
+        return
+
+    # Same variables as the plotted lines
+    if 'Azimuth/Altidude' in plot_type:
+        y1 = df_ev['altitude_deg'].values.copy()
+        y2 = df_ev['azimuth_deg'].values.copy()
+    elif 'Equatorial' in plot_type:
+        y1 = df_ev['declination_deg'].values.copy()
+        y2 = df_ev['ha'].values.copy()
+        if 'Polar' in plot_type:
+            if 'North' in plot_type:
+                y1 = -y1
+            y2 = y2 * 15
+    if 'Polar' in plot_type:
+        y1 = y1 + 90
+
+    symbols = [EVENT_SYMBOLS[e] for e in df_ev['event']]
+    labels = [f'<b>{o} {e}</b><br>{t:%Y-%m-%d %H:%M:%S}<br>Azimuth: {az:.2f}°<br>Altitude: {alt:.2f}°'
+              for o, e, t, az, alt in zip(df_ev['object'], df_ev['event'], df_ev['t_event'],
+                                          df_ev['azimuth_deg'], df_ev['altitude_deg'])]
+    marker = dict(symbol=symbols, size=12, color=colour, line=dict(color='white', width=1))
+
+    if not('Polar' in plot_type):
+        x = [event_x(t, first_date) for t in df_ev['t_event']]
+        for row, y in [(1, y1), (2, y2)]:
+            fig.add_trace(go.Scatter(x=x, y=y, mode='markers', marker=marker,
+                text=labels, hovertemplate='%{text}<extra></extra>',
+                name=f'{name} (Events)', legendgroup=f'{name} (Events)', showlegend=(row == 1)), row=row, col=1)
+    else:
+        fig.add_trace(go.Scatterpolar(r=y1, theta=y2, mode='markers', marker=marker,
+            text=labels, hovertemplate='%{text}<extra></extra>', name=f'{name} (Events)'))
+
+
+# --- TWILIGHT LINES (VERTICAL, 2-AXIS PLOTS) ---
+def add_twilight_lines(fig, df_ev, first_date):
+    df_tw = df_ev[(df_ev['object'] == 'SUN') & df_ev['event'].str.contains('Dawn|Dusk')]
+    for _, ev in df_tw.iterrows():
+        x = event_x(ev['t_event'], first_date)
+        fig.add_vline(x=x, line=dict(color='grey', dash='dot', width=1))
+        fig.add_annotation(x=x, y=1, xref='x', yref='paper', text=ev['event'], textangle=-90,
+                           showarrow=False, xanchor='right', yanchor='top', font=dict(size=9, color='grey'))
 
 
 # --- Clip Date ---
@@ -0,0 +1,148 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- CATALOGUE REGISTRY: STARS / LOCATIONS IN MEMORY, HASH INDEX BY NAME, NUMPY COLUMNS, CHANGE NOTIFICATIONS ---
+# A lookup by name is a dict lookup plus one array row (constant time, whatever the catalogue size).
+# Names are also kept sorted (as shown in combos and dialogs): add / remove notify listeners with the sorted
+# position of each name, so lists shown in the GUI are updated row by row instead of being rebuilt.
+
+import bisect
+import numpy as np
+import pandas as pd
+import myastrodb as myadb
+
+TEXT_COLUMNS = {'STARS': ['vizier_name'], 'LOCATIONS': ['time_zone']} # Other columns (but the name) are numbers
+INITIAL_CAPACITY = 64
+
+
+# Rows of a catalogue table (STARS or LOCATIONS): ids and numeric columns in NumPy arrays (grown by doubling),
+# text columns in lists, row of each name in a dict. Removing a row moves the last one into its place.
+# Listeners are called as listener(event, name, position), event 'add' or 'remove', position in names.
+class Catalogue:
+
+    def __init__(self, table, df):
+        self.table = table
+        self.name_col = myadb.NAME_COLUMNS[table]
+        self.text_cols = TEXT_COLUMNS[table]
+        self.value_cols = [c for c in myadb.TABLE_COLUMNS[table] if c != self.name_col and c not in self.text_cols]
+        self.listeners = []
+
+        n_rows = len(df)
+        capacity = max(INITIAL_CAPACITY, n_rows)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros((capacity, len(self.value_cols)), dtype=np.float64)
+        self.ids[:n_rows] = df['id'].to_numpy()
+        self.values[:n_rows] = df[self.value_cols].to_numpy(dtype=np.float64)
+        self.row_names = df[self.name_col].tolist()
+        self.texts = {c: df[c].tolist() for c in self.text_cols}
+        self.rows = {name: row for row, name in enumerate(self.row_names)}
+        self.folded = {} # Lower case name -> names (names differing only by case share the key)
+        for name in self.row_names:
+            self.folded.setdefault(name.lower(), []).append(name)
+        self.names = sorted(self.rows)
+
+    def __len__(self):
+        return len(self.row_names)
+
+    def __contains__(self, name):
+        return name in self.rows
+
+    # Name as stored, looked up ignoring case (the exact name first; None if not found)
+    def find(self, name):
+        if name in self.rows:
+            return name
+        names = self.folded.get(name.lower())
+        return names[0] if names else None
+
+    # --- LOOKUP ---
+    def get(self, name):
+        row = self.rows.get(name)
+        if row is None:
+            raise KeyError(name)
+        record = dict(zip(self.value_cols, self.values[row].tolist()))
+        record.update({c: self.texts[c][row] for c in self.text_cols})
+        return {'id': int(self.ids[row]), self.name_col: name, **record}
+
+    # Numeric columns of many names at once: array (n names, n columns)
+    def get_values(self, names, cols):
+        rows = np.array([self.rows[name] for name in names], dtype=np.intp)
+        return self.values[np.ix_(rows, [self.value_cols.index(c) for c in cols])]
+
+    # Column in table order (unsorted rows)
+    def column(self, col):
+        if col == self.name_col:
+            return list(self.row_names)
+        if col in self.texts:
+            return list(self.texts[col])
+        return self.values[:len(self), self.value_cols.index(col)].copy()
+
+    # Table as read from the DB (sorted by name)
+    def to_frame(self):
+        rows = [self.rows[name] for name in self.names]
+        df = pd.DataFrame({'id': self.ids[rows], self.name_col: self.names})
+        for c in myadb.TABLE_COLUMNS[self.table][1:]:
+            if c in self.texts:
+                df[c] = [self.texts[c][row] for row in rows]
+            else:
+                df[c] = self.values[rows, self.value_cols.index(c)]
+        return df
+
+    # --- CHANGES ---
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def notify(self, event, name, position):
+        for listener in self.listeners:
+            listener(event, name, position)
+
+    # Records: dicts with id and the table columns (as returned by get)
+    def add(self, records):
+        for record in records:
+            name = record[self.name_col]
+            row = len(self)
+            if row == len(self.ids): # Full: capacity doubled
+                self.ids = np.resize(self.ids, 2 * row)
+                self.values = np.resize(self.values, (2 * row, len(self.value_cols)))
+            self.ids[row] = record['id']
+            self.values[row] = [record[c] for c in self.value_cols]
+            for c in self.text_cols:
+                self.texts[c].append(record[c])
+            self.row_names.append(name)
+            self.rows[name] = row
+            self.folded.setdefault(name.lower(), []).append(name)
+            position = bisect.bisect_left(self.names, name)
+            self.names.insert(position, name)
+            self.notify('add', name, position)
+
+    def remove(self, names):
+        for name in names:
+            row = self.rows.pop(name, None)
+            if row is None:
+                continue
+            last = len(self) - 1
+            if row != last: # Last row moved into the gap
+                last_name = self.row_names[last]
+                self.ids[row] = self.ids[last]
+                self.values[row] = self.values[last]
+                for c in self.text_cols:
+                    self.texts[c][row] = self.texts[c][last]
+                self.row_names[row] = last_name
+                self.rows[last_name] = row
+            for c in self.text_cols:
+                self.texts[c].pop()
+            self.row_names.pop()
+            folded = self.folded[name.lower()]
+            folded.remove(name)
+            if not folded:
+                del self.folded[name.lower()]
+            position = bisect.bisect_left(self.names, name)
+            del self.names[position]
+            self.notify('remove', name, position)
+
+
+# --- REGISTRIES OF THE DB TABLES: (stars, locations) ---
+def get_catalogues(df_loc, df_stars):
+    return Catalogue('STARS', df_stars), Catalogue('LOCATIONS', df_loc)
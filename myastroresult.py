@@ -0,0 +1,126 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- COMPACT CONTAINER OF COMPUTED POSITIONS ---
+
+import numpy as np
+import pandas as pd
+import myastrotime as myat
+
+# Quantities stored for each object (same order as the output columns)
+RESULT_QUANTITIES = ['azimuth_deg', 'altitude_deg', 'ha', 'declination_deg']
+
+
+# --- POSITIONS ON A (LOCATION X TIME) GRID: ONE PREALLOCATED FLOAT32 BLOCK (OBJECT, QUANTITY, ROW) ---
+# Rows are location-major: the rows of one location are a contiguous slice, so per-location data are views.
+# Day and location labels are integer codes into small label arrays; times are UTC instants (int64 ns).
+# The get_coords DataFrame layout is produced on demand by to_frame.
+class CoordsResult:
+
+    # Per-location arrays (see myastrotime.get_time_grid_ns): UTC instants, local wall times, day numbers
+    def __init__(self, loc_names, loc_tzs, t_ns, wall_ns, n_days, objects=(), dtype=np.float32):
+
+        # Location slices and labels (repeated names share the same code)
+        n_rows = [len(t) for t in t_ns]
+        self.loc_start = np.concatenate([[0], np.cumsum(n_rows)]).astype(np.int64)
+        self.loc_tzs = list(loc_tzs)
+        loc_codes, self.loc_labels = pd.factorize(np.asarray(loc_names, dtype=object))
+        self.loc_code = np.repeat(loc_codes.astype(np.int32), n_rows)
+        self.n_loc = np.repeat(np.arange(1, len(n_rows) + 1, dtype=np.int32), n_rows)
+
+        # Time columns: UTC instants, local day number and local time of day
+        n = int(self.loc_start[-1])
+        self.t_ns = np.concatenate(t_ns).astype(np.int64) if n > 0 else np.zeros(0, np.int64)
+        wall_ns = np.concatenate(wall_ns).astype(np.int64) if n > 0 else np.zeros(0, np.int64)
+        self.n_day = np.concatenate(n_days).astype(np.int32) if n > 0 else np.zeros(0, np.int32)
+        self.hour_current = myat.get_hour(wall_ns).astype(np.float32)
+        day_code, self.day_labels = myat.get_day_codes(wall_ns)
+        self.day_code = day_code.astype(np.int32)
+
+        # Object block, filled by the engines (NaN until set)
+        self.objects = list(objects)
+        self.data = np.full((len(self.objects), len(RESULT_QUANTITIES), n), np.nan, dtype=dtype)
+
+    # From tz-aware local time stamps (one DatetimeIndex per location)
+    @classmethod
+    def from_local_times(cls, loc_names, t_locals, n_days, objects=(), dtype=np.float32):
+        t_ns = [t.tz_convert('UTC').tz_localize(None).as_unit('ns').asi8 for t in t_locals]
+        wall_ns = [t.tz_localize(None).as_unit('ns').asi8 for t in t_locals]
+        return cls(loc_names, [t.tz for t in t_locals], t_ns, wall_ns, n_days, objects, dtype)
+
+    def __len__(self):
+        return len(self.t_ns)
+
+    def loc_rows(self, nl):
+        return slice(self.loc_start[nl], self.loc_start[nl + 1])
+
+    # Fill one object (all rows or a location slice)
+    def set_object(self, sel_obj, az, alt, ha, dec, rows=slice(None)):
+        block = self.data[self.objects.index(sel_obj)]
+        for nq, values in enumerate([az, alt, ha, dec]):
+            block[nq, rows] = values
+
+    # Objects not computed (e.g. bodies not found) are removed from the output
+    def drop_objects(self, objs):
+        keep = [no for no, obj in enumerate(self.objects) if obj not in objs]
+        self.objects = [self.objects[no] for no in keep]
+        self.data = self.data[keep]
+
+    # (quantity, row) view of one object, optionally restricted to one location
+    def object_view(self, sel_obj, nl=None):
+        block = self.data[self.objects.index(sel_obj)]
+        return block if nl is None else block[:, self.loc_rows(nl)]
+
+    @property
+    def object_column_names(self):
+        return [f'{obj}_{q}' for obj in self.objects for q in RESULT_QUANTITIES]
+
+    # Object columns as a name -> view dict (result cache, process pool transfers)
+    def object_columns(self):
+        flat = self.data.reshape(-1, len(self))
+        return dict(zip(self.object_column_names, flat))
+
+    def set_object_columns(self, columns):
+        for no, obj in enumerate(self.objects):
+            for nq, q in enumerate(RESULT_QUANTITIES):
+                name = f'{obj}_{q}'
+                if name in columns:
+                    self.data[no, nq] = columns[name]
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in [
+            self.t_ns, self.n_day, self.hour_current, self.day_code, self.loc_code, self.n_loc, self.data])
+
+    # Local time stamps (tz-aware if all locations share the time zone, else Timestamp objects as in get_coords)
+    def get_t_current(self):
+        if len({str(myat.get_tz_key(tz)) for tz in self.loc_tzs}) <= 1:
+            return myat.to_local_index(self.t_ns, self.loc_tzs[0] if len(self.loc_tzs) > 0 else 0)
+        t_current = np.empty(len(self), dtype=object)
+        for nl, tz in enumerate(self.loc_tzs):
+            rows = self.loc_rows(nl)
+            t_current[rows] = myat.to_local_index(self.t_ns[rows], tz).astype(object)
+        return t_current
+
+    # --- DATAFRAME WITH THE get_coords LAYOUT (OBJECT COLUMNS ARE VIEWS OF THE FLOAT32 BLOCK) ---
+    def to_frame(self):
+        index = np.concatenate([np.arange(self.loc_start[nl + 1] - self.loc_start[nl])
+                                for nl in range(len(self.loc_tzs))]) if len(self.loc_tzs) > 0 else []
+        df_time = pd.DataFrame({
+            't_current': self.get_t_current(),
+            'n_day': self.n_day,
+            'hour_current': self.hour_current,
+            'day_sel': pd.Categorical.from_codes(self.day_code, categories=self.day_labels),
+            'loc_sel': pd.Categorical.from_codes(self.loc_code, categories=self.loc_labels),
+            'n_loc': self.n_loc
+        }, index=index)
+        df_obj = pd.DataFrame(self.data.reshape(-1, len(self)).T, columns=self.object_column_names,
+                              index=df_time.index, copy=False)
+        return pd.concat([df_time, df_obj], axis=1)
+
+    def __repr__(self):
+        return (f'CoordsResult({len(self)} rows, {len(self.loc_tzs)} locations, {len(self.day_labels)} days, '
+                f'objects={self.objects}, {self.nbytes / 1024**2:.1f} MB)')
@@ -0,0 +1,128 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- TIME GRIDS AS NUMPY ARRAYS (UTC INSTANTS, LOCAL WALL TIMES, JULIAN DATES) ---
+
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from astropy.time import Time
+
+DAY_NS = 86400 * 10**9
+MIN_NS = 60 * 10**9
+PROBE_NS = 15 * MIN_NS # Time zone transitions fall on quarter hours (tz database, since 1900)
+JD_UNIX_EPOCH = 2440587.5
+
+
+# --- TIME ZONE TRANSITION TABLE ---
+# Offsets valid from each UTC instant (int64 ns); the first entry starts at the beginning of time
+def get_tz_key(curr_tz):
+    if isinstance(curr_tz, str):
+        return curr_tz
+    if curr_tz is None or (isinstance(curr_tz, (int, float)) and curr_tz == 0):
+        return 'UTC'
+    offset = curr_tz.utcoffset(None) # Fixed offset (e.g. Local mean time)
+    if offset is not None:
+        return int(offset.total_seconds())
+    return str(curr_tz)
+
+
+@lru_cache(maxsize=256)
+def get_tz_table(tz_key, year_start, year_end):
+    if isinstance(tz_key, int):
+        return np.array([np.iinfo(np.int64).min]), np.array([tz_key * 10**9], dtype=np.int64)
+
+    # Offsets on a quarter-hour UTC grid (one extra day each side), then transitions at every offset change
+    t_probe = np.arange(
+        np.datetime64(f'{year_start - 1}-12-31', 'ns').astype(np.int64),
+        np.datetime64(f'{year_end + 1}-01-02', 'ns').astype(np.int64), PROBE_NS)
+    t_utc = pd.DatetimeIndex(t_probe.view('datetime64[ns]')).tz_localize('UTC')
+    offsets = t_utc.tz_convert(tz_key).tz_localize(None).asi8 - t_utc.as_unit('ns').asi8
+    i_change = np.flatnonzero(np.diff(offsets)) + 1
+    t_trans = np.concatenate([[np.iinfo(np.int64).min], t_probe[i_change]])
+    return t_trans, np.concatenate([offsets[:1], offsets[i_change]])
+
+
+def get_tz_table_for(curr_tz, t_ns):
+    years = np.asarray(t_ns).view('datetime64[ns]').astype('datetime64[Y]').astype(int) + 1970
+    return get_tz_table(get_tz_key(curr_tz), int(years.min()), int(years.max()))
+
+
+# --- UTC <-> LOCAL WALL TIME ---
+def utc_to_wall(t_ns, table):
+    t_trans, offsets = table
+    return t_ns + offsets[np.searchsorted(t_trans, t_ns, side='right') - 1]
+
+
+# Nonexistent wall times (DST gap) are shifted forward to the transition; ambiguous ones take the first occurrence
+def wall_to_utc(wall_ns, table):
+    t_trans, offsets = table
+    wall_start = t_trans.copy()
+    wall_start[1:] += offsets[1:] # Wall time at the start of each period
+    k = np.maximum(np.searchsorted(wall_start, wall_ns, side='right') - 1, 0)
+    t_ns = wall_ns - offsets[k]
+
+    # Ambiguous: the previous period also holds this wall time (earlier instant)
+    k_prev = np.maximum(k - 1, 0)
+    in_prev = (k > 0) & (wall_ns - offsets[k_prev] < t_trans[k])
+    t_ns = np.where(in_prev, wall_ns - offsets[k_prev], t_ns)
+
+    # Nonexistent: wall time beyond the end of its period
+    k_next = np.minimum(k + 1, len(t_trans) - 1)
+    in_gap = (k + 1 < len(t_trans)) & (t_ns >= t_trans[k_next])
+    return np.where(in_gap, t_trans[k_next], t_ns)
+
+
+# --- TIME GRID (MULTIPLE DAYS) ---
+# Each day runs from t_min to t_max (next day if t_max <= t_min) with a fixed step in absolute time
+def get_time_grid_ns(sel_days, t_min, t_max, t_delta, curr_tz):
+    days_ns = np.asarray(sel_days, dtype='datetime64[D]').astype('datetime64[ns]').astype(np.int64)
+    t_min_ns = pd.Timedelta(f'{t_min}:00').value
+    t_max_ns = pd.Timedelta(f'{t_max}:00').value
+    delta_days = 1 if t_min >= t_max else 0
+    step = int(t_delta) * MIN_NS
+
+    # Day limits (wall time -> UTC)
+    wall_lims = np.concatenate([days_ns + t_min_ns, days_ns + delta_days * DAY_NS + t_max_ns])
+    table = get_tz_table_for(curr_tz, wall_lims)
+    t_lims = wall_to_utc(wall_lims, table)
+    t_start, t_end = t_lims[:len(days_ns)], t_lims[len(days_ns):]
+
+    # Samples of all days at once
+    n_samples = np.maximum((t_end - t_start) // step + 1, 0)
+    n_day = np.repeat(np.arange(1, len(days_ns) + 1, dtype=np.int32), n_samples)
+    k = np.arange(n_samples.sum()) - np.repeat(np.cumsum(n_samples) - n_samples, n_samples)
+    t_ns = np.repeat(t_start, n_samples) + k * step
+    return t_ns, utc_to_wall(t_ns, table), n_day
+
+
+# --- DERIVED COLUMNS FROM LOCAL WALL TIMES ---
+def get_hour(wall_ns):
+    return (wall_ns % DAY_NS) // 10**9 / 3600
+
+
+def get_day_codes(wall_ns):
+    day_num, day_code = np.unique(wall_ns // DAY_NS, return_inverse=True)
+    return day_code, day_num.astype('datetime64[D]').astype(str).astype(object)
+
+
+# --- JULIAN DATES (TWO-PART, NO PRECISION LOSS) AND ASTROPY TIME ---
+def get_jd(t_ns):
+    t_ns = np.asarray(t_ns).view(np.int64)
+    days, rem = np.divmod(t_ns, DAY_NS)
+    return days + JD_UNIX_EPOCH, rem / DAY_NS
+
+
+def get_time_utc(t_ns):
+    jd1, jd2 = get_jd(t_ns)
+    return Time(jd1, jd2, format='jd', scale='utc')
+
+
+# Local time stamps as a tz-aware index (pandas time zone conversion, no Python datetimes)
+def to_local_index(t_ns, curr_tz):
+    tz_key = get_tz_key(curr_tz)
+    tz = curr_tz if isinstance(tz_key, int) else tz_key
+    return pd.DatetimeIndex(np.asarray(t_ns).view('datetime64[ns]')).tz_localize('UTC').tz_convert(tz)
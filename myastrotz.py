@@ -0,0 +1,81 @@
+# MIT License
+# Copyright (c) 2025 Stefano Pantaleoni
+#
+# This file is part of the Astrotracker project.
+# See the LICENSE.txt file in the project root for full license information.
+
+# --- TIME ZONE SERVICE (PROCESS-WIDE): ONE TimezoneFinder, MEMOISED LOOKUPS, BATCH RESOLUTION ---
+# Lookups are memoised on lat / lon quantised to TZ_QUANTUM degrees (about 10 m): a batch resolves each distinct
+# cell once. Fixed UTC is the offset without DST (Jan 1st in the Northern Hemisphere, Jul 1st in the Southern one).
+# Cells without a time zone (TimezoneFinder returns None, e.g. open sea in older versions) get the nautical zone.
+
+from datetime import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+import numpy as np
+
+TZ_QUANTUM = 1e-4 # deg
+
+
+# --- TIME ZONE POLYGONS (LOADED ONCE) ---
+@lru_cache(maxsize=1)
+def get_finder():
+    from timezonefinder import TimezoneFinder
+    return TimezoneFinder(in_memory=True)
+
+
+def quantize(lat, lon):
+    return int(round(lat / TZ_QUANTUM)), int(round(lon / TZ_QUANTUM))
+
+
+# Nautical time zone: 15 deg wide, centred on multiples of 15 deg (Etc/GMT sign is reversed: east is Etc/GMT-N)
+def get_nautical_timezone(lon):
+    n_hours = int(np.floor(((lon + 180) % 360 - 180) / 15 + 0.5))
+    return f'Etc/GMT{-n_hours:+d}' if n_hours != 0 else 'Etc/GMT'
+
+
+@lru_cache(maxsize=65536)
+def get_cell_timezone(q_lat, q_lon):
+    tz_name = get_finder().timezone_at(lat=q_lat * TZ_QUANTUM, lng=q_lon * TZ_QUANTUM)
+    return tz_name or get_nautical_timezone(q_lon * TZ_QUANTUM)
+
+
+def timezone_at(lat, lon):
+    return get_cell_timezone(*quantize(lat, lon))
+
+
+# --- UTC OFFSET WITHOUT DST (HOURS) ---
+@lru_cache(maxsize=4096)
+def get_fixed_utc_of(tz_name, southern, year):
+    return ZoneInfo(tz_name).utcoffset(datetime(year, 7 if southern else 1, 1)).total_seconds() / 3600
+
+
+def get_fixed_utc(tz_name, lat, year=None):
+    return get_fixed_utc_of(tz_name, bool(lat < 0), year or datetime.now().year)
+
+
+# --- SINGLE LOCATION: TIME ZONE (GIVEN OR LOOKED UP), FIXED UTC, LOCAL UTC ---
+def get_location_tz(lat, lon, tz_name=None, year=None):
+    tz_name = tz_name or timezone_at(lat, lon)
+    return tz_name, get_fixed_utc(tz_name, lat, year), lon / 15
+
+
+# --- BATCH: ARRAYS OF LAT / LON -> TIME ZONE NAMES, FIXED UTC, LOCAL UTC ---
+# Known time zones can be given (tz_names, None where unknown): only the others are looked up
+def resolve_timezones(lats, lons, year=None, tz_names=None):
+    lats, lons = np.asarray(lats, dtype=float), np.asarray(lons, dtype=float)
+    year = year or datetime.now().year
+    tz_names = np.array(tz_names if tz_names is not None else [None] * len(lats), dtype=object)
+
+    # Time zones of the distinct cells
+    unknown = np.flatnonzero([tz_name is None for tz_name in tz_names])
+    q = np.rint(np.column_stack([lats[unknown], lons[unknown]]) / TZ_QUANTUM).astype(np.int64)
+    cells, inv = np.unique(q, axis=0, return_inverse=True)
+    cell_tz = np.array([get_cell_timezone(q_lat, q_lon) for q_lat, q_lon in cells.tolist()], dtype=object)
+    tz_names[unknown] = cell_tz[inv.ravel()]
+
+    # Fixed UTC (cached per time zone and hemisphere)
+    southern = lats < 0
+    fixed_utc = np.array([get_fixed_utc_of(tz, bool(s), year) for tz, s in
+                          zip(tz_names.tolist(), southern.tolist())], dtype=float)
+    return tz_names, fixed_utc, lons / 15